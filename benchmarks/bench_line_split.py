@@ -0,0 +1,106 @@
+# -*- coding: UTF-8 -*-
+"""
+Benchmark: splitting the written text into lines
+================================================
+@ Sync-stream
+
+Author
+------
+Yuchen Jin
+- cainmagi@gmail.com
+- yjin4@uh.edu
+
+Description
+-----------
+Compare the splitting used by the previous versions (`str.splitlines()` with
+`is_end_line_break()`) and `LineSplitter` with different separator policies. The
+writes are generated like `print(a, b, c)`, i.e. several short fragments followed by
+a line break, and some writes containing several lines. The throughput of
+`LineBuffer.write()` with each policy is also measured.
+
+Run this script by
+```bash
+python benchmarks/bench_line_split.py
+```
+"""
+
+import timeit
+import argparse
+
+try:
+    from typing import List
+except ImportError:
+    from builtins import list as List
+
+from syncstream import LineBuffer
+from syncstream.base import LineSplitter, is_end_line_break
+
+
+def make_writes(n_lines: int) -> List[str]:
+    """Generate the pieces written by `print()` and some multi-line writes."""
+    writes: List[str] = list()
+    for i in range(n_lines):
+        if i % 10 == 0:
+            writes.append("block {0}\nline a\nline b\n".format(i))
+        else:
+            writes.extend(("Line:", " ", "progress", " ", str(i), "\n"))
+    return writes
+
+
+def split_legacy(data: str) -> List[str]:
+    """The splitting implemented by the previous versions."""
+    message_lines = data.splitlines()
+    if is_end_line_break(data):
+        message_lines.append("")
+    return message_lines
+
+
+def main(n_lines: int, repeat: int) -> None:
+    """Run the benchmark."""
+    writes = make_writes(n_lines)
+
+    def run_legacy() -> None:
+        for data in writes:
+            split_legacy(data)
+
+    t_cost = min(timeit.repeat(run_legacy, number=1, repeat=repeat))
+    print("split:  legacy     us/write={0:.3f}".format(t_cost / len(writes) * 1e6))
+    for separator in ("universal", "newline"):
+        splitter = LineSplitter(separator)
+
+        def run_splitter() -> None:
+            for data in writes:
+                splitter.split(data)
+
+        t_cost = min(timeit.repeat(run_splitter, number=1, repeat=repeat))
+        print(
+            "split:  {0:<10s} us/write={1:.3f}".format(
+                separator, t_cost / len(writes) * 1e6
+            )
+        )
+
+    for separator in ("universal", "newline"):
+
+        def run_buffer() -> None:
+            tbuf = LineBuffer(1000, separator=separator)
+            for data in writes:
+                tbuf.write(data)
+
+        t_cost = min(timeit.repeat(run_buffer, number=1, repeat=repeat))
+        print(
+            "write:  {0:<10s} us/write={1:.3f}".format(
+                separator, t_cost / len(writes) * 1e6
+            )
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the line splitting.")
+    parser.add_argument(
+        "-n", "--lines", type=int, default=20000, help="The number of printed lines."
+    )
+    parser.add_argument(
+        "-r", "--repeat", type=int, default=5, help="The repeats of measurements."
+    )
+    args = parser.parse_args()
+    main(n_lines=args.lines, repeat=args.repeat)
@@ -0,0 +1,90 @@
+# -*- coding: UTF-8 -*-
+"""
+Benchmark: process-mode transports
+==================================
+@ Sync-stream
+
+Author
+------
+Yuchen Jin
+- cainmagi@gmail.com
+- yjin4@uh.edu
+
+Description
+-----------
+Measure the throughput (lines/sec) of `LineProcBuffer` with different transports.
+Each worker process writes a fixed number of lines through the mirror, and the main
+process waits until all mirrors are closed.
+
+Run this script by
+```bash
+python benchmarks/bench_mproc_transport.py --workers 8 --lines 10000
+```
+"""
+
+import time
+import argparse
+import multiprocessing
+
+try:
+    from typing import Sequence
+except ImportError:
+    from collections.abc import Sequence
+
+from syncstream import LineProcBuffer, LineProcMirror
+
+
+def worker(mirror: LineProcMirror, n_lines: int) -> None:
+    """The worker writing `n_lines` lines to the mirror."""
+    with mirror:
+        for i in range(n_lines):
+            mirror.write("Line: benchmark {0:d}\n".format(i))
+
+
+def bench(transport: str, n_workers: int, n_lines: int) -> float:
+    """Run the benchmark once, and return the throughput (lines/sec)."""
+    pbuf = LineProcBuffer(maxlen=100, transport=transport)  # type: ignore
+    procs = tuple(
+        multiprocessing.Process(target=worker, args=(pbuf.mirror, n_lines))
+        for _ in range(n_workers)
+    )
+    t_start = time.perf_counter()
+    for proc in procs:
+        proc.start()
+    pbuf.wait()
+    t_cost = time.perf_counter() - t_start
+    for proc in procs:
+        proc.join()
+    return n_workers * n_lines / t_cost
+
+
+def main(transports: Sequence[str], n_workers: int, n_lines: int) -> None:
+    """Run the benchmark for each transport."""
+    for transport in transports:
+        speed = bench(transport, n_workers=n_workers, n_lines=n_lines)
+        print(
+            "transport={0:<8s} workers={1:<3d} lines/sec={2:.1f}".format(
+                transport, n_workers, speed
+            )
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark the transports of LineProcBuffer."
+    )
+    parser.add_argument(
+        "-t",
+        "--transports",
+        nargs="+",
+        default=("manager", "pipe"),
+        help="The transports to be tested.",
+    )
+    parser.add_argument(
+        "-w", "--workers", type=int, default=8, help="The number of workers."
+    )
+    parser.add_argument(
+        "-n", "--lines", type=int, default=5000, help="The lines written by a worker."
+    )
+    args = parser.parse_args()
+    main(args.transports, n_workers=args.workers, n_lines=args.lines)
@@ -0,0 +1,87 @@
+# -*- coding: UTF-8 -*-
+"""
+Benchmark: reading the line buffer
+==================================
+@ Sync-stream
+
+Author
+------
+Yuchen Jin
+- cainmagi@gmail.com
+- yjin4@uh.edu
+
+Description
+-----------
+Measure the cost of `LineBuffer.read(size)` with different `maxlen`. The storage is
+filled and wrapped around before the measurement, and the last line is kept
+incomplete, so the reading always needs to skip the oldest stored item.
+
+Run this script by
+```bash
+python benchmarks/bench_read_buffer.py --maxlens 1000 10000 100000 1000000
+```
+"""
+
+import timeit
+import argparse
+
+try:
+    from typing import Sequence
+except ImportError:
+    from collections.abc import Sequence
+
+from syncstream import LineBuffer
+
+
+def make_buffer(maxlen: int) -> LineBuffer:
+    """Create a full buffer whose storage has been wrapped around."""
+    tbuf = LineBuffer(maxlen)
+    n_lines = maxlen + maxlen // 2 + 1
+    tbuf.write("".join("Line: benchmark {0:d}\n".format(i) for i in range(n_lines)))
+    tbuf.write("Line: incomplete")
+    return tbuf
+
+
+def bench(maxlen: int, size: int, repeat: int) -> float:
+    """Run the benchmark once, and return the cost of one call (microseconds)."""
+    tbuf = make_buffer(maxlen)
+    n_number = max(1, repeat)
+    t_cost = min(timeit.repeat(lambda: tbuf.read(size), number=n_number, repeat=3))
+    return t_cost / n_number * 1e6
+
+
+def main(maxlens: Sequence[int], sizes: Sequence[int], repeat: int) -> None:
+    """Run the benchmark for each pair of `maxlen` and `size`."""
+    for maxlen in maxlens:
+        for size in sizes:
+            t_cost = bench(maxlen, size, repeat=repeat)
+            print(
+                "maxlen={0:<8d} size={1:<8d} us/call={2:.2f}".format(
+                    maxlen, size, t_cost
+                )
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark LineBuffer.read().")
+    parser.add_argument(
+        "-m",
+        "--maxlens",
+        type=int,
+        nargs="+",
+        default=(1000, 10000, 100000, 1000000),
+        help="The maxlen values of the buffer.",
+    )
+    parser.add_argument(
+        "-s",
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=(1, 10, 100),
+        help="The numbers of lines read by each call.",
+    )
+    parser.add_argument(
+        "-r", "--repeat", type=int, default=200, help="The calls of each measurement."
+    )
+    args = parser.parse_args()
+    main(args.maxlens, args.sizes, repeat=args.repeat)
@@ -0,0 +1,98 @@
+# -*- coding: UTF-8 -*-
+"""
+Benchmark: receiving the lines from the mirrors
+===============================================
+@ Sync-stream
+
+Author
+------
+Yuchen Jin
+- cainmagi@gmail.com
+- yjin4@uh.edu
+
+Description
+-----------
+Measure the receiver-side cost of storing the lines sent by a mirror. The `"str"`
+message needs to be split again by the main buffer, i.e. `write()`, while the
+`"lines"` message has been split by the mirror, and is stored by `write_lines()`
+directly. Both messages contain the same completed lines and an incomplete line.
+`LineBuffer` is used for skipping the transport, since `LineProcBuffer` shares the
+same storing methods.
+
+Run this script by
+```bash
+python benchmarks/bench_receive_lines.py --lines 1 10 100
+```
+"""
+
+import timeit
+import argparse
+
+try:
+    from typing import Sequence, List
+except ImportError:
+    from collections.abc import Sequence
+    from builtins import list as List
+
+from syncstream import LineBuffer
+
+
+def make_lines(n_lines: int) -> List[str]:
+    """Create the lines of one message."""
+    return ["Line: benchmark message {0:d}".format(i) for i in range(n_lines)]
+
+
+def bench(n_lines: int, mode: str, repeat: int) -> float:
+    """Run the benchmark once, and return the cost of one message (microseconds)."""
+    tbuf = LineBuffer(1000)
+    lines = make_lines(n_lines)
+    rest = "Line: incomplete"
+    if mode == "str":
+        data = "\n".join(lines) + "\n" + rest
+
+        def receive() -> None:
+            tbuf.write(data)
+
+    else:
+
+        def receive() -> None:
+            tbuf.write_lines(lines, rest)
+
+    n_number = max(1, repeat)
+    t_cost = min(timeit.repeat(receive, number=n_number, repeat=3))
+    return t_cost / n_number * 1e6
+
+
+def main(n_lines: Sequence[int], repeat: int) -> None:
+    """Run the benchmark for each number of lines in one message."""
+    for n_line in n_lines:
+        for mode in ("str", "lines"):
+            t_cost = bench(n_line, mode, repeat=repeat)
+            print(
+                "lines={0:<6d} message={1:<6s} us/message={2:.2f}".format(
+                    n_line, mode, t_cost
+                )
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark receiving the lines by LineProcBuffer."
+    )
+    parser.add_argument(
+        "-l",
+        "--lines",
+        type=int,
+        nargs="+",
+        default=(1, 10, 100),
+        help="The numbers of completed lines in one message.",
+    )
+    parser.add_argument(
+        "-r",
+        "--repeat",
+        type=int,
+        default=2000,
+        help="The messages of each measurement.",
+    )
+    args = parser.parse_args()
+    main(args.lines, repeat=args.repeat)
@@ -0,0 +1,84 @@
+# -*- coding: UTF-8 -*-
+"""
+Benchmark: startup of the process-safe buffer
+=============================================
+@ Sync-stream
+
+Author
+------
+Yuchen Jin
+- cainmagi@gmail.com
+- yjin4@uh.edu
+
+Description
+-----------
+Measure the cost of creating `LineProcBuffer` with different transports. The
+transport is created when the mirror is accessed for the first time, so the cost
+of constructing a buffer which is never handed to a mirror is measured separately
+from the cost of constructing the buffer and getting its first mirror.
+
+Run this script by
+```bash
+python benchmarks/bench_startup.py --transports manager pipe shm --repeat 20
+```
+"""
+
+import gc
+import time
+import argparse
+
+try:
+    from typing import Sequence
+except ImportError:
+    from collections.abc import Sequence
+
+from syncstream import LineProcBuffer
+
+
+def bench(transport: str, with_mirror: bool, repeat: int) -> float:
+    """Run the benchmark, and return the cost of one buffer (milliseconds)."""
+    t_total = 0.0
+    for _ in range(max(1, repeat)):
+        t_start = time.perf_counter()
+        pbuf = LineProcBuffer(maxlen=20, transport=transport)
+        if with_mirror:
+            pbuf.mirror
+        t_total += time.perf_counter() - t_start
+        # Release the transport (e.g. the manager server) before the next round.
+        del pbuf
+        gc.collect()
+    return t_total / max(1, repeat) * 1e3
+
+
+def main(transports: Sequence[str], repeat: int) -> None:
+    """Run the benchmark for each transport."""
+    for transport in transports:
+        t_lazy = bench(transport, with_mirror=False, repeat=repeat)
+        t_mirror = bench(transport, with_mirror=True, repeat=repeat)
+        print(
+            "transport={0:<8s} construct: ms={1:.3f} "
+            "construct+mirror: ms={2:.3f}".format(transport, t_lazy, t_mirror)
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark the startup of LineProcBuffer."
+    )
+    parser.add_argument(
+        "-t",
+        "--transports",
+        type=str,
+        nargs="+",
+        default=("manager", "pipe", "shm"),
+        help="The transports to be measured.",
+    )
+    parser.add_argument(
+        "-r",
+        "--repeat",
+        type=int,
+        default=20,
+        help="The number of buffers created for each measurement.",
+    )
+    args = parser.parse_args()
+    main(args.transports, repeat=args.repeat)
@@ -0,0 +1,84 @@
+# -*- coding: UTF-8 -*-
+"""
+Benchmark: writing the line buffer by threads
+=============================================
+@ Sync-stream
+
+Author
+------
+Yuchen Jin
+- cainmagi@gmail.com
+- yjin4@uh.edu
+
+Description
+-----------
+Measure the throughput of `LineBuffer.write()` when many threads print progress
+messages at the same time. Each message is written by several partial writes, like
+`print(a, b, c)`. The shared incomplete line is compared with the `per_thread` mode.
+
+Run this script by
+```bash
+python benchmarks/bench_thread_write.py --threads 1 8 32
+```
+"""
+
+import time
+import argparse
+import threading
+
+try:
+    from typing import Sequence
+except ImportError:
+    from collections.abc import Sequence
+
+from syncstream import LineBuffer
+
+
+def bench(n_threads: int, n_lines: int, per_thread: bool) -> float:
+    """Run the benchmark once, and return the throughput (lines per second)."""
+    tbuf = LineBuffer(1000, per_thread=per_thread)
+    barrier = threading.Barrier(n_threads + 1)
+
+    def writer(idx: int) -> None:
+        barrier.wait()
+        for i in range(n_lines):
+            print("thread", idx, "progress", i, file=tbuf)
+
+    thds = [threading.Thread(target=writer, args=(idx,)) for idx in range(n_threads)]
+    for thd in thds:
+        thd.start()
+    barrier.wait()
+    t_start = time.perf_counter()
+    for thd in thds:
+        thd.join()
+    t_cost = time.perf_counter() - t_start
+    return n_threads * n_lines / t_cost
+
+
+def main(threads: Sequence[int], n_lines: int) -> None:
+    """Run the benchmark for each number of threads."""
+    for n_threads in threads:
+        for per_thread in (False, True):
+            speed = bench(n_threads, n_lines, per_thread=per_thread)
+            print(
+                "threads={0:<4d} per_thread={1!s:<6} lines/s={2:.0f}".format(
+                    n_threads, per_thread, speed
+                )
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark threaded writing.")
+    parser.add_argument(
+        "-t",
+        "--threads",
+        type=int,
+        nargs="+",
+        default=(1, 8, 32),
+        help="The numbers of writing threads.",
+    )
+    parser.add_argument(
+        "-n", "--lines", type=int, default=5000, help="The lines written by a thread."
+    )
+    args = parser.parse_args()
+    main(args.threads, n_lines=args.lines)
@@ -0,0 +1,102 @@
+# -*- coding: UTF-8 -*-
+"""
+Benchmark: transports of the process-safe buffer
+================================================
+@ Sync-stream
+
+Author
+------
+Yuchen Jin
+- cainmagi@gmail.com
+- yjin4@uh.edu
+
+Description
+-----------
+Measure the throughput of `LineProcBuffer` with different transports. Each
+sub-process writes many lines by its mirror, and the main process receives them
+until all mirrors are closed. The cost of starting the sub-processes is not
+included.
+
+Run this script by
+```bash
+python benchmarks/bench_transport.py --transports manager pipe shm --lines 20000
+```
+"""
+
+import time
+import argparse
+import multiprocessing
+import multiprocessing.synchronize
+
+try:
+    from typing import Sequence
+except ImportError:
+    from collections.abc import Sequence
+
+from syncstream import LineProcBuffer, LineProcMirror
+
+
+def worker(
+    mirror: LineProcMirror, n_lines: int, start: multiprocessing.synchronize.Event
+) -> None:
+    """Write `n_lines` lines by the mirror."""
+    start.wait()
+    with mirror:
+        for i in range(n_lines):
+            mirror.write("Line: benchmark message {0:d}\n".format(i))
+
+
+def bench(transport: str, n_procs: int, n_lines: int) -> float:
+    """Run the benchmark once, and return the throughput (lines per second)."""
+    pbuf = LineProcBuffer(maxlen=1000, transport=transport)
+    start = multiprocessing.Event()
+    procs = tuple(
+        multiprocessing.Process(target=worker, args=(pbuf.mirror, n_lines, start))
+        for _ in range(n_procs)
+    )
+    for proc in procs:
+        proc.start()
+    t_start = time.perf_counter()
+    start.set()
+    pbuf.wait()
+    t_cost = time.perf_counter() - t_start
+    for proc in procs:
+        proc.join()
+    return n_procs * n_lines / t_cost
+
+
+def main(transports: Sequence[str], n_procs: int, n_lines: int) -> None:
+    """Run the benchmark for each transport."""
+    for transport in transports:
+        lines_per_sec = bench(transport, n_procs=n_procs, n_lines=n_lines)
+        print(
+            "transport={0:<8s} procs={1:<3d} lines/s={2:.0f}".format(
+                transport, n_procs, lines_per_sec
+            )
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark the transports of LineProcBuffer."
+    )
+    parser.add_argument(
+        "-t",
+        "--transports",
+        type=str,
+        nargs="+",
+        default=("manager", "pipe", "shm"),
+        help="The transports to be measured.",
+    )
+    parser.add_argument(
+        "-p", "--procs", type=int, default=4, help="The number of sub-processes."
+    )
+    parser.add_argument(
+        "-l",
+        "--lines",
+        type=int,
+        default=20000,
+        help="The number of lines written by each sub-process.",
+    )
+    args = parser.parse_args()
+    main(args.transports, n_procs=args.procs, n_lines=args.lines)
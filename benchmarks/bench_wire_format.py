@@ -0,0 +1,105 @@
+# -*- coding: UTF-8 -*-
+"""
+Benchmark: wire format of the process-safe messages
+===================================================
+@ Sync-stream
+
+Author
+------
+Yuchen Jin
+- cainmagi@gmail.com
+- yjin4@uh.edu
+
+Description
+-----------
+Measure the cost of encoding and decoding one message sent from `LineProcMirror` to
+`LineProcBuffer`. The compact frames (a type tag, a length, and a UTF-8 payload)
+are compared with pickling the message dicts used by the previous versions.
+
+Run this script by
+```bash
+python benchmarks/bench_wire_format.py --lines 1 10 100
+```
+"""
+
+import pickle
+import timeit
+import argparse
+
+try:
+    from typing import Sequence, Callable
+except ImportError:
+    from collections.abc import Sequence, Callable
+
+from syncstream.base import GroupedMessage
+from syncstream.mproc import _encode_message, _decode_message
+
+
+def make_message(kind: str, n_lines: int):
+    """Create the type and the data of a message."""
+    lines = ["Line: benchmark message {0:d}".format(i) for i in range(n_lines)]
+    if kind == "str":
+        return "str", "\n".join(lines) + "\n"
+    elif kind == "lines":
+        return "lines", (lines, "")
+    return "error", GroupedMessage(lines)
+
+
+def bench_one(func: Callable[[], None], repeat: int) -> float:
+    """Measure the cost of one call (microseconds)."""
+    n_number = max(1, repeat)
+    t_cost = min(timeit.repeat(func, number=n_number, repeat=3))
+    return t_cost / n_number * 1e6
+
+
+def main(n_lines: Sequence[int], repeat: int) -> None:
+    """Run the benchmark for each kind of message and each number of lines."""
+    for kind in ("str", "lines", "error"):
+        for n_line in n_lines:
+            dtype, data = make_message(kind, n_line)
+
+            def run_pickle() -> None:
+                pickle.loads(pickle.dumps({"type": dtype, "data": data}))
+
+            def run_frame() -> None:
+                _decode_message(_encode_message(dtype, data))
+
+            t_pickle = bench_one(run_pickle, repeat=repeat)
+            t_frame = bench_one(run_frame, repeat=repeat)
+            size_pickle = len(pickle.dumps({"type": dtype, "data": data}))
+            size_frame = len(_encode_message(dtype, data))
+            print(
+                "message={0:<6s} lines={1:<5d} "
+                "pickle: us/line={2:.3f} bytes={3:<6d} "
+                "frame: us/line={4:.3f} bytes={5:<6d}".format(
+                    kind,
+                    n_line,
+                    t_pickle / n_line,
+                    size_pickle,
+                    t_frame / n_line,
+                    size_frame,
+                )
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark the wire format of LineProcMirror."
+    )
+    parser.add_argument(
+        "-l",
+        "--lines",
+        type=int,
+        nargs="+",
+        default=(1, 10, 100),
+        help="The numbers of lines in one message.",
+    )
+    parser.add_argument(
+        "-r",
+        "--repeat",
+        type=int,
+        default=20000,
+        help="The calls of each measurement.",
+    )
+    args = parser.parse_args()
+    main(args.lines, repeat=args.repeat)
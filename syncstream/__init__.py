@@ -37,7 +37,7 @@ from . import base  # basic tools
 from .base import GroupedMessage, redirect_stdout, redirect_stderr
 
 from . import mproc  # threading and multiprocessing
-from .mproc import LineBuffer, LineProcBuffer, LineProcMirror
+from .mproc import LineBuffer, LineSubscription, LineProcBuffer, LineProcMirror
 
 if TYPE_CHECKING:
     from . import file  # file-based mode
@@ -84,6 +84,7 @@ __all__ = (
     "redirect_stderr",
     "mproc",
     "LineBuffer",
+    "LineSubscription",
     "LineProcBuffer",
     "LineProcMirror",
     "file",
@@ -15,7 +15,11 @@ Description
 This module contains shared basic tools for different modules.
 """
 
+import io
+import os
+import time
 import types
+import threading
 import traceback
 import collections.abc
 import contextlib
@@ -24,21 +28,29 @@ from typing import Union, Optional, Any, Generic, TypeVar, cast
 
 try:
     from typing import Sequence
-    from typing import Tuple, Type
+    from typing import Tuple, List, Type, Callable
 except ImportError:
-    from collections.abc import Sequence
-    from builtins import tuple as Tuple, type as Type
+    from collections.abc import Sequence, Callable
+    from builtins import tuple as Tuple, list as List, type as Type
 
 from typing_extensions import Literal, Protocol, TypedDict, TypeGuard, Self
 
 
 __all__ = (
     "is_end_line_break",
+    "LineSplitter",
+    "break_long_line",
+    "write_terminal",
+    "write_terminal_lines",
+    "resolve_carriage_returns",
+    "is_blank_stream",
     "SerializedMessage",
     "is_serialized_grouped_message",
     "redirect_stdout",
     "redirect_stderr",
     "GroupedMessage",
+    "get_record_size",
+    "StreamChunker",
 )
 
 
@@ -57,6 +69,230 @@ def is_end_line_break(val_str: str) -> bool:
     return len(res) == 1 and res[0] == ""
 
 
+# The line breaks recognized by `str.splitlines()`.
+_LINE_BREAKS = frozenset("\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029")
+
+
+class LineSplitter:
+    R"""The incremental line splitter shared by the line-based buffers and mirrors.
+
+    The text stream is written piece by piece. This splitter splits each piece into
+    lines, and remembers the state between the pieces. Two separator policies are
+    supported:
+    - `"universal"`: Use all line breaks recognized by `str.splitlines()`, including
+      `\n`, `\r`, `\r\n`, `\v`, `\f`, and some unicode separators.
+    - `"newline"`: Only use `\n`. A `\r` just before `\n` is removed. This policy
+      is faster since the splitting only needs `str.split()`.
+
+    A `\r\n` pair written by two pieces is still regarded as one line break. In the
+    `"universal"` mode, a `\r` at the end of a piece completes the line at once, and a
+    `\n` at the beginning of the next piece is skipped. In the `"newline"` mode, a
+    `\r` at the end of a piece is kept in the incomplete line, and it is removed by
+    `complete_line()` if the next piece starts with `\n`.
+    """
+
+    def __init__(self, separator: Literal["universal", "newline"] = "universal"):
+        """Initialization.
+
+        Arguments
+        ---------
+        separator: `"universal" | "newline"`
+            The separator policy.
+        """
+        if separator not in ("universal", "newline"):
+            raise TypeError(
+                'syncstream: The argument "separator" should be "universal" or '
+                '"newline".'
+            )
+        self.__separator: Literal["universal", "newline"] = separator
+        # Whether the previous piece ends with `\r`.
+        self.__last_cr: bool = False
+        # Whether the first line break of the current piece is a `\r\n` pair
+        # written by two pieces (only used by the `"newline"` mode).
+        self.__split_crlf: bool = False
+
+    @property
+    def separator(self) -> Literal["universal", "newline"]:
+        """The separator policy."""
+        return self.__separator
+
+    def split(self, data: str) -> List[str]:
+        R"""Split a new piece of the text stream.
+
+        Arguments
+        ---------
+        data: `str`
+            The new piece of the text.
+
+        Returns
+        -------
+        #1: `[str]`
+            The split pieces. The last piece is the text after the last line break,
+            which is not completed yet (it may be `""`). All other pieces are
+            completed. Specially, the first piece needs to be joined with the
+            incomplete line of the previous writing by `complete_line()`. If there
+            is no line break, the result only contains one piece.
+        """
+        if not data:
+            self.__split_crlf = False
+            return [""]
+        last_cr = self.__last_cr
+        self.__last_cr = data[-1] == "\r"
+        if self.__separator == "newline":
+            self.__split_crlf = last_cr and data[0] == "\n"
+            pieces = data.split("\n")
+            if len(pieces) > 1 and "\r" in data:
+                for idx in range(len(pieces) - 1):
+                    if pieces[idx].endswith("\r"):
+                        pieces[idx] = pieces[idx][:-1]
+            return pieces
+        if last_cr and data[0] == "\n":
+            data = data[1:]
+            if not data:
+                return [""]
+        pieces = data.splitlines()
+        if data[-1] in _LINE_BREAKS:
+            pieces.append("")
+        return pieces
+
+    def complete_line(self, last_line: str, piece: str) -> str:
+        R"""Complete the incomplete line of the previous writing.
+
+        Arguments
+        ---------
+        last_line: `str`
+            The incomplete line of the previous writing.
+
+        piece: `str`
+            The first piece returned by the last `split()`, when more than one piece
+            is returned.
+
+        Returns
+        -------
+        #1: `str`
+            The completed line. In the `"newline"` mode, if the `\r\n` pair is
+            written by two pieces, the `\r` kept in `last_line` is removed.
+        """
+        if self.__split_crlf and last_line.endswith("\r"):
+            return last_line[:-1] + piece
+        return last_line + piece
+
+    def reset(self) -> None:
+        """Drop the held state."""
+        self.__last_cr = False
+        self.__split_crlf = False
+
+
+def break_long_line(line: str, max_length: int) -> List[str]:
+    """Break a line into pieces whose lengths are not longer than `max_length`.
+
+    Used for limiting the length of the lines without line breaks. The last piece
+    may be shorter than `max_length`.
+
+    Arguments
+    ---------
+    line: `str`
+        The line to be broken. It should not contain line breaks.
+
+    max_length: `int`
+        The maximal length (characters) of each piece.
+
+    Returns
+    -------
+    #1: `[str]`
+        The pieces. If `line` is not longer than `max_length`, return `[line]`.
+    """
+    if len(line) <= max_length:
+        return [line]
+    return [line[idx : idx + max_length] for idx in range(0, len(line), max_length)]
+
+
+def write_terminal(stream: io.StringIO, data: str) -> int:
+    R"""Write a piece of text without `\n` to `stream` with the terminal semantics.
+
+    Like a terminal, `\r` moves the cursor of `stream` to the line start, so the
+    following text overwrites the line in place. This is used for handling the
+    progress bars refreshing the same line.
+
+    Arguments
+    ---------
+    stream: `io.StringIO`
+        The stream storing the incomplete line. Its cursor is used as the cursor of
+        the terminal.
+
+    data: `str`
+        The text to be written. It should not contain `\n`.
+
+    Returns
+    -------
+    #1: `int`
+        The length of `data`.
+    """
+    if "\r" not in data:
+        stream.write(data)
+        return len(data)
+    parts = data.split("\r")
+    stream.write(parts[0])
+    for part in parts[1:]:
+        stream.seek(0, os.SEEK_SET)
+        stream.write(part)
+    return len(data)
+
+
+def write_terminal_lines(stream: io.StringIO, data: str) -> List[str]:
+    R"""Write the text to the incomplete line `stream` with the terminal semantics.
+
+    Different from `str.splitlines()`, only `\n` completes a line, while `\r` moves
+    the cursor to the line start (see `write_terminal()`). Note that `\r\n` is still
+    regarded as one line break.
+
+    Arguments
+    ---------
+    stream: `io.StringIO`
+        The stream storing the incomplete line. After writing, it stores the new
+        incomplete line.
+
+    data: `str`
+        The text to be written.
+
+    Returns
+    -------
+    #1: `[str]`
+        The completed lines. If `data` does not contain `\n`, it is empty.
+    """
+    pieces = data.split("\n")
+    write_terminal(stream, pieces[0])
+    if len(pieces) == 1:
+        return list()
+    lines = [stream.getvalue()]
+    lines.extend(resolve_carriage_returns(piece) for piece in pieces[1:-1])
+    stream.seek(0, os.SEEK_SET)
+    stream.truncate(0)
+    write_terminal(stream, pieces[-1])
+    return lines
+
+
+def is_blank_stream(stream: io.StringIO) -> bool:
+    R"""Check whether the incomplete line `stream` is blank.
+
+    Checking `stream.tell()` is not enough, because the cursor may be moved to the
+    line start by `\r` in the terminal semantics.
+    """
+    return stream.tell() == 0 and stream.getvalue() == ""
+
+
+def resolve_carriage_returns(line: str) -> str:
+    R"""Get the text shown by a terminal after writing `line` (without `\n`).
+
+    For example, `"abcdef\rXY"` is resolved as `"XYcdef"`.
+    """
+    if "\r" not in line:
+        return line
+    stream = io.StringIO()
+    write_terminal(stream, line)
+    return stream.getvalue()
+
+
 class SerializedMessage(
     TypedDict(
         "_SerializedMessage",
@@ -216,3 +452,177 @@ class GroupedMessage:
         new_item.type = jdata["type"]
         new_item.data = tuple(jdata["data"])
         return new_item
+
+
+def get_record_size(val: Union[str, GroupedMessage, Any]) -> int:
+    """Get the size (bytes) of a record when it is encoded by UTF-8.
+
+    This function is used for limiting the total size of the stored records.
+
+    Arguments
+    ---------
+    val: `str | GroupedMessage`
+        The record to be measured. A `GroupedMessage` is measured by its lines joined
+        by line breaks. Other objects are measured by their `str()` results.
+
+    Returns
+    -------
+    #1: `int`
+        The number of bytes.
+    """
+    if isinstance(val, GroupedMessage):
+        data = val.data
+        return sum(get_record_size(line) for line in data) + max(0, len(data) - 1)
+    if not isinstance(val, str):
+        val = str(val)
+    if val.isascii():
+        return len(val)
+    return len(val.encode("utf-8", errors="surrogatepass"))
+
+
+class StreamChunker:
+    """The accumulator of the streaming mode used by the mirrors.
+
+    The written data is not split into lines. Instead, it is accumulated and released
+    as one chunk when any of the following conditions is met:
+    - The accumulated size exceeds `max_bytes`.
+    - The first accumulated write has waited for `max_delay` seconds. The waiting is
+      handled by a background daemon thread, which quits once the data is released.
+    - `flush()` is called.
+
+    The chunks are released by the `send` callback in the order of writing. The
+    callback may be called by the background thread, so it should not acquire any
+    lock held by the thread calling `write()` or `flush()`. If the callback fails in
+    the background thread, the error is raised by the next `write()` or `flush()`.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[str], None],
+        max_bytes: Optional[int] = None,
+        max_delay: Optional[float] = None,
+    ) -> None:
+        """Initialization.
+
+        Arguments
+        ---------
+        send: `(str) -> None`
+            The callback used for releasing a chunk.
+
+        max_bytes: `int | None`
+            The maximal size (bytes, UTF-8 encoded) of the accumulated data. If
+            `None`, the size is not limited.
+
+        max_delay: `float | None`
+            The maximal time (seconds) that the accumulated data waits. If `None`,
+            the data is only released by `max_bytes` or `flush()`.
+        """
+        self.__send: Callable[[str], None] = send
+        self.max_bytes: Optional[int] = (
+            max(1, int(max_bytes)) if max_bytes is not None else None
+        )
+        self.max_delay: Optional[float] = (
+            max(0.0, float(max_delay)) if max_delay is not None else None
+        )
+        self.__parts: List[str] = list()
+        self.__nbytes: int = 0
+        self.__since: float = 0.0
+        self.__cond: threading.Condition = threading.Condition()
+        self.__send_lock: threading.Lock = threading.Lock()
+        self.__worker: Optional[threading.Thread] = None
+        self.__error: Optional[BaseException] = None
+        self.n_chunks: int = 0
+
+    @property
+    def nbytes(self) -> int:
+        """The size (bytes) of the accumulated data."""
+        with self.__cond:
+            return self.__nbytes
+
+    def write(self, data: str) -> int:
+        """Accumulate the data, and release the chunk if `max_bytes` is exceeded.
+
+        Arguments
+        ---------
+        data: `str`
+            The data to be accumulated.
+
+        Returns
+        -------
+        #1: `int`
+            The length of the accumulated data.
+        """
+        self.__raise_error()
+        if not data:
+            return 0
+        with self.__cond:
+            if not self.__parts:
+                self.__since = time.monotonic()
+            self.__parts.append(data)
+            self.__nbytes += get_record_size(data)
+            is_full = self.max_bytes is not None and self.__nbytes >= self.max_bytes
+            if not is_full and self.max_delay is not None and self.__worker is None:
+                self.__worker = threading.Thread(target=self.__run, daemon=True)
+                self.__worker.start()
+        if is_full:
+            self.__release()
+        return len(data)
+
+    def flush(self) -> None:
+        """Release the accumulated data instantly."""
+        self.__raise_error()
+        self.__release()
+
+    def clear(self) -> None:
+        """Discard the accumulated data."""
+        with self.__cond:
+            self.__parts.clear()
+            self.__nbytes = 0
+
+    def __release(self) -> None:
+        """Release the accumulated data as one chunk.
+
+        This method is private and should not be used by users.
+        """
+        with self.__send_lock:
+            with self.__cond:
+                if not self.__parts:
+                    return
+                data = "".join(self.__parts)
+                self.__parts.clear()
+                self.__nbytes = 0
+            self.n_chunks += 1
+            self.__send(data)
+
+    def __run(self) -> None:
+        """The background worker releasing the data after `max_delay`.
+
+        This method is private and should not be used by users.
+        """
+        max_delay = self.max_delay if self.max_delay is not None else 0.0
+        while True:
+            with self.__cond:
+                if not self.__parts:
+                    self.__worker = None
+                    return
+                remain = self.__since + max_delay - time.monotonic()
+                if remain > 0:
+                    self.__cond.wait(remain)
+                    continue
+            try:
+                self.__release()
+            except Exception as err:
+                self.__error = err
+                with self.__cond:
+                    self.__worker = None
+                return
+
+    def __raise_error(self) -> None:
+        """Raise the error met by the background worker.
+
+        This method is private and should not be used by users.
+        """
+        err = self.__error
+        if err is not None:
+            self.__error = None
+            raise err
@@ -12,18 +12,20 @@ Yuchen Jin
 
 Description
 -----------
-This module is based on the file-lock package (fasteners). It uses rotating files to
-record the message items.
+This module is based on the file-lock package (fasteners). It uses a single circular
+segment file to record the message items.
 """
 
+import io
 import os
 import sys
 import glob
+import struct
 import contextlib
 import types
 
 from typing import Union, Optional
-from typing import TextIO
+from typing import TextIO, BinaryIO
 
 try:
     from typing import List, Tuple, Type, Sequence
@@ -36,18 +38,304 @@ from typing_extensions import Literal, Never
 import fasteners
 
 from .base import GroupedMessage
-from .base import is_end_line_break
+from .base import LineSplitter, break_long_line
+from .base import write_terminal, write_terminal_lines, resolve_carriage_returns
 
 
 __all__ = ("LineFileBuffer",)
 
 
+_SEGMENT_MAGIC = b"SSLG"
+_SEGMENT_VERSION = 1
+# magic, version, reserved, maxlen, head, count, data_end, live_bytes
+_SEGMENT_HEADER = struct.Struct("<4sHHIIIQQ")
+# offset, length
+_SEGMENT_SLOT = struct.Struct("<QI")
+# The data region is compacted when the dead bytes exceed both the live bytes and
+# this value.
+_SEGMENT_COMPACT_MIN = 65536
+
+
+class _SegmentLog:
+    """The storage engine of `LineFileBuffer`.
+
+    All records are kept in one segment file. The file starts with a fixed-size header
+    and a preallocated slot table. Each slot stores the offset and the length of one
+    record, and the slots are used as a circular queue (head index and count are
+    stored in the header). The record contents are appended to the data region after
+    the slot table, so appending a record only touches one slot, the header, and the
+    end of the file. The dead data left by the evicted records is compacted when it
+    becomes larger than the live data.
+
+    If `maxbytes` is specified, the oldest records are also evicted until the live
+    data fits the budget. The newest record is always kept.
+
+    This class is private and should not be exposed to users. It does not lock the
+    file, the caller should hold the file lock of `LineFileBuffer`.
+    """
+
+    def __init__(
+        self, file_path: str, maxlen: int, maxbytes: Optional[int] = None
+    ) -> None:
+        """Initialization.
+
+        Arguments
+        ---------
+        file_path: `str`
+            The path of the segment file.
+
+        maxlen: `int`
+            The maximal number of records (i.e. the number of slots).
+
+        maxbytes: `int | None`
+            The maximal total size (bytes) of the live records.
+        """
+        self.file_path: str = file_path
+        self.maxlen: int = maxlen
+        self.maxbytes: Optional[int] = maxbytes
+
+    @staticmethod
+    def __data_base(maxlen: int) -> int:
+        """The offset of the data region."""
+        return _SEGMENT_HEADER.size + maxlen * _SEGMENT_SLOT.size
+
+    @staticmethod
+    def __read_header(fobj: BinaryIO) -> Optional[List[int]]:
+        """Read the header as `[maxlen, head, count, data_end, live_bytes]`.
+
+        Return `None` if the file is empty or not a valid segment file.
+        """
+        fobj.seek(0, os.SEEK_SET)
+        data = fobj.read(_SEGMENT_HEADER.size)
+        if len(data) < _SEGMENT_HEADER.size:
+            return None
+        magic, version, _, maxlen, head, count, data_end, live = _SEGMENT_HEADER.unpack(
+            data
+        )
+        if magic != _SEGMENT_MAGIC or version != _SEGMENT_VERSION or maxlen < 1:
+            return None
+        return [maxlen, head, count, data_end, live]
+
+    @staticmethod
+    def __write_header(fobj: BinaryIO, header: Sequence[int]) -> None:
+        """Write the header `[maxlen, head, count, data_end, live_bytes]`."""
+        fobj.seek(0, os.SEEK_SET)
+        fobj.write(_SEGMENT_HEADER.pack(_SEGMENT_MAGIC, _SEGMENT_VERSION, 0, *header))
+
+    @staticmethod
+    def __read_slots(
+        fobj: BinaryIO, maxlen: int, first: int, n: int
+    ) -> List[Tuple[int, int]]:
+        """Read `n` slots starting from the slot index `first` (circularly)."""
+        res: List[Tuple[int, int]] = list()
+        while n > 0:
+            n_run = min(n, maxlen - first)
+            fobj.seek(_SEGMENT_HEADER.size + first * _SEGMENT_SLOT.size, os.SEEK_SET)
+            res.extend(_SEGMENT_SLOT.iter_unpack(fobj.read(n_run * _SEGMENT_SLOT.size)))
+            n -= n_run
+            first = 0
+        return res
+
+    @staticmethod
+    def __write_slots(
+        fobj: BinaryIO, maxlen: int, first: int, slots: Sequence[Tuple[int, int]]
+    ) -> None:
+        """Write the slots starting from the slot index `first` (circularly)."""
+        pos = 0
+        while pos < len(slots):
+            n_run = min(len(slots) - pos, maxlen - first)
+            fobj.seek(_SEGMENT_HEADER.size + first * _SEGMENT_SLOT.size, os.SEEK_SET)
+            fobj.write(
+                b"".join(_SEGMENT_SLOT.pack(*slot) for slot in slots[pos : pos + n_run])
+            )
+            pos += n_run
+            first = 0
+
+    def __read_records(
+        self, fobj: BinaryIO, header: Sequence[int], size: Optional[int]
+    ) -> List[str]:
+        """Read the last `size` records with a loaded header."""
+        maxlen, head, count, data_end, _ = header
+        n_read = count if size is None else max(0, min(size, count))
+        if n_read <= 0:
+            return list()
+        slots = self.__read_slots(
+            fobj, maxlen, (head + count - n_read) % maxlen, n_read
+        )
+        # The records are always stored in the order of writing, so the requested
+        # records are placed in one continuous block ending at `data_end`.
+        start = slots[0][0]
+        fobj.seek(start, os.SEEK_SET)
+        data = fobj.read(data_end - start)
+        return [
+            data[offset - start : offset - start + length].decode("utf-8")
+            for offset, length in slots
+        ]
+
+    def __fit_bytes(self, lines: Sequence[bytes], budget: int) -> Sequence[bytes]:
+        """Drop the oldest lines until the total size fits `budget`.
+
+        The last line is always kept.
+        """
+        n_bytes = 0
+        for idx in range(len(lines) - 1, -1, -1):
+            n_bytes += len(lines[idx])
+            if n_bytes > budget:
+                return lines[min(idx + 1, len(lines) - 1) :]
+        return lines
+
+    def __reset(self, fobj: BinaryIO, lines: Sequence[bytes]) -> None:
+        """Rewrite the whole file with the given records."""
+        maxlen = self.maxlen
+        lines = lines[-maxlen:]
+        if self.maxbytes is not None:
+            lines = self.__fit_bytes(lines, self.maxbytes)
+        data_base = self.__data_base(maxlen)
+        fobj.seek(0, os.SEEK_SET)
+        fobj.truncate(0)
+        offset = data_base
+        slots: List[Tuple[int, int]] = list()
+        for line in lines:
+            slots.append((offset, len(line)))
+            offset += len(line)
+        self.__write_header(fobj, (maxlen, 0, len(lines), offset, offset - data_base))
+        fobj.write(b"".join(_SEGMENT_SLOT.pack(*slot) for slot in slots))
+        fobj.write(b"\0" * ((maxlen - len(slots)) * _SEGMENT_SLOT.size))
+        fobj.write(b"".join(lines))
+
+    def __compact(self, fobj: BinaryIO, header: List[int]) -> None:
+        """Move the live records to the beginning of the data region."""
+        maxlen, head, count, data_end, live = header
+        data_base = self.__data_base(maxlen)
+        if count > 0:
+            slots = self.__read_slots(fobj, maxlen, head, count)
+            start = slots[0][0]
+            fobj.seek(start, os.SEEK_SET)
+            data = fobj.read(data_end - start)
+            shift = start - data_base
+            self.__write_slots(
+                fobj, maxlen, 0, [(offset - shift, length) for offset, length in slots]
+            )
+            fobj.seek(data_base, os.SEEK_SET)
+            fobj.write(data)
+            live = len(data)
+        else:
+            live = 0
+        header[1] = 0
+        header[3] = data_base + live
+        header[4] = live
+        fobj.truncate(header[3])
+        self.__write_header(fobj, header)
+
+    def __len__(self) -> int:
+        """Number of the stored records."""
+        if not os.path.isfile(self.file_path):
+            return 0
+        with open(self.file_path, "rb") as fobj:
+            header = self.__read_header(fobj)
+        return header[2] if header is not None else 0
+
+    @property
+    def nbytes(self) -> int:
+        """The total size (bytes) of the stored records."""
+        if not os.path.isfile(self.file_path):
+            return 0
+        with open(self.file_path, "rb") as fobj:
+            header = self.__read_header(fobj)
+        return header[4] if header is not None else 0
+
+    def read(self, size: Optional[int] = None) -> List[str]:
+        """Read the last `size` records. If `size` is `None`, read all records."""
+        if not os.path.isfile(self.file_path):
+            return list()
+        with open(self.file_path, "rb") as fobj:
+            header = self.__read_header(fobj)
+            if header is None:
+                return list()
+            return self.__read_records(fobj, header, size)
+
+    def append(self, lines: Sequence[str]) -> None:
+        """Append new records. The oldest records are evicted if the slots are full."""
+        maxlen = self.maxlen
+        maxbytes = self.maxbytes
+        new_lines = [line.encode("utf-8") for line in lines[-maxlen:]]
+        if maxbytes is not None:
+            new_lines = self.__fit_bytes(new_lines, maxbytes)
+        n_new = len(new_lines)
+        if n_new <= 0:
+            return
+        mode = "r+b" if os.path.isfile(self.file_path) else "w+b"
+        with open(self.file_path, mode) as fobj:
+            header = self.__read_header(fobj)
+            if header is None or header[0] != maxlen:
+                # Not initialized, or initialized by a buffer with another maxlen.
+                old_lines = (
+                    [
+                        line.encode("utf-8")
+                        for line in self.__read_records(fobj, header, None)
+                    ]
+                    if header is not None
+                    else list()
+                )
+                self.__reset(fobj, old_lines + new_lines)
+                return
+            _, head, count, data_end, live = header
+            # Evict the oldest records.
+            n_evict = max(0, count + n_new - maxlen)
+            if n_evict > 0:
+                evicted = self.__read_slots(fobj, maxlen, head, n_evict)
+                live -= sum(length for _, length in evicted)
+                head = (head + n_evict) % maxlen
+                count -= n_evict
+            if maxbytes is not None:
+                n_bytes_new = sum(len(line) for line in new_lines)
+                while count > 0 and live + n_bytes_new > maxbytes:
+                    # Read the slots in small chunks, since usually only a few
+                    # records need to be evicted.
+                    n_chunk = min(count, 64)
+                    for _, length in self.__read_slots(fobj, maxlen, head, n_chunk):
+                        if live + n_bytes_new <= maxbytes:
+                            break
+                        live -= length
+                        head = (head + 1) % maxlen
+                        count -= 1
+            truncate = count == 0 and data_end > self.__data_base(maxlen)
+            if count == 0:
+                data_end = self.__data_base(maxlen)
+            # Append the new records.
+            slots: List[Tuple[int, int]] = list()
+            offset = data_end
+            for line in new_lines:
+                slots.append((offset, len(line)))
+                offset += len(line)
+            fobj.seek(data_end, os.SEEK_SET)
+            fobj.write(b"".join(new_lines))
+            if truncate:
+                # All old records are evicted, drop their data after the new ones.
+                fobj.truncate(offset)
+            self.__write_slots(fobj, maxlen, (head + count) % maxlen, slots)
+            live += offset - data_end
+            header = [maxlen, head, count + n_new, offset, live]
+            if offset - self.__data_base(maxlen) - live > max(
+                live, _SEGMENT_COMPACT_MIN
+            ):
+                self.__compact(fobj, header)
+            else:
+                self.__write_header(fobj, header)
+
+    def clear(self) -> None:
+        """Remove the segment file."""
+        if os.path.isfile(self.file_path):
+            os.remove(self.file_path)
+
+
 class LineFileBuffer(contextlib.AbstractContextManager):
     """The file-locked line-based buffer handle.
 
     This buffer provides a rotating item stroage for the text-based stream. The text is
     stored not by length, but by lines. The maximal line number of the storage is
-    limited.
+    limited. All records are stored in one circular segment file, so writing a new
+    line only requires a constant number of file operations.
 
     The file-locked handle could be shared by different processes, but we do not
     recommend to do that. A better way to use this handle is to initialize it in each
@@ -59,28 +347,68 @@ class LineFileBuffer(contextlib.AbstractContextManager):
     """
 
     def __init__(
-        self, file_path: Union[str, os.PathLike], maxlen: int = 20, tmp_id: str = "tmp"
+        self,
+        file_path: Union[str, os.PathLike],
+        maxlen: int = 20,
+        tmp_id: str = "tmp",
+        maxbytes: Optional[int] = None,
+        max_line_length: Optional[int] = None,
+        terminal: bool = False,
+        separator: Literal["universal", "newline"] = "universal",
     ) -> None:
         """Initialization.
 
         Arguments
         ---------
         file_path: `str | os.PathLike`
-            The path of the record files. The file suffix would be automatically set
+            The path of the record file. The file suffix would be automatically set
             as `.log`.
 
         maxlen: `int`
-            The maximal number of records. Each record would be saved as one file.
+            The maximal number of records. All records would be saved in one segment
+            file.
 
         tmp_id: `str`
             The identifier for the temporary file. Each process should holds one
             unique id. A conflict id may cause the written flows from different
             processes to interrupt each other.
+
+        maxbytes: `int | None`
+            The maximal total size (bytes) of the records in the segment file. The
+            oldest records are evicted when the budget is exceeded. If `None`, only
+            `maxlen` is used.
+
+        max_line_length: `int | None`
+            The maximal length (characters) of a line. If a line (including the
+            incomplete line in the temporary file) becomes longer than this value, a
+            line break would be forced, and the event is counted by `n_overflows`. If
+            `None`, the length is not limited.
+
+        terminal: `bool`
+            If `True`, use the terminal semantics: only `\n` completes a line, while
+            `\r` moves the cursor to the line start, so the following text overwrites
+            the incomplete line in place. Suitable for the progress bars.
+
+        separator: `"universal" | "newline"`
+            The separator policy of splitting lines (see `LineSplitter`). Use
+            `"newline"` to only split the lines by `\n`, which is faster.
         """
         if not isinstance(maxlen, int) or maxlen < 1:
             raise TypeError(
                 'syncstream: The argument "maxlen" should be a positive integer.'
             )
+        if maxbytes is not None and (not isinstance(maxbytes, int) or maxbytes < 1):
+            raise TypeError(
+                'syncstream: The argument "maxbytes" should be a positive integer or '
+                "None."
+            )
+        if max_line_length is not None and (
+            not isinstance(max_line_length, int) or max_line_length < 1
+        ):
+            raise TypeError(
+                'syncstream: The argument "max_line_length" should be a positive '
+                "integer or None."
+            )
         file_path = str(file_path).strip()
         if not file_path:
             raise TypeError(
@@ -92,14 +420,12 @@ class LineFileBuffer(contextlib.AbstractContextManager):
                 'syncstream: The argument "tmp_id" should be a non-empty str.'
             )
         self.__file_path = os.path.splitext(file_path)[0]
-        file_dir, file_name = os.path.split(self.__file_path)
+        file_name = os.path.basename(self.__file_path)
         if file_name == "":
             raise TypeError(
                 'syncstream: The argument "file_path" should contain a non-empty file '
                 "name."
             )
-        self.__file_dir = "." if file_dir == "" else file_dir
-        self.__file_name = file_name
         self.__tmp_id = tmp_id
         self.__maxlen = maxlen
         self.__file_lock = fasteners.InterProcessReaderWriterLock(
@@ -108,6 +434,14 @@ class LineFileBuffer(contextlib.AbstractContextManager):
         self.__file_tmp_lock = fasteners.InterProcessReaderWriterLock(
             self.__file_path + "-{0}.lock".format(self.__tmp_id)
         )
+        self.__maxbytes = maxbytes
+        self.max_line_length: Optional[int] = max_line_length
+        self.n_overflows: int = 0
+        self.terminal: bool = bool(terminal)
+        self.__splitter: LineSplitter = LineSplitter(separator)
+        self.__segment = _SegmentLog(
+            self.__file_path + ".log", maxlen=maxlen, maxbytes=maxbytes
+        )
 
         # Is closed
         self.__closed: bool = False
@@ -154,17 +488,25 @@ class LineFileBuffer(contextlib.AbstractContextManager):
         """The maximal length (number of lines) of the buffer."""
         return self.__maxlen
 
+    @property
+    def maxbytes(self) -> Optional[int]:
+        """The maximal total size (bytes) of the buffer."""
+        return self.__maxbytes
+
+    @property
+    def nbytes(self) -> int:
+        """The total size (bytes, UTF-8 encoded) of the stored lines.
+
+        The incomplete last line is not counted.
+        """
+        with self.__file_lock.read_lock():
+            return self.__segment.nbytes
+
     def __len__(self) -> int:
         """Number of lines/items in the buffer."""
         max_len = self.__maxlen
-        val_n_lines = 0  # Current number of log files.
         with self.__file_lock.read_lock():
-            log_files = os.listdir(self.__file_dir)
-            for n in range(self.maxlen):
-                if "{0}-{1:d}.log".format(self.__file_name, n) in log_files:
-                    val_n_lines += 1
-                else:
-                    break
+            val_n_lines = len(self.__segment)
         if self.__get_last_line():
             val_n_lines += 1
         return min(max_len, val_n_lines) if max_len else val_n_lines
@@ -261,11 +603,13 @@ class LineFileBuffer(contextlib.AbstractContextManager):
     def clear(self) -> None:
         """Clear all log files.
 
-        This method would search and remove all log files, including the temporary file.
+        This method would remove the segment file and the temporary file. The
+        per-record log files created by the previous versions would be also removed.
         However, the lock files would not be removed. A typical usage of this method is
         to clear files only in the main process.
         """
         with self.__file_lock.write_lock():
+            self.__segment.clear()
             for fpath_remove in glob.iglob(
                 "{0}-*.log".format(self.__file_path), recursive=False
             ):
@@ -282,8 +626,8 @@ class LineFileBuffer(contextlib.AbstractContextManager):
     def __update_records(self, lines: Sequence[str]) -> None:
         """Update the log files.
 
-        The log files would be updated by this method. Each line would be saved in one
-        log file.
+        The segment file would be updated by this method. The new lines are appended
+        to the segment file, and the oldest lines are evicted if necessary.
 
         This method is private and should not be exposed to users.
 
@@ -294,52 +638,51 @@ class LineFileBuffer(contextlib.AbstractContextManager):
         """
         # Lock the log files in writer mode.
         with self.__file_lock.write_lock():
-            # Check the number of lines, and truncate the lines.
-            n_lines = len(lines)
-            if n_lines <= 0:
-                return
-            if n_lines >= self.maxlen:
-                lines = lines[-self.maxlen :]
-                n_lines = self.maxlen
-            # Check the number of log files.
-            log_files = os.listdir(self.__file_dir)
-            n_current = 0  # Current number of log files.
-            for n in range(self.maxlen):
-                if "{0}-{1:d}.log".format(self.__file_name, n) in log_files:
-                    n_current += 1
-                else:
-                    break
-            # Move the existing files.
-            n_remain = min(n_current, self.maxlen - n_lines)
-            for n in range(n_remain - 1, -1, -1):
-                file_old = "{0}-{1:d}.log".format(self.__file_path, n)
-                file_new = "{0}-{1:d}.log".format(self.__file_path, n + n_lines)
-                if os.path.isfile(file_new):
-                    os.remove(file_new)
-                os.rename(file_old, file_new)
-            # Write new log files in the reversed order.
-            for n in range(n_lines):
-                with open(
-                    "{0}-{1:d}.log".format(self.__file_path, n_lines - 1 - n), "w"
-                ) as fobj:
-                    fobj.write(lines[n])
-
-    def __get_last_line(self) -> str:
-        """Get the last line from the log files.
+            self.__segment.append(lines)
+
+    def __get_last_line(self, raw: bool = False) -> str:
+        R"""Get the last line from the log files.
 
         The last line should be saved in the newest log file (with a number of 0).
 
+        In the terminal mode, the file may contain `\r`, which is resolved unless
+        `raw` is `True`.
+
         This method is private and should not be exposed to users.
         """
         file_name = self.__tmp_file_path
         with self.__file_tmp_lock.read_lock():
             if os.path.isfile(file_name):
-                with open(file_name, "r") as fobj:
+                with open(file_name, "r", newline="") as fobj:
                     last_line = fobj.read()
             else:
                 last_line = ""
+        if not raw and self.terminal:
+            return resolve_carriage_returns(last_line)
         return last_line
 
+    def __replace_last_line(self, line: str) -> None:
+        """Replace the last line in the log file.
+
+        This method is private and should not be exposed to users.
+        """
+        with self.__file_tmp_lock.write_lock():
+            with open(self.__tmp_file_path, "w", newline="") as fobj:
+                fobj.write(line)
+
+    def __get_last_line_size(self) -> int:
+        """Get the size (bytes) of the temporary file storing the last line.
+
+        The size is not smaller than the length (characters) of the last line, so it
+        could be used for checking `max_line_length` without reading the file.
+
+        This method is private and should not be exposed to users.
+        """
+        try:
+            return os.path.getsize(self.__tmp_file_path)
+        except OSError:
+            return 0
+
     def __clean_last_line(self) -> None:
         """Clean the last line file.
 
@@ -411,26 +754,15 @@ class LineFileBuffer(contextlib.AbstractContextManager):
         # Get the last line.
         last_line = self.__get_last_line()
         with self.__file_lock.read_lock():
-            # Check the number of log files.
-            log_files = os.listdir(self.__file_dir)
-            n_current = 0  # Current number of log files.
-            for n in range(self.maxlen - 1 if last_line else self.maxlen):
-                if "{0}-{1:d}.log".format(self.__file_name, n) in log_files:
-                    n_current += 1
-                else:
-                    break
-            # Get the number of reading lines.
+            # The last line occupies one record if it exists.
+            n_max = self.maxlen - 1 if last_line else self.maxlen
             if size is None:
-                n_read = n_current
+                n_read = n_max
             elif last_line:
-                n_read = min(size - 1, n_current)
+                n_read = min(size - 1, n_max)
             else:
-                n_read = min(size, n_current)
-            # Read the log files.
-            res: List[str] = list()
-            for n in range(n_read - 1, -1, -1):
-                with open("{0}-{1:d}.log".format(self.__file_path, n), "r") as fobj:
-                    res.append(fobj.read())
+                n_read = min(size, n_max)
+            res: List[str] = self.__segment.read(n_read)
             if last_line:
                 res.append(last_line)
         return tuple(res)
@@ -440,25 +772,91 @@ class LineFileBuffer(contextlib.AbstractContextManager):
 
         This method is private and should not be used by users.
         """
-        message_lines = data.splitlines()
-        n_lines = len(message_lines)
-        if n_lines == 1 and message_lines[0] == "":
-            self.parse_lines((self.__get_last_line(),))
-            self.__clean_last_line()
-            return 1
-        elif is_end_line_break(data):
-            message_lines.append("")
-            n_lines += 1
-        if n_lines > 1:
-            message_lines[0] = self.__get_last_line() + message_lines[0]
-            last_line = message_lines.pop()
-            self.parse_lines(message_lines)
+        if self.terminal:
+            return self.__write_terminal(data)
+        pieces = self.__splitter.split(data)
+        max_length = self.max_line_length
+        if len(pieces) > 1:
+            pieces[0] = self.__splitter.complete_line(self.__get_last_line(), pieces[0])
+            last_line = pieces.pop()
+            if max_length is not None:
+                pieces = self.__break_lines(pieces, max_length)
+            self.parse_lines(pieces)
             self.__clean_last_line()
-            return self.__write_last_line(last_line)
-        elif n_lines == 1:
-            return self.__write_last_line(message_lines[0])
-        else:
+            if max_length is not None and len(last_line) > max_length:
+                return self.__write_overflow("", last_line, max_length)
+            return self.__write_last_line(last_line) if last_line else 0
+        data = pieces[0]
+        if not data:
             return 0
+        if (
+            max_length is not None
+            and self.__get_last_line_size() + len(data) > max_length
+        ):
+            last_line = self.__get_last_line()
+            if len(last_line) + len(data) > max_length:
+                self.__clean_last_line()
+                return self.__write_overflow(last_line, data, max_length)
+        return self.__write_last_line(data)
+
+    def __write_terminal(self, data: str) -> int:
+        """The `write()` method of the terminal semantics.
+
+        The incomplete line is loaded, updated, and saved. If the cursor is not at
+        the end of the line, the line is saved as `line + "\r" + line[:cursor]`, which
+        restores both the line and the cursor when it is loaded.
+
+        This method is private and should not be used by users.
+        """
+        stream = io.StringIO()
+        write_terminal(stream, self.__get_last_line(raw=True))
+        lines = write_terminal_lines(stream, data)
+        max_length = self.max_line_length
+        if max_length is not None:
+            lines = self.__break_lines(lines, max_length)
+            value = stream.getvalue()
+            if len(value) > max_length:
+                pieces = break_long_line(value, max_length)
+                stream.seek(0, os.SEEK_SET)
+                stream.truncate(0)
+                stream.write(pieces.pop())
+                self.n_overflows += len(pieces)
+                lines.extend(pieces)
+        if lines:
+            self.parse_lines(lines)
+        value = stream.getvalue()
+        cursor = stream.tell()
+        if cursor < len(value):
+            value = "{0}\r{1}".format(value, value[:cursor])
+        self.__replace_last_line(value)
+        return len(data)
+
+    def __break_lines(self, lines: Sequence[str], max_length: int) -> List[str]:
+        """Break the lines longer than `max_length`, and count the forced breaks.
+
+        This method is private and should not be used by users.
+        """
+        res: List[str] = list()
+        for line in lines:
+            if len(line) > max_length:
+                pieces = break_long_line(line, max_length)
+                self.n_overflows += len(pieces) - 1
+                res.extend(pieces)
+            else:
+                res.append(line)
+        return res
+
+    def __write_overflow(self, last_line: str, data: str, max_length: int) -> int:
+        """Write `data` after the cleaned last line `last_line`, and force line
+        breaks because the line becomes longer than `max_length`.
+
+        This method is private and should not be used by users.
+        """
+        pieces = break_long_line(last_line + data, max_length)
+        rest = pieces.pop()
+        self.n_overflows += len(pieces)
+        self.parse_lines(pieces)
+        return self.__write_last_line(rest)
 
     def write(self, data: str) -> int:
         """Write the records.
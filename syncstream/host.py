@@ -19,6 +19,8 @@ and the stream is redirected to a web request handle.
 import os
 import sys
 import io
+import time
+import math
 import weakref
 import json
 import threading
@@ -32,11 +34,13 @@ from typing import Union, Optional, Any
 from typing import TextIO
 
 try:
-    from typing import Tuple, Dict, Type
-    from typing import ChainMap
+    from typing import Tuple, List, Dict, Type, Sequence, Mapping, Iterator
+    from typing import ChainMap, Deque
 except ImportError:
-    from builtins import tuple as Tuple, dict as Dict, type as Type
+    from builtins import tuple as Tuple, list as List, dict as Dict, type as Type
+    from collections.abc import Sequence, Mapping, Iterator
     from collections import ChainMap
+    from collections import deque as Deque
 
 from typing_extensions import Never, Literal, overload
 
@@ -47,7 +51,10 @@ import flask
 from flask import request
 from flask.views import MethodView
 
-from .base import is_end_line_break, GroupedMessage, SerializedMessage
+from .base import LineSplitter, break_long_line
+from .base import write_terminal_lines, is_blank_stream
+from .base import GroupedMessage, SerializedMessage, StreamChunker
+from .base import is_serialized_grouped_message
 from .webtools import SafePoolManager, clean_http_manager
 from .mproc import _LineBuffer
 
@@ -65,7 +72,23 @@ class LineHostMirror(contextlib.AbstractContextManager):
     """
 
     def __init__(
-        self, address: str, aggressive: bool = False, timeout: Optional[int] = None
+        self,
+        address: str,
+        aggressive: bool = False,
+        timeout: Optional[int] = None,
+        batch: bool = False,
+        max_lines: int = 64,
+        max_bytes: int = 65536,
+        max_delay: float = 0.1,
+        state_ttl: float = 1.0,
+        max_line_length: Optional[int] = None,
+        terminal: bool = False,
+        separator: Literal["universal", "newline"] = "universal",
+        stream_bytes: Optional[int] = None,
+        stream_delay: Optional[float] = None,
+        overflow: Literal["block", "drop-newest", "drop-oldest", "sample"] = "block",
+        overflow_maxlen: int = 256,
+        sample_every: int = 10,
     ) -> None:
         """Initialization
 
@@ -78,11 +101,93 @@ class LineHostMirror(contextlib.AbstractContextManager):
         aggressive: `bool`
             The aggressive mode. If enabled, each call for the `write()` method would
             trigger the service synchronization. Otherwise, the synchronization would
-            be triggered when a new line is written.
+            be triggered when a new line is written. In the aggressive mode, a write
+            not ending with a line break is held until the next write or `flush()`.
+            If the next write only contains line breaks (e.g. the `"\n"` written by
+            `print()`), both writes are sent by one message, and the event is counted
+            by `n_coalesced`.
 
         timeout: `int | None`
             The timeout of the web syncholizing events. If not set, the synchronization
             would block the current process.
+
+        batch: `bool`
+            The batching mode. If enabled, the data is not sent once it is written.
+            Instead, it is put in a local queue, and sent to the main buffer by one
+            request when any of `max_lines`, `max_bytes`, or `max_delay` is reached.
+            Calling `flush()`, `send_eof()`, or `close()` sends the queue instantly.
+
+        max_lines: `int`
+            Only used in the batching mode. The maximal number of queued items
+            before the queue is sent.
+
+        max_bytes: `int`
+            Only used in the batching mode. The maximal number of queued bytes
+            (UTF-8 encoded) before the queue is sent.
+
+        max_delay: `float`
+            Only used in the batching mode. The maximal time (seconds) that the first
+            queued item waits before the queue is sent by a background thread.
+
+        state_ttl: `float`
+            The service states are returned with each POST response and cached by the
+            mirror. Before writing, the cached states are used if they are not older
+            than `state_ttl` seconds. Otherwise, the states are queried by a GET
+            request. Setting `0` makes the mirror query the states for each write.
+
+        max_line_length: `int | None`
+            The maximal length (characters) of the incomplete line kept by this
+            mirror. If the incomplete line becomes longer than this value, a line
+            break would be forced, and the event is counted by `n_overflows`. If
+            `None`, the length is not limited.
+
+        terminal: `bool`
+            If `True`, use the terminal semantics for the incomplete line kept by this
+            mirror: only `\n` completes a line, while `\r` moves the cursor to the
+            line start. Therefore, refreshing a progress bar does not send any
+            message until the line is completed. Not used in the aggressive mode.
+
+        separator: `"universal" | "newline"`
+            The separator policy of splitting lines (see `LineSplitter`). The
+            completed lines are always sent with `\n` as the separator. Not used in
+            the aggressive mode.
+
+        stream_bytes: `int | None`
+            If set, use the streaming mode. The written data is not split into lines
+            by the mirror. Instead, it is accumulated and sent as one message when
+            its size (bytes) exceeds this value, when `stream_delay` is reached, or
+            when `flush()` is called. The streaming mode overrides the aggressive
+            mode, and the main buffer splits the lines.
+
+        stream_delay: `float | None`
+            If set, use the streaming mode (see `stream_bytes`). The accumulated data
+            is sent after waiting for `stream_delay` seconds.
+
+        overflow: `"block" | "drop-newest" | "drop-oldest" | "sample"`
+            The policy used when the main buffer is slower than the writer.
+            - `"block"`: Send the data by the current thread, and wait for the
+              response.
+            - `"drop-newest"`: Drop the new data if the queue has `overflow_maxlen`
+              items.
+            - `"drop-oldest"`: Drop the oldest queued item if the queue has
+              `overflow_maxlen` items.
+            - `"sample"`: Like `"drop-oldest"`, but only keep one of every
+              `sample_every` items written when the queue is full.
+            Except `"block"`, the batching mode is always used, and the queue is only
+            sent by the background thread, so writing the lines never waits for the
+            network. The dropped lines and bytes are counted by `n_dropped` and
+            `n_dropped_bytes`, and reported to the main buffer when the mirror is
+            closed. The EOF, error, and warning signals are always sent in the
+            `"block"` policy.
+
+        overflow_maxlen: `int`
+            The maximal number of the queued items of the `"drop-newest"`,
+            `"drop-oldest"`, and `"sample"` policies. It should be larger than
+            `max_lines`.
+
+        sample_every: `int`
+            Only used by the `"sample"` policy. One of every `sample_every` items
+            written when the queue is full is kept.
         """
         if not isinstance(address, str) or address == "":
             raise TypeError(
@@ -105,8 +210,59 @@ class LineHostMirror(contextlib.AbstractContextManager):
             self.__headers_get,
         )
 
+        # Overflow configs
+        if overflow not in ("block", "drop-newest", "drop-oldest", "sample"):
+            raise TypeError(
+                'syncstream: The argument "overflow" should be "block", '
+                '"drop-newest", "drop-oldest", or "sample".'
+            )
+        self.overflow: Literal["block", "drop-newest", "drop-oldest", "sample"] = (
+            overflow
+        )
+        self.overflow_maxlen: int = max(1, int(overflow_maxlen))
+        self.sample_every: int = max(1, int(sample_every))
+        self.n_dropped: int = 0
+        self.n_dropped_bytes: int = 0
+        self.__n_reported: Tuple[int, int] = (0, 0)
+        self.__n_congested: int = 0
+
+        # Batching configs
+        self.batch: bool = bool(batch) or overflow != "block"
+        self.max_lines: int = max(1, int(max_lines))
+        self.max_bytes: int = max(1, int(max_bytes))
+        self.max_delay: float = max(0.0, float(max_delay))
+        self.__pending: Deque[Union[str, Tuple[List[str], str]]] = collections.deque()
+        self.__pending_bytes: int = 0
+        self.__pending_since: float = 0.0
+        self.__batch_error: Optional[BaseException] = None
+
+        # Cached service states
+        self.state_ttl: float = max(0.0, float(state_ttl))
+        self.__state: Dict[str, Any] = dict()
+        self.__state_time: Optional[float] = None
+
+        # Line length limit
+        self.max_line_length: Optional[int] = (
+            int(max_line_length) if max_line_length is not None else None
+        )
+        self.n_overflows: int = 0
+        self.n_coalesced: int = 0
+        self.__held: Optional[str] = None
+        self.stream_bytes: Optional[int] = (
+            int(stream_bytes) if stream_bytes is not None else None
+        )
+        self.stream_delay: Optional[float] = (
+            float(stream_delay) if stream_delay is not None else None
+        )
+        self.__chunker_: Optional[StreamChunker] = None
+        self.terminal: bool = bool(terminal)
+        self.__splitter: LineSplitter = LineSplitter(separator)
+
         # To be created when the first connection is established.
         self.__buffer_lock_: Optional[threading.RLock] = None
+        self.__batch_cond_: Optional[threading.Condition] = None
+        self.__send_lock_: Optional[threading.Lock] = None
+        self.__flusher: Optional[threading.Thread] = None
         self.__http_: Optional[SafePoolManager] = None
         self.__finalizer: Optional[weakref.finalize] = None
 
@@ -172,6 +328,46 @@ class LineHostMirror(contextlib.AbstractContextManager):
             self.__buffer_lock_ = threading.RLock()
         return self.__buffer_lock_
 
+    @property
+    def streaming(self) -> bool:
+        """Whether the mirror works in the streaming mode."""
+        return self.stream_bytes is not None or self.stream_delay is not None
+
+    @property
+    def __chunker(self) -> StreamChunker:
+        """The accumulator of the streaming mode.
+
+        It is created when the first data is written, so the mirror could be still
+        passed to the sub-processes before writing.
+        """
+        if self.__chunker_ is None:
+            self.__chunker_ = StreamChunker(
+                self.__send_str,
+                max_bytes=self.stream_bytes,
+                max_delay=self.stream_delay,
+            )
+        return self.__chunker_
+
+    @property
+    def __batch_cond(self) -> threading.Condition:
+        """The condition protecting the queue of the batching mode.
+
+        This condition should not be exposed to users.
+        """
+        if self.__batch_cond_ is None:
+            self.__batch_cond_ = threading.Condition(threading.Lock())
+        return self.__batch_cond_
+
+    @property
+    def __send_lock(self) -> threading.Lock:
+        """The lock used for ensuring that the batches are sent in order.
+
+        This lock should not be exposed to users.
+        """
+        if self.__send_lock_ is None:
+            self.__send_lock_ = threading.Lock()
+        return self.__send_lock_
+
     @property
     def closed(self) -> bool:
         """Check whether the buffer has been closed."""
@@ -246,21 +442,28 @@ class LineHostMirror(contextlib.AbstractContextManager):
 
         This method would clear the temporary buffer of the mirror. If the mirror works
         in the `aggresive` mode, the temporary buffer would not be used. In this case,
-        this method would not exert any influences to the mirror.
+        this method would only discard the write held by the mirror. In the streaming
+        mode, the accumulated data is discarded.
 
         This method is thread-safe. Mirrors in different processes would not share the
         temporary buffer.
         """
         with self.__buffer_lock:
+            self.__held = None
+            if self.__chunker_ is not None:
+                self.__chunker_.clear()
             self.__buffer.seek(0, os.SEEK_SET)
             self.__buffer.truncate(0)
 
     def new_line(self, check: bool = True) -> None:
         R"""Manually trigger a new line to the buffer. If the current stream is already
         a new line, do nothing.
+
+        In the aggressive mode, the held write is sent without adding a line break.
         """
         with self.__buffer_lock:
-            if self.__buffer.tell() > 0:
+            self.__release()
+            if not is_blank_stream(self.__buffer):
                 self.__write("\n", check=check)
 
     def send_eof(self) -> None:
@@ -275,89 +478,72 @@ class LineHostMirror(contextlib.AbstractContextManager):
                 return
 
         self.new_line()
-        with self.__http.request(
-            url=self.address,
-            headers=self.headers,
-            method="post",
-            preload_content=False,
-            body=json.dumps({"type": "close"}).encode(),
-        ) as req:
-            if req.status < 400:
-                return
-            else:
-                info = json.load(req)
-                raise ConnectionError(
-                    info.get(
-                        "message",
-                        "syncstream: Meet an unknown error on the service side.",
-                    )
-                )
+        messages = self.__report_dropped()
+        messages.append({"type": "close"})
+        if self.batch:
+            self.__drain(*messages)
+        else:
+            self.__post(messages[0] if len(messages) == 1 else messages)
 
-    def send_error(self, obj_err: BaseException) -> None:
+    def send_error(self, obj_err: BaseException, urgent: bool = False) -> None:
         """Send the error object to the main buffer.
 
         The error object would be captured as an item of the storage in the main buffer.
+
+        Arguments
+        ---------
+        obj_err: `BaseException`
+            The error object to be sent.
+
+        urgent: `bool`
+            Only used in the batching mode. If `True`, the error would be sent
+            instantly, before the lines still in the queue. Otherwise, the queue is
+            sent first.
         """
         with self.__buffer_lock:
             if self.__buffer.closed:
                 return
 
         self.new_line(check=False if isinstance(obj_err, StopIteration) else True)
-        with self.__http.request(
-            url=self.address,
-            headers=self.headers,
-            method="post",
-            preload_content=False,
-            body=json.dumps(
-                {"type": "error", "data": GroupedMessage(obj_err).serialize()}
-            ).encode(),
-        ) as req:
-            if req.status < 400:
-                return
-            else:
-                info = json.load(req)
-                raise ConnectionError(
-                    info.get(
-                        "message",
-                        "syncstream: Meet an unknown error on the service side.",
-                    )
-                )
+        messages = self.__report_dropped()
+        messages.append({"type": "error", "data": GroupedMessage(obj_err).serialize()})
+        if self.batch and not urgent:
+            self.__drain(*messages)
+        else:
+            self.__post(messages[0] if len(messages) == 1 else messages)
 
-    def send_warning(self, obj_warn: Warning) -> None:
+    def send_warning(self, obj_warn: Warning, urgent: bool = False) -> None:
         """Send the warning object to the main buffer.
 
         The warning object would be captured as an item of the storage in the main buffer.
+
+        Arguments
+        ---------
+        obj_warn: `Warning`
+            The warning object to be sent.
+
+        urgent: `bool`
+            Only used in the batching mode. If `True`, the warning would be sent
+            instantly, before the lines still in the queue. Otherwise, the queue is
+            sent first.
         """
         with self.__buffer_lock:
             if self.__buffer.closed:
                 return
 
         self.new_line()
-        with self.__http.request(
-            url=self.address,
-            headers=self.headers,
-            method="post",
-            preload_content=False,
-            body=json.dumps(
-                {"type": "warning", "data": GroupedMessage(obj_warn).serialize()}
-            ).encode(),
-        ) as req:
-            if req.status < 400:
-                return
-            else:
-                info = json.load(req)
-                raise ConnectionError(
-                    info.get(
-                        "message",
-                        "syncstream: Meet an unknown error on the service side.",
-                    )
-                )
+        message = {"type": "warning", "data": GroupedMessage(obj_warn).serialize()}
+        if self.batch and not urgent:
+            self.__drain(message)
+        else:
+            self.__post(message)
 
     def send_data(self, data: str) -> None:
         """Send the data to the main buffer.
 
         This method would fire a POST service of the main buffer, and send the str
-        data.
+        data. In the batching mode, the data is put in the queue, and would be sent
+        with other queued data later.
 
         This method is used by other methods implicitly, and should not be used by
         users.
@@ -371,14 +557,68 @@ class LineHostMirror(contextlib.AbstractContextManager):
             if self.__buffer.closed:
                 return
 
+        self.__send_str(data)
+
+    def __send_str(self, data: str) -> None:
+        """Send the str data without checking the buffer state.
+
+        This method does not acquire the lock, so it could be used by the background
+        thread of the streaming mode.
+
+        This method is private and should not be used by users.
+        """
+        if self.batch:
+            self.__enqueue(data)
+            return
+        self.__post({"type": "str", "data": {"value": data}})
+
+    def send_lines(self, lines: Sequence[str], rest: str = "") -> None:
+        """Send the split lines to the main buffer.
+
+        Different from `send_data()`, the lines have been split by the mirror, so the
+        main buffer will store them without splitting them again. In the batching
+        mode, the lines are put in the queue, and would be sent with other queued
+        data later.
+
+        This method is used by other methods implicitly, and should not be used by
+        users.
+
+        Arguments
+        ---------
+        lines: `[str]`
+            The completed lines (without line breaks) to be sent to the main buffer.
+
+        rest: `str`
+            The incomplete line after the completed lines.
+        """
+        with self.__buffer_lock:
+            if self.__buffer.closed:
+                return
+
+        lines = list(lines)
+        if self.batch:
+            self.__enqueue((lines, rest))
+            return
+        self.__post({"type": "lines", "data": {"value": lines, "rest": rest}})
+
+    def __post(self, message: Union[Dict[str, Any], Sequence[Dict[str, Any]]]) -> None:
+        """Send one message, or a sequence of messages (a batch), to the main buffer
+        by a POST request.
+
+        This method is private and should not be used by users.
+        """
         with self.__http.request(
             url=self.address,
             headers=self.headers,
             method="post",
             preload_content=False,
-            body=json.dumps({"type": "str", "data": {"value": data}}).encode(),
+            body=json.dumps(message).encode(),
         ) as req:
             if req.status < 400:
+                res = json.load(req)
+                state = res.get("state", None)
+                if isinstance(state, collections.abc.Mapping):
+                    self.__update_state(state)
                 return
             else:
                 info = json.load(req)
@@ -389,15 +629,257 @@ class LineHostMirror(contextlib.AbstractContextManager):
                     )
                 )
 
-    def check_states(self) -> None:
+    @staticmethod
+    def __measure(item: Union[str, Tuple[List[str], str]]) -> Tuple[int, int]:
+        """Measure the number of lines and the size (bytes, UTF-8 encoded) of one
+        queued item.
+
+        This method is private and should not be used by users.
+        """
+        if isinstance(item, str):
+            return len(item.splitlines()) or 1, len(item.encode("utf-8"))
+        lines, rest = item
+        return (
+            len(lines) + (1 if rest else 0),
+            len(rest.encode("utf-8"))
+            + sum(len(line.encode("utf-8")) + 1 for line in lines),
+        )
+
+    def __is_full(self) -> bool:
+        """Check whether the queue of the batching mode should be sent. Need to be
+        called in the batch condition.
+
+        This method is private and should not be used by users.
+        """
+        return (
+            len(self.__pending) >= self.max_lines
+            or self.__pending_bytes >= self.max_bytes
+        )
+
+    def __enqueue(self, data: Union[str, Tuple[List[str], str]]) -> None:
+        """Put the data in the queue of the batching mode. The data is a str, or a
+        pair of the completed lines and the incomplete line.
+
+        If the queue is full, it is sent by the current thread. Otherwise, ensure that
+        the background flusher is running, so the queue is sent after `max_delay`.
+        If the overflow policy is not `"block"`, the queue is always sent by the
+        background flusher, and the policy is applied when the queue has
+        `overflow_maxlen` items.
+
+        This method is private and should not be used by users.
+        """
+        self.__raise_batch_error()
+        is_blocking = self.overflow == "block"
+        with self.__batch_cond:
+            if not self.__pending:
+                self.__pending_since = time.monotonic()
+            if not is_blocking and not self.__apply_overflow(data):
+                return
+            self.__pending.append(data)
+            self.__pending_bytes += self.__measure(data)[1]
+            is_full = self.__is_full()
+            if (not is_full or not is_blocking) and self.__flusher is None:
+                self.__flusher = threading.Thread(
+                    target=self.__flush_worker, daemon=True
+                )
+                self.__flusher.start()
+            if is_full and not is_blocking:
+                self.__batch_cond.notify()
+        if is_full and is_blocking:
+            self.__drain()
+
+    def __apply_overflow(self, data: Union[str, Tuple[List[str], str]]) -> bool:
+        """Apply the overflow policy before queuing the data. Need to be called in the
+        batch condition.
+
+        Returns
+        -------
+        #1: `bool`
+            `True` if the data should be queued. Otherwise, the data is dropped.
+
+        This method is private and should not be used by users.
+        """
+        pending = self.__pending
+        if len(pending) < self.overflow_maxlen:
+            self.__n_congested = 0
+            return True
+        self.__n_congested += 1
+        if self.overflow == "drop-newest" or (
+            self.overflow == "sample"
+            and (self.__n_congested - 1) % self.sample_every != 0
+        ):
+            self.__drop(data)
+            return False
+        oldest = pending.popleft()
+        self.__pending_bytes -= self.__measure(oldest)[1]
+        self.__drop(oldest)
+        return True
+
+    def __drop(self, data: Union[str, Tuple[List[str], str]]) -> None:
+        """Count a dropped item.
+
+        This method is private and should not be used by users.
+        """
+        n_lines, n_bytes = self.__measure(data)
+        self.n_dropped += n_lines
+        self.n_dropped_bytes += n_bytes
+
+    def __report_dropped(self) -> List[Dict[str, Any]]:
+        """Create the message reporting the lines and bytes dropped since the last
+        report. If nothing is dropped, return an empty list.
+
+        This method is private and should not be used by users.
+        """
+        with self.__batch_cond:
+            n_lines, n_bytes = self.__n_reported
+            n_lines = self.n_dropped - n_lines
+            n_bytes = self.n_dropped_bytes - n_bytes
+            self.__n_reported = (self.n_dropped, self.n_dropped_bytes)
+        if n_lines > 0 or n_bytes > 0:
+            return [{"type": "dropped", "data": {"lines": n_lines, "bytes": n_bytes}}]
+        return []
+
+    def __drain(self, *messages: Dict[str, Any]) -> None:
+        """Send all queued data of the batching mode by one request.
+
+        If `messages` are specified, they are sent after the queued data in the same
+        request.
+
+        This method is private and should not be used by users.
+        """
+        self.__raise_batch_error()
+        with self.__send_lock:
+            with self.__batch_cond:
+                items = tuple(self.__pending)
+                self.__pending.clear()
+                self.__pending_bytes = 0
+            batch = self.__merge_pending(items)
+            batch.extend(messages)
+            if len(batch) == 1:
+                self.__post(batch[0])
+            elif batch:
+                self.__post(batch)
+
+    @staticmethod
+    def __merge_pending(
+        items: Sequence[Union[str, Tuple[List[str], str]]],
+    ) -> List[Dict[str, Any]]:
+        """Merge the queued data into messages.
+
+        The neighboring str data are joined as one `"str"` message, and the
+        neighboring split lines are merged as one `"lines"` message. The order of the
+        data is preserved.
+
+        This method is private and should not be used by users.
+        """
+        batch: List[Dict[str, Any]] = []
+        for item in items:
+            if isinstance(item, str):
+                if batch and batch[-1]["type"] == "str":
+                    batch[-1]["data"]["value"].append(item)
+                else:
+                    batch.append({"type": "str", "data": {"value": [item]}})
+                continue
+            lines, rest = item
+            if not (batch and batch[-1]["type"] == "lines"):
+                batch.append(
+                    {"type": "lines", "data": {"value": list(lines), "rest": rest}}
+                )
+                continue
+            data = batch[-1]["data"]
+            if lines:
+                # The incomplete line is continued by the first new line.
+                data["value"].append(data["rest"] + lines[0])
+                data["value"].extend(lines[1:])
+                data["rest"] = rest
+            else:
+                data["rest"] += rest
+        for message in batch:
+            if message["type"] == "str":
+                message["data"]["value"] = "".join(message["data"]["value"])
+        return batch
+
+    def __flush_worker(self) -> None:
+        """The background flusher of the batching mode.
+
+        The flusher sends the queue when the first queued item has waited for
+        `max_delay` seconds. It quits once the queue is empty, and would be restarted
+        by the next `send_data()`. If the sending fails, the error would be raised
+        by the next `send_data()` or `flush()` in the writer thread.
+
+        This method is private and should not be used by users.
+        """
+        while True:
+            with self.__batch_cond:
+                if not self.__pending:
+                    self.__flusher = None
+                    return
+                remain = self.__pending_since + self.max_delay - time.monotonic()
+                if remain > 0 and not self.__is_full():
+                    self.__batch_cond.wait(remain)
+                    continue
+            try:
+                self.__drain()
+            except Exception as err:
+                self.__batch_error = err
+                with self.__batch_cond:
+                    self.__flusher = None
+                return
+
+    def __raise_batch_error(self) -> None:
+        """Raise the error met by the background flusher, if any.
+
+        This method is private and should not be used by users.
+        """
+        err = self.__batch_error
+        if err is not None:
+            self.__batch_error = None
+            raise err
+
+    def __update_state(self, state: Mapping[str, Any]) -> None:
+        """Update the cached service states.
+
+        This method is private and should not be used by users.
+        """
+        self.__state = dict(self.__state, **state)
+        self.__state_time = time.monotonic()
+
+    def check_states(self, force: bool = False) -> None:
         """Check the current buffer states.
 
         Currently, this method in only used for checking whether the service is closed.
+
+        The states returned by the latest POST request are cached. If the cache is not
+        older than `state_ttl` seconds, it is used without sending any requests.
+
+        Arguments
+        ---------
+        force: `bool`
+            If `True`, always query the states from the service.
         """
         with self.__buffer_lock:
             if self.__buffer.closed:
                 return
 
+        state_time = self.__state_time
+        if (
+            not force
+            and state_time is not None
+            and time.monotonic() - state_time < self.state_ttl
+        ):
+            is_closed = self.__state.get("closed", False)
+        else:
+            is_closed = self.__query_closed()
+        if is_closed is True:
+            raise StopIteration("syncstream: The mirror worker is terminated by users.")
+        else:
+            return
+
+    def __query_closed(self) -> bool:
+        """Query the `closed` state from the service, and update the cache.
+
+        This method is private and should not be used by users.
+        """
         is_closed = False
         with self.__http.request(
             url="{0}-state?{1}".format(
@@ -418,15 +900,28 @@ class LineHostMirror(contextlib.AbstractContextManager):
                         "syncstream: Meet an unknown error on the service side.",
                     )
                 )
-        if is_closed is True:
-            raise StopIteration("syncstream: The mirror worker is terminated by users.")
-        else:
-            return
+        self.__update_state({"closed": is_closed})
+        return is_closed
 
     def flush(self) -> None:
-        """Flush the current written line stream."""
+        """Flush the current written line stream.
+
+        In the aggressive mode, the held write would be sent to the main buffer. In
+        the batching mode, the queued data would be sent to the main buffer. If the
+        overflow policy is not `"block"`, the queued data is sent by the background
+        flusher instead of the current thread.
+        """
         with self.__buffer_lock:
+            self.__release()
             self.__buffer.flush()
+        if self.batch and self.overflow != "block":
+            # Do not wait for the network. Let the flusher send the queue now.
+            with self.__batch_cond:
+                if self.__pending:
+                    self.__pending_since = 0.0
+                    self.__batch_cond.notify()
+        elif self.batch:
+            self.__drain()
 
     def read(self) -> str:
         """Read the current buffer.
@@ -447,25 +942,100 @@ class LineHostMirror(contextlib.AbstractContextManager):
         """
         if check:
             self.check_states()
-        message_lines = data.splitlines()
+        if self.streaming:
+            return self.__chunker.write(data)
         if self.aggressive:
-            self.send_data(data=data)
+            return self.__write_aggressive(data)
+        if self.terminal:
+            return self.__write_terminal(data)
+        pieces = self.__splitter.split(data)
+        if len(pieces) > 1:  # A new line is triggerred.
+            # Send the split lines, so the main buffer does not split them again.
+            pieces[0] = self.__splitter.complete_line(
+                self.__buffer.getvalue(), pieces[0]
+            )
+            self.__buffer.seek(0, os.SEEK_SET)
+            self.__buffer.truncate(0)
+            rest = pieces.pop()
+            if rest.endswith("\r"):
+                # The `\r` may be the first half of `\r\n`, keep it in the mirror.
+                self.__buffer.write(rest)
+                rest = ""
+            self.send_lines(lines=pieces, rest=rest)
             return len(data)
-        n_lines = len(message_lines)
-        if (
-            n_lines > 1
-            or (n_lines == 1 and message_lines[0] == "")
-            or is_end_line_break(data)
-        ):  # A new line is triggerred.
-            res = self.__buffer.write(data)
-            self.send_data(data=self.__buffer.getvalue())
+        data = pieces[0]
+        max_length = self.max_line_length
+        if max_length is not None and self.__buffer.tell() + len(data) > max_length:
+            # Send the completed pieces of the overlong line.
+            pieces = break_long_line(self.__buffer.getvalue() + data, max_length)
+            rest = pieces.pop()
+            self.n_overflows += len(pieces)
+            self.send_lines(lines=pieces)
             self.__buffer.seek(0, os.SEEK_SET)
             self.__buffer.truncate(0)
-            return res
-        elif n_lines == 1:
-            return self.__buffer.write(data)
-        else:
+            self.__buffer.write(rest)
+            return len(data)
+        return self.__buffer.write(data)
+
+    def __write_aggressive(self, data: str) -> int:
+        """The `write()` method of the aggressive mode without lock.
+
+        A write not ending with a line break is held. If the next write only contains
+        line breaks, it is merged with the held write, so `print()` only sends one
+        message.
+
+        This method is private and should not be used by users.
+        """
+        if not data:
             return 0
+        held = self.__held
+        if held is not None:
+            self.__held = None
+            if not data.strip("\r\n"):
+                self.n_coalesced += 1
+                self.send_data(data=held + data)
+                return len(data)
+            self.send_data(data=held)
+        if data[-1] in "\r\n":
+            self.send_data(data=data)
+        else:
+            self.__held = data
+        return len(data)
+
+    def __release(self) -> None:
+        """Send the write held by the aggressive mode, and the data accumulated by
+        the streaming mode without lock.
+
+        This method is private and should not be used by users.
+        """
+        held = self.__held
+        if held is not None:
+            self.__held = None
+            self.send_data(data=held)
+        if self.__chunker_ is not None:
+            self.__chunker_.flush()
+
+    def __write_terminal(self, data: str) -> int:
+        """The `write()` method of the terminal semantics without lock.
+
+        Only the completed lines are sent to the main buffer.
+
+        This method is private and should not be used by users.
+        """
+        lines = write_terminal_lines(self.__buffer, data)
+        max_length = self.max_line_length
+        if max_length is not None:
+            value = self.__buffer.getvalue()
+            if len(value) > max_length:
+                pieces = break_long_line(value, max_length)
+                self.__buffer.seek(0, os.SEEK_SET)
+                self.__buffer.truncate(0)
+                self.__buffer.write(pieces.pop())
+                self.n_overflows += len(pieces)
+                lines.extend(pieces)
+        if lines:
+            self.send_lines(lines=lines)
+        return len(data)
 
     def write(self, data: str) -> int:
         """Write the stream.
@@ -532,6 +1102,11 @@ class LineHostBuffer(_LineBuffer[GroupedMessage]):
         api_route: str = "/sync-stream",
         endpoint: Optional[str] = None,
         maxlen: int = 20,
+        maxbytes: Optional[int] = None,
+        max_line_length: Optional[int] = None,
+        terminal: bool = False,
+        separator: Literal["universal", "newline"] = "universal",
+        max_wait: float = 60.0,
     ) -> None:
         """Initialization.
 
@@ -546,8 +1121,38 @@ class LineHostBuffer(_LineBuffer[GroupedMessage]):
 
         maxlen: `int`
             The maximal number of stored lines.
+
+        maxbytes: `int | None`
+            The maximal total size (bytes) of the stored records. The oldest records
+            are evicted when the budget is exceeded. If `None`, only `maxlen` is used.
+
+        max_line_length: `int | None`
+            The maximal length (characters) of a line. A longer line is broken into
+            several lines. If `None`, the length is not limited.
+
+        terminal: `bool`
+            If `True`, use the terminal semantics: only `\n` completes a line, while
+            `\r` moves the cursor to the line start, so the following text overwrites
+            the incomplete line in place. Suitable for the progress bars. The
+            mirrors should also enable `terminal` to avoid sending every refresh.
+
+        separator: `"universal" | "newline"`
+            The separator policy of splitting lines (see `LineSplitter`). Use
+            `"newline"` to only split the lines by `\n`, which is faster.
+
+        max_wait: `float`
+            The maximal waiting time (seconds) of a long-polling GET request. A
+            larger `wait` requested by the client is clamped to this value, so a
+            request could not occupy a worker of the server for too long.
         """
-        super().__init__(maxlen=maxlen, _data_type=GroupedMessage)
+        super().__init__(
+            maxlen=maxlen,
+            maxbytes=maxbytes,
+            max_line_length=max_line_length,
+            terminal=terminal,
+            separator=separator,
+            _data_type=GroupedMessage,
+        )
         if not isinstance(api_route, str) or api_route == "":
             raise TypeError(
                 'syncstream: The argument "api_route" should be a non-empty str.'
@@ -557,8 +1162,12 @@ class LineHostBuffer(_LineBuffer[GroupedMessage]):
             endpoint = api_route.lstrip("/").replace("/", ".")
         self.endpoint = endpoint
         self.__config_lock = threading.Lock()
+        self.__new_record = threading.Condition(self.__config_lock)
         self.__state_lock = threading.Lock()
         self.__state = dict(closed=False, maxlen=maxlen)
+        self.max_wait: float = max(0.0, float(max_wait))
+        self.n_dropped: int = 0
+        self.n_dropped_bytes: int = 0
 
     def read_serialized(
         self, size: Optional[int] = None
@@ -587,6 +1196,42 @@ class LineHostBuffer(_LineBuffer[GroupedMessage]):
             for val in self.read(size=size)
         )
 
+    def read_serialized_since(
+        self, seq: int
+    ) -> Tuple[Tuple[Union[str, SerializedMessage], ...], int, int]:
+        """Read the records stored since the given cursor (serialized).
+
+        It has the same functionalities of `read_since(...)`. However, all the data
+        returned by this method has been serialized and compatible with jsonifying.
+
+        Arguments
+        ---------
+        seq: `int`
+            The cursor. Use `0` to fetch all records, or use the `next_seq` returned
+            by the previous call.
+
+        Returns
+        -------
+        #1: `[str | SerializedMessage]`
+            A sequence of fetched record items. Results are sorted in the FIFO order.
+
+        #2: `int`
+            The cursor for the next call.
+
+        #3: `int`
+            The number of records after the cursor that have been evicted or cleared
+            before being read.
+        """
+        records, next_seq, dropped = self.read_since(seq)
+        return (
+            tuple(
+                (val if isinstance(val, str) else GroupedMessage.serialize(val))
+                for val in records
+            ),
+            next_seq,
+            dropped,
+        )
+
     def serve(self, app: flask.Flask) -> None:  # noqa: C901
         """Provide the service of the host buffer.
 
@@ -594,6 +1239,10 @@ class LineHostBuffer(_LineBuffer[GroupedMessage]):
         is received, the service would be triggered, and the thread-safe results would
         be saved.
 
+        The GET service supports long-polling (the `wait` argument). A long-polling
+        request occupies one worker of the server while waiting, so it should be used
+        with a threaded server, like the default server of `app.run()`.
+
         Arguments
         ---------
         app: `Flask`
@@ -602,50 +1251,207 @@ class LineHostBuffer(_LineBuffer[GroupedMessage]):
         rself = self
         super_rself = super()
         config_lock = self.__config_lock
+        new_record = self.__new_record
         state_lock = self.__state_lock
         state = self.__state
 
         class BufferPost(MethodView):
             """The buffer service."""
 
+            @staticmethod
+            def parse_message(args: Any) -> Tuple[str, Any]:
+                """Parse and validate one message item.
+
+                This method does not write the buffer, so the whole batch could be
+                validated before any item is written. Raise a `TypeError` or a
+                `ValueError` if the item is not valid.
+
+                Returns
+                -------
+                #1: `str`
+                    The type of the message.
+
+                #2: `Any`
+                    The parsed data of the message, or `None` if nothing needs to
+                    be written.
+                """
+                if not isinstance(args, collections.abc.Mapping):
+                    raise TypeError(
+                        "syncstream: The request data of BufferPost.post needs "
+                        "to be mapping-like, or a sequence of mapping-like items."
+                    )
+                dtype = str(args.get("type", "")).strip()
+                data = args.get("data", None)
+                if dtype == "str":
+                    if isinstance(data, collections.abc.Mapping):
+                        data = data.get("value", None)
+                        if data is not None:
+                            return dtype, str(data)
+                    return dtype, None
+                elif dtype == "lines":
+                    if isinstance(data, collections.abc.Mapping):
+                        lines = data.get("value", None)
+                        if isinstance(lines, collections.abc.Sequence) and not (
+                            isinstance(lines, str)
+                        ):
+                            return dtype, (
+                                [str(line) for line in lines],
+                                str(data.get("rest", "")),
+                            )
+                    return dtype, None
+                elif dtype in ("error", "warning"):
+                    if data is None:
+                        return dtype, None
+                    try:
+                        if not is_serialized_grouped_message(data):
+                            raise TypeError
+                        message = GroupedMessage.deserialize(dict(data))
+                        message.data = tuple(str(line) for line in message.data)
+                    except (TypeError, KeyError) as err:
+                        raise TypeError(
+                            "syncstream: The data of the {0} message is not a "
+                            "serialized GroupedMessage.".format(dtype)
+                        ) from err
+                    return dtype, message
+                elif dtype == "close":
+                    return dtype, None
+                elif dtype == "dropped":
+                    if not isinstance(data, collections.abc.Mapping):
+                        return dtype, None
+                    try:
+                        return dtype, (
+                            int(data.get("lines", 0)),
+                            int(data.get("bytes", 0)),
+                        )
+                    except (TypeError, ValueError) as err:
+                        raise ValueError(
+                            "syncstream: The data of the dropped message is not "
+                            "a valid number."
+                        ) from err
+                raise TypeError("syncstream: The message type could not be recognized.")
+
+            @staticmethod
+            def apply_message(dtype: str, data: Any) -> None:
+                """Write one message item parsed by `parse_message()` in the buffer.
+
+                This method does not acquire the lock. It needs to be called in the
+                config_lock.
+                """
+                if dtype == "close":
+                    rself.new_line()
+                elif data is None:
+                    return
+                elif dtype == "str":
+                    super_rself.write(data)
+                elif dtype == "lines":
+                    super_rself.write_lines(*data)
+                elif dtype in ("error", "warning"):
+                    rself.new_line()
+                    rself.storage.append(data)
+                elif dtype == "dropped":
+                    rself.n_dropped += data[0]
+                    rself.n_dropped_bytes += data[1]
+
             def post(self):
-                """Accept the remote message item, and parse the results in the file."""
+                """Accept the remote message item, and parse the results in the file.
+
+                The request data could be one message item, or an ordered sequence of
+                message items (a batch). All items of a batch are written under one
+                lock acquisition, and the response reports the number of the accepted
+                items. The response also carries the buffer states, so the mirror does
+                not need to query them before each write.
+                """
                 if not request.is_json:
                     raise TypeError(
                         "syncstream: The request type of BufferPost.post needs to be "
                         "json."
                     )
                 args = request.get_json()
-                if not isinstance(args, collections.abc.Mapping):
+                if isinstance(args, collections.abc.Mapping):
+                    messages = (args,)
+                elif isinstance(args, collections.abc.Sequence) and not isinstance(
+                    args, str
+                ):
+                    messages = tuple(args)
+                else:
                     raise TypeError(
                         "syncstream: The request data of BufferPost.post needs to be "
-                        "mapping-like."
+                        "mapping-like, or a sequence of mapping-like items."
                     )
-                dtype = str(args.get("type", "")).strip()
+                # Validate all items first, so a batch is accepted or rejected as a
+                # whole.
+                parsed = [self.parse_message(item) for item in messages]
                 with config_lock:
-                    if dtype == "str":
-                        data = args.get("data", None)
-                        if isinstance(data, collections.abc.Mapping):
-                            data = data.get("value", None)
-                            if data is not None:
-                                super_rself.write(str(data))
-                    elif dtype in ("error", "warning"):
-                        data = args.get("data", None)
-                        if isinstance(data, collections.abc.Mapping):
-                            rself.new_line()
-                            data = GroupedMessage.deserialize(dict(data))
-                            rself.storage.append(data)
-                    elif dtype == "close":
-                        rself.new_line()
-                    else:
-                        raise TypeError(
-                            "syncstream: The message type could not be recognized."
+                    for dtype, data in parsed:
+                        self.apply_message(dtype, data)
+                    new_record.notify_all()
+                    curlen = len(rself)
+                    nbytes = rself.nbytes
+                    with state_lock:
+                        closed = state.get("closed", False)
+                        maxlen = state.get("maxlen", None)
+                return {
+                    "message": "success",
+                    "count": len(messages),
+                    "state": {
+                        "closed": closed,
+                        "curlen": curlen,
+                        "maxlen": maxlen,
+                        "nbytes": nbytes,
+                    },
+                }, 201
+
+            @staticmethod
+            def get_since(_since: str, _wait: Optional[str]):
+                """Get the message items stored since the cursor `since`.
+
+                If no item is available, and `wait` is specified, wait for at most
+                `wait` seconds until new items are stored. `wait` is clamped to
+                `max_wait` of the buffer.
+                """
+                try:
+                    since = int(_since)
+                except ValueError as err:
+                    raise ValueError(
+                        "syncstream: The request data of BufferPost.get is not a "
+                        "valid number. Given: {0}".format(_since)
+                    ) from err
+                try:
+                    wait = float(_wait) if _wait is not None else 0.0
+                except ValueError as err:
+                    raise ValueError(
+                        "syncstream: The request data of BufferPost.get is not a "
+                        "valid number. Given: {0}".format(_wait)
+                    ) from err
+                if not math.isfinite(wait):
+                    raise ValueError(
+                        "syncstream: The request data of BufferPost.get is not a "
+                        "finite number. Given: {0}".format(_wait)
+                    )
+                wait = min(wait, rself.max_wait)
+                with new_record:
+                    if wait > 0:
+                        new_record.wait_for(
+                            lambda: rself.next_seq != since, timeout=wait
                         )
-                    return {"message": "success"}, 201
+                    data, next_seq, dropped = rself.read_serialized_since(since)
+                return {
+                    "message": "success",
+                    "data": data,
+                    "next": next_seq,
+                    "dropped": dropped,
+                }, 200
 
             def get(self):
-                """Get all message items from the storage."""
+                """Get all message items from the storage.
+
+                If the argument `since` is specified, only get the message items
+                stored since this cursor. See `get_since()`.
+                """
                 args = request.args
+                _since = args.get("since", None)
+                if _since is not None:
+                    return self.get_since(_since, args.get("wait", None))
                 _number = args.get("n", None)
                 if _number is None:
                     number = _number
@@ -682,6 +1488,10 @@ class LineHostBuffer(_LineBuffer[GroupedMessage]):
                 with config_lock:
                     if name == "curlen":
                         res = len(rself)
+                    elif name == "nbytes":
+                        res = rself.nbytes
+                    elif name == "maxbytes":
+                        res = rself.maxbytes
                     else:
                         with state_lock:
                             res = state.get(name, None)
@@ -744,12 +1554,32 @@ class LineHostBuffer(_LineBuffer[GroupedMessage]):
             "`self.mirror.write()` for instead."
         )
 
+    def write_lines(self, lines: Sequence[str], rest: str = "") -> Never:
+        """Write the lines which have been split.
+
+        This method should not be used. For instead, please use `self.mirror.write()`.
+
+        Arguments
+        ---------
+        lines: `[str]`
+            The completed lines without line breaks.
+
+        rest: `str`
+            The incomplete line after the completed lines.
+        """
+        raise NotImplementedError(
+            "syncstream: Should not use this method, use "
+            "`self.mirror.write()` for instead."
+        )
+
     def stop_all_mirrors(self) -> None:
         """Send stop signals to all mirrors.
 
         This operation is used for terminating the mirrors safely. It does not
         guarantee that the processes would be closed instantly. Each time when the new
-        message is written by the mirrors, a check would be triggered.
+        message is written by the mirrors, a check would be triggered. Since the
+        mirrors cache the states returned by their POST requests, a mirror may write
+        one more message, or wait for its `state_ttl`, before noticing the signal.
 
         If users want to use this method, please ensure that the `StopIteration` error
         is catched by the process. The error would not be sent back to the buffer.
@@ -894,6 +1724,28 @@ class LineHostReader(contextlib.ContextDecorator):
         ) as _http:
             return self.__get_states("maxlen", _http)
 
+    @property
+    def nbytes(self) -> int:
+        """Property: Get the total size (bytes) of the records stored in the buffer."""
+        if self.__http_:
+            return self.__get_states("nbytes", self.__http_)
+        with SafePoolManager(
+            retries=urllib3.util.Retry(connect=5, read=2, redirect=5),
+            timeout=urllib3.util.Timeout(total=self.__timeout),
+        ) as _http:
+            return self.__get_states("nbytes", _http)
+
+    @property
+    def maxbytes(self) -> Optional[int]:
+        """Property: Get the maximal total size (bytes) of the buffer."""
+        if self.__http_:
+            return self.__get_states("maxbytes", self.__http_)
+        with SafePoolManager(
+            retries=urllib3.util.Retry(connect=5, read=2, redirect=5),
+            timeout=urllib3.util.Timeout(total=self.__timeout),
+        ) as _http:
+            return self.__get_states("maxbytes", _http)
+
     @property
     def closed(self) -> bool:
         """Property: Check whether the service has been closed."""
@@ -1000,6 +1852,85 @@ class LineHostReader(contextlib.ContextDecorator):
         ) as _http:
             return self.__read(size, _http)
 
+    def read_since(
+        self, seq: int, wait: Optional[float] = None
+    ) -> Tuple[Tuple[Union[GroupedMessage, str], ...], int, int]:
+        """Read the records stored since the given cursor.
+
+        Each record stored in the buffer has a monotonically increasing sequence
+        number. This method only fetches the records whose sequence numbers are not
+        smaller than `seq`. The incomplete last line is not fetched.
+
+        Arguments
+        ---------
+        seq: `int`
+            The cursor. Use `0` to fetch all records, or use the `next_seq` returned
+            by the previous call.
+
+        wait: `float | None`
+            If specified, and there is no new record, the service would wait for at
+            most `wait` seconds until new records are stored (long-polling).
+
+        Returns
+        -------
+        #1: `[str | GroupedMessage]`
+            A sequence of fetched record items. Results are sorted in the FIFO order.
+
+        #2: `int`
+            The cursor for the next call.
+
+        #3: `int`
+            The number of records after the cursor that have been evicted or cleared
+            before being read.
+        """
+        if self.__http_:
+            return self.__read_since(seq, wait, self.__http_)
+        with SafePoolManager(
+            retries=urllib3.util.Retry(connect=5, read=2, redirect=5),
+            timeout=urllib3.util.Timeout(total=self.__timeout),
+        ) as _http:
+            return self.__read_since(seq, wait, _http)
+
+    def follow(
+        self, since: int = 0, wait: float = 10.0
+    ) -> Iterator[Union[GroupedMessage, str]]:
+        """Follow the buffer, like `tail -f`.
+
+        This generator yields the records stored since the cursor `since` one by one,
+        and then keeps yielding the new records once they are stored. Each query is a
+        long-polling request waiting for at most `wait` seconds, so an idle buffer
+        does not cause repeated requests. The generator never stops by itself.
+
+        ```python
+        with LineHostReader('http://localhost:5000/sync-stream') as hreader:
+            for record in hreader.follow():
+                print(record)
+        ```
+
+        Note that the records evicted before being fetched are skipped silently. Use
+        `read_since()` if the number of these records is needed.
+
+        Arguments
+        ---------
+        since: `int`
+            The initial cursor. Use `0` to start from the oldest stored record.
+
+        wait: `float`
+            The maximal waiting time (seconds) of each long-polling request.
+        """
+        if not isinstance(wait, (int, float)) or wait <= 0:
+            raise TypeError(
+                'syncstream: The argument "wait" should be a positive number.'
+            )
+        if self.__http_:
+            yield from self.__follow(since, wait, self.__http_)
+            return
+        with SafePoolManager(
+            retries=urllib3.util.Retry(connect=5, read=2, redirect=5),
+            timeout=urllib3.util.Timeout(total=self.__timeout),
+        ) as _http:
+            yield from self.__follow(since, wait, _http)
+
     def __clear(self, http_pool: SafePoolManager) -> bool:
         """Clear the buffer.
 
@@ -1066,9 +1997,14 @@ class LineHostReader(contextlib.ContextDecorator):
 
     @overload
     def __get_states(
-        self, state_name: Literal["curlen"], http_pool: SafePoolManager
+        self, state_name: Literal["curlen", "nbytes"], http_pool: SafePoolManager
     ) -> int: ...
 
+    @overload
+    def __get_states(
+        self, state_name: Literal["maxbytes"], http_pool: SafePoolManager
+    ) -> Optional[int]: ...
+
     def __get_states(self, state_name: str, http_pool: SafePoolManager) -> Any:
         """Check the current buffer states.
 
@@ -1087,6 +2023,15 @@ class LineHostReader(contextlib.ContextDecorator):
 
         maxlen: `int | None`
             The maximal length of the buffer.
+
+        curlen: `int`
+            The current length of the buffer.
+
+        nbytes: `int`
+            The total size (bytes) of the stored records.
+
+        maxbytes: `int | None`
+            The maximal total size (bytes) of the buffer.
         """
         with http_pool.request(
             url="{0}-state?{1}".format(
@@ -1207,3 +2152,79 @@ class LineHostReader(contextlib.ContextDecorator):
                         "syncstream: Meet an unknown error on the service side.",
                     )
                 )
+
+    def __read_since(
+        self, seq: int, wait: Optional[float], http_pool: SafePoolManager
+    ) -> Tuple[Tuple[Union[GroupedMessage, str], ...], int, int]:
+        """Read the records stored since the cursor.
+
+        Arguments
+        ---------
+        seq: `int`
+            The cursor.
+
+        wait: `float | None`
+            The maximal waiting time of the long-polling request.
+
+        http_pool: `SafePoolManager`
+            Need to be provided by the instance.
+        """
+        query = {"since": int(seq)}
+        request_kw: Dict[str, Any] = dict()
+        if wait is not None and wait > 0:
+            query["wait"] = wait
+            if self.__timeout is not None:
+                request_kw["timeout"] = urllib3.util.Timeout(
+                    total=self.__timeout + wait
+                )
+        with http_pool.request(
+            url="{0}?{1}".format(self.address, urlencode(query, encoding="utf-8")),
+            headers=self.headers,
+            method="get",
+            preload_content=False,
+            **request_kw,
+        ) as req:
+            if req.status < 400:
+                res = json.load(req)
+                data = res["data"]
+                return (
+                    tuple(
+                        (
+                            val
+                            if isinstance(val, str)
+                            else GroupedMessage.deserialize(val)
+                        )
+                        for val in data
+                    ),
+                    int(res["next"]),
+                    int(res["dropped"]),
+                )
+            else:
+                info = json.load(req)
+                raise ConnectionError(
+                    info.get(
+                        "message",
+                        "syncstream: Meet an unknown error on the service side.",
+                    )
+                )
+
+    def __follow(
+        self, since: int, wait: float, http_pool: SafePoolManager
+    ) -> Iterator[Union[GroupedMessage, str]]:
+        """Follow the buffer since the cursor.
+
+        Arguments
+        ---------
+        since: `int`
+            The initial cursor.
+
+        wait: `float`
+            The maximal waiting time of each long-polling request.
+
+        http_pool: `SafePoolManager`
+            Need to be provided by the instance.
+        """
+        seq = since
+        while True:
+            records, seq, _ = self.__read_since(seq, wait, http_pool)
+            yield from records
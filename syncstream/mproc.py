@@ -22,37 +22,1188 @@ processes on the same device.
 import os
 import sys
 import io
+import time
+import struct
+import pickle
+import itertools
+import weakref
+import asyncio
 import collections
 import threading
 import queue
 import multiprocessing
+import multiprocessing.process
+import multiprocessing.connection
+import multiprocessing.managers
 import multiprocessing.synchronize
+from multiprocessing.connection import Connection
 import contextlib
 import types
 
+try:
+    from multiprocessing import shared_memory
+except ImportError:  # Fall back to py37
+    shared_memory = None
+
 from typing import Union, Optional, Any, Generic, TypeVar
 from typing import TextIO
 
 try:
-    from typing import Tuple, Type, Sequence, MutableMapping
-    from typing import Deque
+    from typing import Tuple, List, Dict, Set, Type, Sequence, Iterator, Callable
+    from typing import AsyncIterator, Deque
 except ImportError:
-    from builtins import tuple as Tuple, type as Type
-    from collections.abc import Sequence, MutableMapping
+    from builtins import tuple as Tuple, list as List, dict as Dict, set as Set
+    from builtins import type as Type
+    from collections.abc import Sequence, Iterator, Callable, AsyncIterator
     from collections import deque as Deque
 
 from typing_extensions import Literal, Never
 
-from .base import is_end_line_break, GroupedMessage
+from .base import LineSplitter, break_long_line, get_record_size
+from .base import write_terminal_lines, is_blank_stream
+from .base import GroupedMessage, StreamChunker
 
 
-_Queue = Union[queue.Queue, multiprocessing.Queue]
+_Queue = Union[queue.Queue, multiprocessing.Queue, "_PipeQueue", "_ShmQueue"]
 _Lock = Union[threading.Lock, multiprocessing.synchronize.Lock]
+_Event = Union[threading.Event, multiprocessing.synchronize.Event]
 
 T = TypeVar("T")
 
 
-__all__ = ("LineBuffer", "LineProcMirror", "LineProcBuffer")
+__all__ = ("LineBuffer", "LineSubscription", "LineProcMirror", "LineProcBuffer")
+
+
+_FRAME_HEADER = struct.Struct("<cI")
+_FRAME_TAGS = {
+    "str": b"s",
+    "lines": b"l",
+    "error": b"e",
+    "warning": b"w",
+    "close": b"c",
+    "stop": b"t",
+    "wakeup": b"k",
+    "dropped": b"d",
+}
+_FRAME_TYPES = {tag: dtype for dtype, tag in _FRAME_TAGS.items()}
+# The default `q_maxsize` of `LineProcBuffer` used by the non-blocking overflow
+# policies, since an unbounded queue could not tell the mirrors that it is full.
+_OVERFLOW_Q_MAXSIZE = 64
+
+
+def _encode_message(dtype: str, data: Any = None) -> bytes:
+    R"""Encode a message sent from the mirror to the buffer as a compact frame.
+
+    The frame is composed of a one-byte type tag, the length of the payload (4 bytes),
+    and the payload:
+    - `"str"`: The UTF-8 encoded data.
+    - `"lines"`: The UTF-8 encoded lines and the rest joined by `\n`, since the
+      split lines never contain `\n`.
+    - `"error"` or `"warning"`: The `GroupedMessage` reduced to its `type` and `data`,
+      joined by `\n` and UTF-8 encoded. If any item of `data` contains `\n`, the
+      message is pickled.
+    - `"dropped"`: The number of dropped lines and bytes joined by `\n`.
+    - `"close"` with data: The PID of the closed mirror.
+    - Other types without data: No payload.
+    Any other message is pickled.
+
+    This function is private and should not be exposed to users.
+    """
+    if dtype == "str":
+        payload = data.encode("utf-8", errors="surrogatepass")
+    elif dtype == "lines":
+        lines, rest = data
+        text = "\n".join(lines) + "\n" + rest if lines else rest
+        payload = text.encode("utf-8", errors="surrogatepass")
+    elif (
+        dtype in ("error", "warning")
+        and isinstance(data, GroupedMessage)
+        and not any("\n" in line for line in data.data)
+    ):
+        text = "\n".join((data.type,) + tuple(data.data))
+        payload = text.encode("utf-8", errors="surrogatepass")
+    elif dtype == "dropped":
+        payload = "\n".join(str(int(val)) for val in data).encode("ascii")
+    elif dtype == "close" and isinstance(data, int):
+        payload = str(data).encode("ascii")
+    elif dtype in _FRAME_TAGS and data is None:
+        payload = b""
+    else:
+        payload = pickle.dumps((dtype, data), protocol=pickle.HIGHEST_PROTOCOL)
+        return _FRAME_HEADER.pack(b"p", len(payload)) + payload
+    return _FRAME_HEADER.pack(_FRAME_TAGS[dtype], len(payload)) + payload
+
+
+def _decode_message(frame: bytes) -> Tuple[str, Any]:
+    """Decode the frame created by `_encode_message()`.
+
+    This function is private and should not be exposed to users.
+
+    Returns
+    -------
+    #1: `str`
+        The type of the message.
+
+    #2: `Any`
+        The data of the message.
+    """
+    tag, n_payload = _FRAME_HEADER.unpack_from(frame, 0)
+    payload = frame[_FRAME_HEADER.size : _FRAME_HEADER.size + n_payload]
+    if tag == b"s":
+        return "str", payload.decode("utf-8", errors="surrogatepass")
+    elif tag == b"l":
+        lines = payload.decode("utf-8", errors="surrogatepass").split("\n")
+        rest = lines.pop()
+        return "lines", (lines, rest)
+    elif tag in (b"e", b"w"):
+        msg_data = payload.decode("utf-8", errors="surrogatepass").split("\n")
+        message = GroupedMessage(None)
+        message.type = msg_data[0]
+        message.data = tuple(msg_data[1:])
+        return _FRAME_TYPES[tag], message
+    elif tag == b"d":
+        return "dropped", tuple(int(val) for val in payload.split(b"\n"))
+    elif tag == b"c":
+        return "close", (int(payload) if payload else None)
+    elif tag == b"p":
+        return pickle.loads(payload)
+    return _FRAME_TYPES[tag], None
+
+
+class _PipeQueue:
+    """A queue-like channel based on `multiprocessing.Pipe`.
+
+    The items are sent to the reading end directly, without passing through a
+    `multiprocessing.Manager()` server. The writing end is protected by a process-safe
+    lock, so it could be shared by many processes. The reading end is owned by the
+    process creating this object, and would not be pickled.
+
+    If `maxsize` is specified, the number of the items not received yet is limited
+    by a process-safe semaphore, so `put()` could raise `queue.Full` like a size
+    limited queue. Otherwise, `put()` may block when the pipe buffer of the system is
+    full, even if `block` is `False`. The lock of the writing end is only held for
+    sending one item, so waiting for the lock is not regarded as a full queue.
+
+    Like `multiprocessing.Queue`, this object should be only shared with the
+    sub-processes through inheritance, i.e. passed as the arguments of
+    `multiprocessing.Process`.
+
+    This class is private and should not be exposed to users.
+    """
+
+    def __init__(self, maxsize: int = 0) -> None:
+        """Initialization.
+
+        Arguments
+        ---------
+        maxsize: `int`
+            The maximal number of the items not received yet. Use 0 means no
+            limitation.
+        """
+        reader, writer = multiprocessing.Pipe(duplex=False)
+        self.__reader: Optional[Connection] = reader
+        self.__writer: Connection = writer
+        self.__write_lock: _Lock = multiprocessing.Lock()
+        self.__slots: Optional[multiprocessing.synchronize.BoundedSemaphore] = (
+            multiprocessing.BoundedSemaphore(maxsize) if maxsize > 0 else None
+        )
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle the writing end only."""
+        return {
+            "writer": self.__writer,
+            "write_lock": self.__write_lock,
+            "slots": self.__slots,
+        }
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore the writing end in the sub-process."""
+        self.__reader = None
+        self.__writer = state["writer"]
+        self.__write_lock = state["write_lock"]
+        self.__slots = state["slots"]
+
+    @property
+    def waitable(self) -> Optional[Connection]:
+        """The object that could be waited by `multiprocessing.connection.wait()`
+        until an item is available. `None` in the sub-processes."""
+        return self.__reader
+
+    def put(
+        self, obj: bytes, block: bool = True, timeout: Optional[float] = None
+    ) -> None:
+        """Send an item (bytes) to the reading end.
+
+        Raise `queue.Full` if the channel is not available before the timeout.
+        """
+        deadline = None if timeout is None or not block else time.monotonic() + timeout
+        slots = self.__slots
+        if slots is not None and not slots.acquire(block, timeout):
+            raise queue.Full
+        # Only wait for the other writers, even if `block` is `False`.
+        if deadline is not None:
+            timeout = max(0.0, deadline - time.monotonic())
+        if not self.__write_lock.acquire(True, timeout if block else None):
+            if slots is not None:
+                slots.release()
+            raise queue.Full
+        try:
+            self.__writer.send_bytes(obj)
+        finally:
+            self.__write_lock.release()
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> bytes:
+        """Receive an item (bytes). Only available in the process owning the reading
+        end.
+
+        Raise `queue.Empty` if there is no item before the timeout.
+        """
+        if self.__reader is None:
+            raise OSError(
+                "syncstream: The reading end of the pipe is not owned by this process."
+            )
+        if not block:
+            timeout = 0
+        if timeout is not None and not self.__reader.poll(timeout):
+            raise queue.Empty
+        obj = self.__reader.recv_bytes()
+        if self.__slots is not None:
+            self.__slots.release()
+        return obj
+
+
+def _release_shared_memory(shm: Any, unlink: bool) -> None:
+    """A callback for the finalizer, used for releasing the shared memory.
+
+    Arguments
+    ---------
+    shm: `SharedMemory`
+        The shared memory to be released.
+
+    unlink: `bool`
+        Whether to destroy the shared memory. Only the creator should do this.
+    """
+    shm.close()
+    if unlink:
+        try:
+            shm.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def _attach_shared_memory(owner: Any, name: str) -> Any:
+    """Attach the shared memory created by another process.
+
+    The attached memory is closed (but not destroyed) when `owner` is released.
+    """
+    if sys.version_info >= (3, 13):
+        shm = shared_memory.SharedMemory(name=name, track=False)
+    else:
+        shm = shared_memory.SharedMemory(name=name)
+    weakref.finalize(owner, _release_shared_memory, shm, False)
+    return shm
+
+
+class _StopFlag:
+    """A process-safe flag used for sending the stop signal to the mirrors.
+
+    The flag is stored in one byte of shared memory. Checking the flag is a plain
+    memory read, without any locks or inter-process communications. If the shared
+    memory is not supported (python<3.8), the flag falls back to an event object.
+
+    This flag could be pickled and sent to the sub-processes by any means. The shared
+    memory is attached when the flag is checked in the sub-process for the first
+    time.
+
+    This class is private and should not be exposed to users.
+    """
+
+    def __init__(
+        self, manager: Optional[multiprocessing.managers.SyncManager] = None
+    ) -> None:
+        """Initialization.
+
+        Arguments
+        ---------
+        manager: `SyncManager | None`
+            Only used when the shared memory is not supported. If specified, the
+            fall-back event is created by this manager, so the flag could be still
+            pickled. Otherwise, use `multiprocessing.Event()`.
+        """
+        self.__name: Optional[str] = None
+        self.__shm: Any = None
+        self.__event: Optional[_Event] = None
+        if shared_memory is not None:
+            self.__shm = shared_memory.SharedMemory(create=True, size=1)
+            self.__shm.buf[0] = 0
+            self.__name = self.__shm.name
+            weakref.finalize(self, _release_shared_memory, self.__shm, True)
+        elif manager is not None:
+            self.__event = manager.Event()
+        else:
+            self.__event = multiprocessing.Event()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle the name of the shared memory, or the fall-back event."""
+        return {"name": self.__name, "event": self.__event}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore the flag. The shared memory is attached lazily."""
+        self.__name = state["name"]
+        self.__shm = None
+        self.__event = state["event"]
+
+    @property
+    def __buffer(self) -> Any:
+        """The attached shared memory buffer.
+
+        This property is private and should not be exposed to users.
+        """
+        if self.__shm is None:
+            self.__shm = _attach_shared_memory(self, self.__name)
+        return self.__shm.buf
+
+    def is_set(self) -> bool:
+        """Check whether the flag is set."""
+        if self.__event is not None:
+            return self.__event.is_set()
+        return self.__buffer[0] != 0
+
+    def set(self) -> None:
+        """Set the flag."""
+        if self.__event is not None:
+            self.__event.set()
+        else:
+            self.__buffer[0] = 1
+
+    def clear(self) -> None:
+        """Clear the flag."""
+        if self.__event is not None:
+            self.__event.clear()
+        else:
+            self.__buffer[0] = 0
+
+
+class _ShmQueue:
+    """A queue-like channel based on a single-producer/single-consumer byte ring in
+    the shared memory.
+
+    Each queue owns one ring, used by one mirror. The ring starts with a header of
+    two counters, i.e. the consumer position (`head`) and the producer position
+    (`tail`), followed by the data region. Each item is a frame of bytes (see
+    `_encode_message()`), stored as a length-prefixed record. An item longer than
+    the half of the ring is split into several records, where the highest bit of the
+    length marks that the item is continued by the next record. A special length
+    (`__end`) marks that the writer is closed, so the consumer could destroy the ring.
+
+    Only the producer modifies `tail`, and only the consumer modifies `head`, so the
+    ring does not need a lock between them. The writing end is still protected by a
+    process-safe lock, in case the same mirror is shared by several processes. When
+    a record is written to an empty ring, one byte is sent to a pipe shared by all
+    rings, so the consumer could sleep until any ring is not empty. Both sides check
+    the position of the other side again after publishing their own position, so a
+    record written while the consumer is going to sleep is not missed.
+
+    Like `_PipeQueue`, this object should be only shared with the sub-processes
+    through inheritance. Getting items is only available in the process owning the
+    `_ShmChannel`, and the items from all rings of the channel are returned.
+
+    This class is private and should not be exposed to users.
+    """
+
+    __header = struct.Struct("QQ")
+    __counter = struct.Struct("Q")
+    __length = struct.Struct("<I")
+    __continued = 1 << 31
+    __end = (1 << 31) - 1
+
+    def __init__(self, channel: "_ShmChannel", size: int) -> None:
+        """Initialization. Should be only created by `_ShmChannel.new_queue()`.
+
+        Arguments
+        ---------
+        channel: `_ShmChannel`
+            The consumer of this queue.
+
+        size: `int`
+            The size (bytes) of the data region of the ring.
+        """
+        self.__size: int = max(64, int(size))
+        self.__shm: Any = shared_memory.SharedMemory(
+            create=True, size=self.__header.size + self.__size
+        )
+        self.__header.pack_into(self.__shm.buf, 0, 0, 0)
+        self.__name: str = self.__shm.name
+        self.__release: Callable[[], Any] = weakref.finalize(
+            self, _release_shared_memory, self.__shm, True
+        )
+        self.__channel: Optional[_ShmChannel] = channel
+        self.__partial: bytes = b""
+        self.finished: bool = False
+        self.__wakeup: Connection = channel.wakeup
+        self.__write_lock: _Lock = multiprocessing.Lock()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle the name of the shared memory, and the writing end only."""
+        return {
+            "name": self.__name,
+            "size": self.__size,
+            "wakeup": self.__wakeup,
+            "write_lock": self.__write_lock,
+        }
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore the writing end in the sub-process. The shared memory is
+        attached lazily."""
+        self.__name = state["name"]
+        self.__size = state["size"]
+        self.__shm = None
+        self.__channel = None
+        self.__partial = b""
+        self.finished = False
+        self.__wakeup = state["wakeup"]
+        self.__write_lock = state["write_lock"]
+
+    @property
+    def waitable(self) -> Optional[Connection]:
+        """The object that could be waited by `multiprocessing.connection.wait()`
+        until an item is available. `None` in the sub-processes."""
+        if self.__channel is None:
+            return None
+        return self.__channel.waitable
+
+    @property
+    def __buffer(self) -> Any:
+        """The attached shared memory buffer.
+
+        This property is private and should not be exposed to users.
+        """
+        if self.__shm is None:
+            self.__shm = _attach_shared_memory(self, self.__name)
+        return self.__shm.buf
+
+    def put(
+        self, obj: bytes, block: bool = True, timeout: Optional[float] = None
+    ) -> None:
+        """Write an item (bytes) to the ring. If the ring does not have enough space,
+        wait until the consumer reads the ring.
+
+        Raise `queue.Full` if the ring is not available before the timeout. In this
+        case, nothing of the item is written.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        if not self.__write_lock.acquire(block, timeout):
+            raise queue.Full
+        try:
+            # Each record should not be longer than the ring.
+            n_part = self.__size // 2
+            n_records = max(1, -(-len(obj) // n_part))
+            # Wait for the space of the whole item before writing the first record,
+            # so a failed writing would not leave a partial item in the ring. The
+            # rest records of an item longer than the ring are written in the
+            # blocking mode.
+            n_reserve = min(self.__size, len(obj) + n_records * self.__length.size)
+            for idx in range(0, max(1, len(obj)), n_part):
+                is_continued = idx + n_part < len(obj)
+                self.__put_record(
+                    obj[idx : idx + n_part], is_continued, block, deadline, n_reserve
+                )
+                block, deadline, n_reserve = True, None, 0
+        finally:
+            self.__write_lock.release()
+
+    def put_last(
+        self, obj: bytes, block: bool = True, timeout: Optional[float] = None
+    ) -> None:
+        """Write the last item (bytes) of the writer, followed by the end marker.
+
+        The item and the marker are published together, so the consumer never sees
+        the item without the marker, and could destroy the ring after reading them.
+        If the item is too long to be published at once, it is written by `put()`,
+        and the ring is kept until the channel is released.
+
+        Raise `queue.Full` if the ring is not available before the timeout. In this
+        case, nothing is written.
+        """
+        if len(obj) > self.__size // 2:
+            self.put(obj, block, timeout)
+            return
+        deadline = None if timeout is None else time.monotonic() + timeout
+        if not self.__write_lock.acquire(block, timeout):
+            raise queue.Full
+        try:
+            self.__put_record(obj, False, block, deadline, is_last=True)
+        finally:
+            self.__write_lock.release()
+
+    def __put_record(
+        self,
+        record: bytes,
+        is_continued: bool,
+        block: bool,
+        deadline: Optional[float],
+        n_reserve: int = 0,
+        is_last: bool = False,
+    ) -> None:
+        """Write one record to the ring without lock.
+
+        The record is written when the free space is not smaller than `n_reserve`
+        and the size of the record. If `is_last` is set, the end marker is written
+        and published with the record.
+
+        This method is private and should not be exposed to users.
+        """
+        buf = self.__buffer
+        size = self.__size
+        n_record = len(record) | (self.__continued if is_continued else 0)
+        data = self.__length.pack(n_record) + record
+        if is_last:
+            data += self.__length.pack(self.__end)
+        n_total = len(data)
+        n_required = max(n_total, n_reserve)
+        wait = 0.0001
+        while True:
+            head, tail = self.__header.unpack_from(buf, 0)
+            if size - (tail - head) >= n_required:
+                break
+            if not block or (deadline is not None and time.monotonic() >= deadline):
+                raise queue.Full
+            time.sleep(wait)
+            wait = min(0.005, wait * 2)
+        self.__copy_in(buf, tail, data)
+        # Publish the record after its data is copied.
+        self.__counter.pack_into(buf, 8, tail + n_total)
+        # Check the consumer again after publishing. If it has read all records
+        # before this one, it may be sleeping without seeing this record.
+        (head,) = self.__counter.unpack_from(buf, 0)
+        if head == tail:
+            try:
+                os.write(self.__wakeup.fileno(), b"\0")
+            except BlockingIOError:  # The pipe is full, the consumer will wake up.
+                pass
+
+    def __copy_in(self, buf: Any, pos: int, data: bytes) -> None:
+        """Copy the data into the ring started from the position `pos`.
+
+        This method is private and should not be exposed to users.
+        """
+        offset = self.__header.size
+        pos = pos % self.__size
+        n_first = min(len(data), self.__size - pos)
+        buf[offset + pos : offset + pos + n_first] = data[:n_first]
+        if n_first < len(data):
+            buf[offset : offset + len(data) - n_first] = data[n_first:]
+
+    def __copy_out(self, buf: Any, pos: int, n_bytes: int) -> bytes:
+        """Copy the data out of the ring started from the position `pos`.
+
+        This method is private and should not be exposed to users.
+        """
+        offset = self.__header.size
+        pos = pos % self.__size
+        n_first = min(n_bytes, self.__size - pos)
+        data = bytes(buf[offset + pos : offset + pos + n_first])
+        if n_first < n_bytes:
+            data += bytes(buf[offset : offset + n_bytes - n_first])
+        return data
+
+    def read_records(self) -> List[bytes]:
+        """Read all available items from the ring. Only used by the consumer."""
+        buf = self.__buffer
+        head, tail = self.__header.unpack_from(buf, 0)
+        records = list()
+        n_length = self.__length.size
+        while head < tail:
+            while head < tail:
+                (n_record,) = self.__length.unpack(self.__copy_out(buf, head, n_length))
+                if n_record == self.__end:
+                    head += n_length
+                    self.finished = True
+                    continue
+                is_continued = bool(n_record & self.__continued)
+                n_record &= self.__continued - 1
+                record = self.__copy_out(buf, head + n_length, n_record)
+                head += n_length + n_record
+                if self.__partial:
+                    record = self.__partial + record
+                    self.__partial = b""
+                if is_continued:
+                    self.__partial = record
+                else:
+                    records.append(record)
+            self.__counter.pack_into(buf, 0, head)
+            # Check the producer again after publishing. A record published before
+            # `head` is updated may not send the wake-up byte.
+            (tail,) = self.__counter.unpack_from(buf, 8)
+        return records
+
+    def release(self) -> None:
+        """Destroy the ring. Only used by the consumer after the writer is closed,
+        since the ring would not be used any more."""
+        self.__release()
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> Any:
+        """Receive an item from any ring of the channel. Only available in the
+        process owning the channel.
+
+        Raise `queue.Empty` if there is no item before the timeout.
+        """
+        if self.__channel is None:
+            raise OSError(
+                "syncstream: The reading end of the shared memory is not owned by "
+                "this process."
+            )
+        return self.__channel.get(block=block, timeout=timeout)
+
+
+class _ShmChannel:
+    """The consumer of the shared memory rings (`_ShmQueue`).
+
+    The channel creates one ring for each mirror, and scans all rings when receiving
+    items. If all rings are empty, the channel sleeps until a byte is sent to the
+    wake-up pipe by any producer. Once a mirror is closed by `LineProcMirror.close()`,
+    its ring is destroyed and not scanned any more. A mirror only ended by
+    `send_eof()` could be reused, so its ring is kept.
+
+    This class is private and should not be exposed to users.
+    """
+
+    def __init__(self, size: int) -> None:
+        """Initialization.
+
+        Arguments
+        ---------
+        size: `int`
+            The size (bytes) of the data region of each ring.
+        """
+        self.size: int = int(size)
+        reader, writer = multiprocessing.Pipe(duplex=False)
+        os.set_blocking(reader.fileno(), False)
+        os.set_blocking(writer.fileno(), False)
+        self.__reader: Connection = reader
+        self.wakeup: Connection = writer
+        self.__queues: List[_ShmQueue] = list()
+        self.__items: Deque[Any] = collections.deque()
+
+    @property
+    def waitable(self) -> Connection:
+        """The reading end of the wake-up pipe, which could be waited by
+        `multiprocessing.connection.wait()`.
+
+        Note that a ready wake-up pipe does not guarantee that an item is available,
+        and the rings may be not empty before the wake-up pipe is ready. Therefore,
+        it should be only waited after `get(block=False)` raises `queue.Empty`.
+        """
+        return self.__reader
+
+    def new_queue(self, size: Optional[int] = None) -> _ShmQueue:
+        """Create a new ring for a mirror."""
+        mqueue = _ShmQueue(self, self.size if size is None else size)
+        self.__queues.append(mqueue)
+        return mqueue
+
+    def __scan(self) -> None:
+        """Scan all rings, and fetch the available items.
+
+        This method is private and should not be exposed to users.
+        """
+        closed = list()
+        for mqueue in self.__queues:
+            self.__items.extend(mqueue.read_records())
+            if mqueue.finished:
+                closed.append(mqueue)
+        for mqueue in closed:
+            self.__queues.remove(mqueue)
+            mqueue.release()
+
+    def __drain_wakeup(self) -> None:
+        """Consume the bytes in the wake-up pipe.
+
+        This method is private and should not be exposed to users.
+        """
+        try:
+            while os.read(self.__reader.fileno(), 4096):
+                pass
+        except BlockingIOError:
+            pass
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> Any:
+        """Receive an item from any ring.
+
+        Raise `queue.Empty` if there is no item before the timeout.
+        """
+        if self.__items:
+            return self.__items.popleft()
+        if not block:
+            timeout = 0
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            self.__drain_wakeup()
+            self.__scan()
+            if self.__items:
+                return self.__items.popleft()
+            remain = None if deadline is None else deadline - time.monotonic()
+            if remain is not None and remain <= 0:
+                raise queue.Empty
+            self.__reader.poll(remain)
+
+
+class _RingStorage(Generic[T]):
+    """A ring buffer used as the storage of the line-based buffers.
+
+    The items are kept in a list with a fixed capacity (`maxlen`). Once the list is
+    full, a new item overwrites the oldest one, and the head index moves forward.
+    Reading the last `k` items only takes one or two slices of the list, and does
+    not mutate the storage.
+
+    The size (bytes) of each item is recorded. If `maxbytes` is specified, the oldest
+    items are also evicted until the total size fits the budget. The newest item is
+    always kept, even if its size exceeds `maxbytes`.
+
+    Each appended item is assigned a sequence number. The number starts from 0, and
+    is increased by 1 for each appended item. The number is never reused, even if the
+    item is evicted or the storage is cleared. Therefore, the number could be used as
+    a cursor for fetching the new items incrementally.
+
+    Appending items notifies the threads blocked by `wait()`, and calls the wakers
+    registered by `add_waker()`.
+
+    All methods are thread-safe. The storage is modified and read under an internal
+    lock, so a reader never sees a half-updated ring.
+
+    This class is private and should not be exposed to users.
+    """
+
+    def __init__(self, maxlen: int, maxbytes: Optional[int] = None) -> None:
+        """Initialization.
+
+        Arguments
+        ---------
+        maxlen: `int`
+            The maximal length (capacity) of the storage.
+
+        maxbytes: `int | None`
+            The maximal total size (bytes) of the stored items. If `None`, the size
+            is not limited.
+        """
+        self.__maxlen: int = int(maxlen)
+        self.__maxbytes: Optional[int] = None if maxbytes is None else int(maxbytes)
+        # The slots are used circularly. `__head` is the slot of the oldest item.
+        # The byte budget and the growth of the slots could leave some slots unused
+        # (`__count < len(...)`).
+        self.__items: List[Optional[T]] = list()
+        self.__sizes: List[int] = list()
+        self.__head: int = 0
+        self.__count: int = 0
+        self.__nbytes: int = 0
+        self.next_seq: int = 0
+        self.__lock: threading.Lock = threading.Lock()
+        self.__cond: threading.Condition = threading.Condition(self.__lock)
+        self.__wakers: Set[Callable[[], None]] = set()
+
+    @property
+    def maxlen(self) -> int:
+        """The maximal length (capacity) of the storage."""
+        return self.__maxlen
+
+    @property
+    def maxbytes(self) -> Optional[int]:
+        """The maximal total size (bytes) of the stored items."""
+        return self.__maxbytes
+
+    @property
+    def nbytes(self) -> int:
+        """The total size (bytes) of the stored items."""
+        return self.__nbytes
+
+    @property
+    def first_seq(self) -> int:
+        """The sequence number of the oldest item still in the storage."""
+        with self.__lock:
+            return self.next_seq - self.__count
+
+    def __len__(self) -> int:
+        """Number of items in the storage."""
+        return self.__count
+
+    def __iter__(self) -> Iterator[T]:
+        """Iterate the items in the FIFO order."""
+        return iter(self.tail(self.__count))
+
+    def __getitem__(self, index: int) -> T:
+        """Get one item by the index. The index `0` refers to the oldest item."""
+        with self.__lock:
+            n_items = self.__count
+            if index < 0:
+                index += n_items
+            if index < 0 or index >= n_items:
+                raise IndexError("syncstream: The storage index is out of range.")
+            return self.__items[(self.__head + index) % len(self.__items)]
+
+    def __evict(self) -> None:
+        """Remove the oldest item.
+
+        This method is private and should not be used by users. It should be used
+        when the internal lock is acquired.
+        """
+        head = self.__head
+        self.__nbytes -= self.__sizes[head]
+        self.__items[head] = None
+        self.__sizes[head] = 0
+        self.__count -= 1
+        if self.__count == 0:
+            self.__items = list()
+            self.__sizes = list()
+            self.__head = 0
+        else:
+            head += 1
+            self.__head = 0 if head >= len(self.__items) else head
+
+    def __push(self, item: T, size: int) -> None:
+        """Store one item without notifying the waiters.
+
+        This method is private and should not be used by users. It should be used
+        when the internal lock is acquired.
+        """
+        maxbytes = self.__maxbytes
+        if maxbytes is not None:
+            while self.__count > 0 and self.__nbytes + size > maxbytes:
+                self.__evict()
+        items = self.__items
+        n_slots = len(items)
+        head = self.__head
+        if self.__count < n_slots:
+            pos = (head + self.__count) % n_slots
+            items[pos] = item
+            self.__sizes[pos] = size
+            self.__count += 1
+        elif n_slots < self.__maxlen:
+            if head == 0:
+                items.append(item)
+                self.__sizes.append(size)
+            else:
+                # Rotate the slots to make the oldest item the first one, and reserve
+                # more free slots, so the rotation would not happen for every item.
+                n_free = min(n_slots, self.__maxlen - n_slots)
+                items = items[head:] + items[:head] + [item] + [None] * (n_free - 1)
+                sizes = self.__sizes
+                self.__sizes = sizes[head:] + sizes[:head] + [size] + [0] * (n_free - 1)
+                self.__items = items
+                self.__head = 0
+            self.__count += 1
+        else:
+            self.__nbytes -= self.__sizes[head]
+            items[head] = item
+            self.__sizes[head] = size
+            head += 1
+            self.__head = 0 if head >= n_slots else head
+        self.__nbytes += size
+
+    def append(self, item: T) -> None:
+        """Append one item. If the storage is full, the oldest item is evicted."""
+        size = get_record_size(item)
+        with self.__lock:
+            self.__push(item, size)
+            self.next_seq += 1
+        self.wake()
+
+    def extend(self, items: Sequence[T]) -> None:
+        """Append the items. If the storage is full, the oldest items are evicted."""
+        items = list(items)
+        n_items = len(items)
+        if n_items == 0:
+            return
+        maxlen = self.__maxlen
+        if n_items >= maxlen:
+            # All stored items would be evicted.
+            items = items[n_items - maxlen :]
+        sizes = [get_record_size(item) for item in items]
+        with self.__lock:
+            if n_items >= maxlen:
+                self.__clear()
+            for item, size in zip(items, sizes):
+                self.__push(item, size)
+            self.next_seq += n_items
+        self.wake()
+
+    def clear(self) -> None:
+        """Remove all items. The sequence number is preserved."""
+        with self.__lock:
+            self.__clear()
+
+    def __clear(self) -> None:
+        """Remove all items without lock.
+
+        This method is private and should not be used by users. It should be used
+        when the internal lock is acquired.
+        """
+        self.__count = 0
+        self.__head = 0
+        self.__items = list()
+        self.__sizes = list()
+        self.__nbytes = 0
+
+    def tail(self, size: int) -> List[T]:
+        """Get the last `size` items in the FIFO order.
+
+        Arguments
+        ---------
+        size: `int`
+            The number of items to be fetched. If it is larger than the length of the
+            storage, all items are fetched.
+        """
+        with self.__lock:
+            return self.__tail(size)
+
+    def __tail(self, size: int) -> List[T]:
+        """Get the last `size` items without lock.
+
+        This method is private and should not be used by users. It should be used
+        when the internal lock is acquired.
+        """
+        items = self.__items
+        n_items = self.__count
+        size = min(size, n_items)
+        if size <= 0:
+            return list()
+        n_slots = len(items)
+        end = (self.__head + n_items) % n_slots
+        start = end - size
+        if start >= 0:
+            return items[start:end]
+        return items[start:] + items[:end]
+
+    def read_since(self, seq: int) -> Tuple[Tuple[T, ...], int, int]:
+        """Read the items whose sequence numbers are not smaller than `seq`.
+
+        Arguments
+        ---------
+        seq: `int`
+            The cursor. It is usually `next_seq` returned by the previous call. If
+            `seq` is larger than `next_seq` (e.g. the cursor comes from another
+            buffer), the reading restarts from the oldest item.
+
+        Returns
+        -------
+        #1: `[T]`
+            The fetched items, sorted in the FIFO order.
+
+        #2: `int`
+            The cursor for the next call.
+
+        #3: `int`
+            The number of items after `seq` that have been evicted (or cleared)
+            before being read.
+        """
+        seq = int(seq)
+        with self.__lock:
+            next_seq = self.next_seq
+            first_seq = next_seq - self.__count
+            if seq > next_seq:
+                seq = first_seq
+            dropped = max(0, first_seq - seq)
+            items = self.__tail(next_seq - max(seq, first_seq))
+        return tuple(items), next_seq, dropped
+
+    def wake(self) -> None:
+        """Wake up all threads blocked by `wait()`, and call all wakers."""
+        with self.__cond:
+            self.__cond.notify_all()
+        for waker in tuple(self.__wakers):
+            waker()
+
+    def wait(
+        self,
+        seq: int,
+        timeout: Optional[float] = None,
+        is_stopped: Optional[Callable[[], bool]] = None,
+    ) -> bool:
+        """Block the current thread until an item with a sequence number not smaller
+        than `seq` is appended.
+
+        Arguments
+        ---------
+        seq: `int`
+            The cursor to be waited for.
+
+        timeout: `float | None`
+            The maximal waiting time (seconds). If `None`, wait forever.
+
+        is_stopped: `() -> bool`
+            An optional predicate. If it returns `True` when the thread is woken up,
+            stop waiting. It is called while the internal condition is held, so it
+            should not acquire other locks.
+
+        Returns
+        -------
+        #1: `bool`
+            `True` if there is any new item after `seq`.
+        """
+        with self.__cond:
+            self.__cond.wait_for(
+                lambda: self.next_seq != seq
+                or (is_stopped is not None and is_stopped()),
+                timeout=timeout,
+            )
+        return self.next_seq != seq
+
+    def add_waker(self, waker: Callable[[], None]) -> None:
+        """Register a callback that is called when new items are appended.
+
+        The callback is called by the appending thread, so it should be quick and
+        thread-safe, e.g. `loop.call_soon_threadsafe(...)`.
+        """
+        self.__wakers.add(waker)
+
+    def remove_waker(self, waker: Callable[[], None]) -> None:
+        """Remove a callback registered by `add_waker()`."""
+        self.__wakers.discard(waker)
+
+
+class LineSubscription(Generic[T]):
+    """The subscription of the new records of a line-based buffer.
+
+    This object is returned by `subscribe()` of the line-based buffers. It is both a
+    blocking iterator and an async iterator yielding the records once they are
+    stored, like `tail -f`:
+
+    ```python
+    for record in buffer.subscribe():
+        print(record)
+
+    async for record in buffer.subscribe():
+        print(record)
+    ```
+
+    The subscription does not have its own queue. It only keeps a cursor on the
+    storage of the buffer. If a subscriber is so slow that some records are evicted
+    (because of `maxlen`) before being fetched, these records are skipped and counted
+    by the property `dropped`. The writers are never blocked by subscribers.
+
+    The iteration stops when the subscription or the buffer is closed, or no new
+    record is stored within `timeout` seconds.
+    """
+
+    def __init__(
+        self, buffer: "_LineBuffer[T]", since: int, timeout: Optional[float] = None
+    ) -> None:
+        """Initialization.
+
+        This object should be created by `subscribe()` of the buffer.
+
+        Arguments
+        ---------
+        buffer: `_LineBuffer`
+            The buffer to be subscribed.
+
+        since: `int`
+            The sequence number of the first record to be yielded.
+
+        timeout: `float | None`
+            The maximal waiting time (seconds) of a new record. If `None`, wait
+            forever.
+        """
+        self.__buffer: "_LineBuffer[T]" = buffer
+        self.__storage: _RingStorage[Union[str, T]] = buffer.storage
+        self.__pending: Deque[Union[str, T]] = collections.deque()
+        self.seq: int = int(since)
+        self.dropped: int = 0
+        self.timeout: Optional[float] = timeout
+        self.__closed: bool = False
+
+    @property
+    def closed(self) -> bool:
+        """Check whether the subscription has been closed."""
+        return self.__closed
+
+    def close(self) -> None:
+        """Close the subscription. The blocked iteration would be stopped."""
+        self.__closed = True
+        self.__storage.wake()
+
+    def __is_stopped(self) -> bool:
+        """Check whether the iteration needs to be stopped.
+
+        This method is private and should not be used by users.
+        """
+        return self.__closed or self.__buffer.last_line.closed
+
+    def __fetch(self) -> bool:
+        """Fetch the new records into the pending queue.
+
+        This method is private and should not be used by users.
+        """
+        records, self.seq, dropped = self.__buffer.read_since(self.seq)
+        self.dropped += dropped
+        self.__pending.extend(records)
+        return len(records) > 0
+
+    def __iter__(self) -> "LineSubscription[T]":
+        return self
+
+    def __next__(self) -> Union[str, T]:
+        """Get the next record. Block the current thread if there is no record."""
+        while True:
+            if self.__pending:
+                return self.__pending.popleft()
+            if self.__is_stopped():
+                raise StopIteration
+            if self.__fetch():
+                continue
+            if not self.__storage.wait(self.seq, self.timeout, self.__is_stopped):
+                raise StopIteration
+
+    def __aiter__(self) -> "LineSubscription[T]":
+        return self
+
+    async def __anext__(self) -> Union[str, T]:
+        """Get the next record. Wait in the event loop if there is no record."""
+        while True:
+            if self.__pending:
+                return self.__pending.popleft()
+            if self.__is_stopped():
+                raise StopAsyncIteration
+            if self.__fetch():
+                continue
+            loop = asyncio.get_running_loop()
+            event = asyncio.Event()
+
+            def waker() -> None:
+                try:
+                    loop.call_soon_threadsafe(event.set)
+                except RuntimeError:  # The loop has been closed.
+                    pass
+
+            self.__storage.add_waker(waker)
+            try:
+                if self.__storage.next_seq == self.seq and not self.__is_stopped():
+                    await asyncio.wait_for(event.wait(), timeout=self.timeout)
+            except asyncio.TimeoutError:
+                raise StopAsyncIteration
+            finally:
+                self.__storage.remove_waker(waker)
+
+
+class _ThreadToken:
+    """The token of a writing thread in the `per_thread` mode of `_LineBuffer`.
+
+    The token is stored in the thread-local storage of the buffer. It is released when
+    the writing thread exits, which triggers the clean-up of the incomplete line of
+    that thread. This class should not be exposed to users.
+    """
+
+    __slots__ = ("key", "__weakref__")
+
+    def __init__(self, key: int) -> None:
+        """Initialization.
+
+        Arguments
+        ---------
+        key: `int`
+            The unique key of the writing thread. Different from the thread ident,
+            the key is never reused by a new thread.
+        """
+        self.key: int = key
 
 
 class _LineBuffer(Generic[T]):
@@ -63,7 +1214,16 @@ class _LineBuffer(Generic[T]):
     is limited.
     """
 
-    def __init__(self, maxlen: int = 20, _data_type: Type[T] = str) -> None:
+    def __init__(
+        self,
+        maxlen: int = 20,
+        per_thread: bool = False,
+        maxbytes: Optional[int] = None,
+        max_line_length: Optional[int] = None,
+        terminal: bool = False,
+        separator: Literal["universal", "newline"] = "universal",
+        _data_type: Type[T] = str,
+    ) -> None:
         """Initialization.
 
         Arguments
@@ -71,6 +1231,35 @@ class _LineBuffer(Generic[T]):
         maxlen: `int`
             The maximal number of stored lines.
 
+        per_thread: `bool`
+            If `True`, each writing thread has its own incomplete line. The partial
+            writes of different threads would not be mixed into one line, and the
+            lock is only acquired when a line is completed. When a writing thread
+            exits, its incomplete line is stored as a record. If `False`, all threads
+            share the same incomplete line.
+
+        maxbytes: `int | None`
+            The maximal total size (bytes, UTF-8 encoded) of the stored lines. If
+            specified, the oldest lines are evicted until the stored lines fit this
+            budget, while the newest line is always kept. If `None`, only `maxlen`
+            is used.
+
+        max_line_length: `int | None`
+            The maximal length (characters) of a line. If a line (including the
+            incomplete line) becomes longer than this value, a line break would be
+            forced, and the event is counted by `n_overflows`. If `None`, the length
+            is not limited.
+
+        terminal: `bool`
+            If `True`, use the terminal semantics: only `\n` completes a line, while
+            `\r` moves the cursor to the line start, so the following text overwrites
+            the incomplete line in place. It prevents the progress bars from flooding
+            the storage. If `False`, the line breaks are determined by `separator`.
+
+        separator: `"universal" | "newline"`
+            The separator policy of splitting lines (see `LineSplitter`). Use
+            `"newline"` to only split the lines by `\n`, which is faster.
+
         _data_type: `T`
             A data type used for hiniting the data in the storage. This value should
             not be configured by users.
@@ -79,9 +1268,31 @@ class _LineBuffer(Generic[T]):
             raise TypeError(
                 'syncstream: The argument "maxlen" should be a positive integer.'
             )
-        self.storage: Deque[Union[str, T]] = collections.deque(maxlen=maxlen)
+        if maxbytes is not None and (not isinstance(maxbytes, int) or maxbytes < 1):
+            raise TypeError(
+                'syncstream: The argument "maxbytes" should be a positive integer or '
+                "None."
+            )
+        if max_line_length is not None and (
+            not isinstance(max_line_length, int) or max_line_length < 1
+        ):
+            raise TypeError(
+                'syncstream: The argument "max_line_length" should be a positive '
+                "integer or None."
+            )
+        self.storage: _RingStorage[Union[str, T]] = _RingStorage(
+            maxlen=maxlen, maxbytes=maxbytes
+        )
+        self.max_line_length: Optional[int] = max_line_length
+        self.__n_overflows: int = 0
+        self.__terminal: bool = bool(terminal)
+        self.__splitter: LineSplitter = LineSplitter(separator)
         self.last_line: io.StringIO = io.StringIO()
         self.__last_line_lock: threading.Lock = threading.Lock()
+        self.__per_thread: bool = bool(per_thread)
+        self.__thread_states: Dict[int, Tuple[io.StringIO, LineSplitter]] = dict()
+        self.__thread_local: threading.local = threading.local()
+        self.__thread_keys: Iterator[int] = itertools.count()
 
     @property
     def maxlen(self) -> Optional[int]:
@@ -91,12 +1302,59 @@ class _LineBuffer(Generic[T]):
         """
         return self.storage.maxlen
 
+    @property
+    def maxbytes(self) -> Optional[int]:
+        """The maximal total size (bytes) of the stored lines.
+
+        When this value is `None`, it means that there is no size limit.
+        """
+        return self.storage.maxbytes
+
+    @property
+    def nbytes(self) -> int:
+        """The total size (bytes, UTF-8 encoded) of the stored lines.
+
+        The incomplete last line is not counted.
+        """
+        return self.storage.nbytes
+
+    @property
+    def n_overflows(self) -> int:
+        """The number of line breaks forced by `max_line_length`."""
+        return self.__n_overflows
+
+    @property
+    def terminal(self) -> bool:
+        """Whether the terminal semantics (`\r` overwrites the line) is used."""
+        return self.__terminal
+
+    @property
+    def separator(self) -> Literal["universal", "newline"]:
+        """The separator policy of splitting lines."""
+        return self.__splitter.separator
+
+    @property
+    def per_thread(self) -> bool:
+        """Whether each writing thread has its own incomplete line."""
+        return self.__per_thread
+
+    @property
+    def next_seq(self) -> int:
+        """The sequence number that would be assigned to the next stored record.
+
+        Use this value as the cursor of `read_since()` to only fetch the records
+        stored after now.
+        """
+        return self.storage.next_seq
+
     def __len__(self) -> int:
         """Number of lines/items in the buffer."""
         max_len = self.maxlen
         val_n_lines = len(self.storage)
         with self.__last_line_lock:
-            if self.last_line:
+            if self.__per_thread:
+                val_n_lines += len(self.__pending_lines())
+            elif self.last_line:
                 val_n_lines += 1
         return min(max_len, val_n_lines) if max_len else val_n_lines
 
@@ -116,6 +1374,7 @@ class _LineBuffer(Generic[T]):
         self.clear()
         with self.__last_line_lock:
             self.last_line.close()
+        self.storage.wake()
 
     def fileno(self) -> Never:
         """Return the file ID.
@@ -169,6 +1428,8 @@ class _LineBuffer(Generic[T]):
         with self.__last_line_lock:
             self.last_line.seek(0, os.SEEK_SET)
             self.last_line.truncate(0)
+            self.__thread_states.clear()
+            self.__splitter.reset()
         self.storage.clear()
 
     def new_line(self) -> None:
@@ -181,9 +1442,18 @@ class _LineBuffer(Generic[T]):
         if self.last_line.tell() > 0:
             write('\n')
         ```
+
+        In the `per_thread` mode, only the incomplete line of the current thread is
+        checked.
         """
+        if self.__per_thread:
+            token = getattr(self.__thread_local, "token", None)
+            state = self.__thread_states.get(token.key) if token is not None else None
+            if state is not None and not is_blank_stream(state[0]):
+                self.write("\n")
+            return
         with self.__last_line_lock:
-            if self.last_line.tell() > 0:
+            if not is_blank_stream(self.last_line):
                 self.__write("\n")
 
     def flush(self) -> None:
@@ -212,51 +1482,39 @@ class _LineBuffer(Generic[T]):
 
         Private method. Use it to read all lines stored in this buffer.
         """
-        has_last_line = self.last_line.tell() > 0
-        n_lines = len(self.storage)
-        if has_last_line:
-            len_max = self.storage.maxlen
-            if len_max and n_lines == len_max:
-                value = self.storage.popleft()
-                results = (*self.storage, self.last_line.getvalue())
-                self.storage.appendleft(value)
-            elif n_lines > 0:
-                results = (*self.storage, self.last_line.getvalue())
-            else:
-                results = (self.last_line.getvalue(),)
-            return results
-        else:
-            return tuple(self.storage)
+        return self.__read_n(self.storage.maxlen)
 
     def __read_n(self, size: int) -> Tuple[Union[T, str], ...]:
         """Real given number of lines.
 
         Private method. Use it to read some lines specified in the argument `size`.
+        The storage is not mutated.
         """
-        has_last_line = self.last_line.tell() > 0
-        n_lines = len(self.storage)
-        len_max = self.storage.maxlen
-        if has_last_line and len_max and n_lines == len_max:
-            preserved_value = self.storage.popleft()
+        if self.__per_thread:
+            pending = self.__pending_lines()
+        elif not is_blank_stream(self.last_line):
+            pending = [self.last_line.getvalue()]
         else:
-            preserved_value = None
-        n_read = min(
-            size - 1 if has_last_line else size,
-            n_lines if preserved_value is None else n_lines - 1,
-        )
-        results = list()
-        if n_read > 0:
-            self.storage.rotate(n_read)
-        for _ in range(n_read):
-            value = self.storage.popleft()
-            results.append(value)
-            self.storage.append(value)
-        if has_last_line:
-            results.append(self.last_line.getvalue())
-            if preserved_value is not None:
-                self.storage.appendleft(preserved_value)
+            return tuple(self.storage.tail(size))
+        size = min(size, self.storage.maxlen)
+        if len(pending) > size:
+            pending = pending[len(pending) - size :]
+        results = self.storage.tail(size - len(pending))
+        results.extend(pending)
         return tuple(results)
 
+    def __pending_lines(self) -> List[str]:
+        """Get the incomplete lines of all threads in the `per_thread` mode.
+
+        Private method. The lines are sorted by the order of the first writing of each
+        thread. It should be used when `__last_line_lock` is acquired.
+        """
+        return [
+            last_line.getvalue()
+            for last_line, _ in tuple(self.__thread_states.values())
+            if not is_blank_stream(last_line)
+        ]
+
     def read(self, size: Optional[int] = None) -> Tuple[Union[T, str], ...]:
         """Read the records.
 
@@ -264,7 +1522,8 @@ class _LineBuffer(Generic[T]):
         thread-safe and would not influence the cursor of `write()` method.
 
         If the current written line is not blank, the `read()` method would regard
-        it as the last record item.
+        it as the last record item. In the `per_thread` mode, the incomplete lines of
+        all threads are regarded as the last record items.
 
         Arguments
         ---------
@@ -289,32 +1548,270 @@ class _LineBuffer(Generic[T]):
             else:
                 return tuple()
 
+    def read_since(self, seq: int) -> Tuple[Tuple[Union[T, str], ...], int, int]:
+        """Read the records stored since the given cursor.
+
+        Each stored record has a monotonically increasing sequence number. This method
+        only fetches the records whose sequence numbers are not smaller than `seq`, so
+        a poller could fetch the new records incrementally:
+
+        ```python
+        seq = 0
+        while True:
+            records, seq, dropped = buffer.read_since(seq)
+        ```
+
+        Different from `read()`, the current written line is not regarded as a record
+        here, because it is not completed and does not have a sequence number yet.
+
+        Arguments
+        ---------
+        seq: `int`
+            The cursor. Use `0` to fetch all records, or use the `next_seq` returned
+            by the previous call.
+
+        Returns
+        -------
+        #1: `[str | T]`
+            A sequence of fetched record items. Results are sorted in the FIFO order.
+
+        #2: `int`
+            The cursor for the next call.
+
+        #3: `int`
+            The number of records after the cursor that have been evicted (because of
+            `maxlen`) or cleared before being read.
+        """
+        if not self.readable():
+            raise OSError("syncstream: The stream cannot be read now.")
+
+        with self.__last_line_lock:
+            return self.storage.read_since(seq)
+
+    def wait_for_new(
+        self, timeout: Optional[float] = None, seq: Optional[int] = None
+    ) -> bool:
+        """Block the current thread until new records are stored.
+
+        Different from polling `read()`, this method is based on a condition variable,
+        and would be woken up once a new record is stored (or the buffer is closed).
+
+        Arguments
+        ---------
+        timeout: `float | None`
+            The maximal waiting time (seconds). If `None`, wait forever.
+
+        seq: `int | None`
+            The cursor. If specified, wait until there is any record whose sequence
+            number is not smaller than `seq`. If not specified, wait for the next
+            record stored after calling this method.
+
+        Returns
+        -------
+        #1: `bool`
+            `True` if there are new records. `False` if the waiting is timed out or
+            the buffer is closed.
+        """
+        if seq is None:
+            seq = self.storage.next_seq
+        return self.storage.wait(seq, timeout, lambda: self.last_line.closed)
+
+    def subscribe(
+        self, since: Optional[int] = None, timeout: Optional[float] = None
+    ) -> LineSubscription[T]:
+        """Subscribe the new records of the buffer.
+
+        The returned subscription is both a blocking iterator and an async iterator
+        yielding the records once they are stored. See `LineSubscription` for
+        details.
+
+        Arguments
+        ---------
+        since: `int | None`
+            The sequence number of the first record to be yielded. If not specified,
+            only yield the records stored after calling this method. Use `0` to
+            yield all records still in the storage first.
+
+        timeout: `float | None`
+            The maximal waiting time (seconds) of a new record. If no record is stored
+            within this time, the iteration stops. If `None`, wait forever.
+
+        Returns
+        -------
+        #1: `LineSubscription`
+            The subscription, which could be closed by `close()`.
+        """
+        if since is None:
+            since = self.storage.next_seq
+        return LineSubscription(self, since=since, timeout=timeout)
+
     def __write(self, data: str) -> int:
         """The `write()` method without lock.
 
         This method is private and should not be used by users.
         """
-        message_lines = data.splitlines()
-        n_lines = len(message_lines)
-        if n_lines == 1 and message_lines[0] == "":
-            self.parse_lines((self.last_line.getvalue(),))
-            self.last_line.seek(0, os.SEEK_SET)
-            self.last_line.truncate(0)
-            return 1
-        elif is_end_line_break(data):
-            message_lines.append("")
-            n_lines += 1
-        if n_lines > 1:
-            message_lines[0] = self.last_line.getvalue() + message_lines[0]
-            last_line = message_lines.pop()
-            self.parse_lines(message_lines)
-            self.last_line.seek(0, os.SEEK_SET)
-            self.last_line.truncate(0)
-            return self.last_line.write(last_line)
-        elif n_lines == 1:
-            return self.last_line.write(message_lines[0])
-        else:
-            return 0
+        splitter = self.__splitter
+        return self.__write_pieces(
+            self.last_line, splitter.split(data), splitter=splitter
+        )
+
+    def __thread_line(self) -> Tuple[io.StringIO, LineSplitter]:
+        """Get the incomplete line and the splitter of the current thread in the
+        `per_thread` mode.
+
+        If the current thread has not written anything, a new incomplete line is
+        created, and a finalizer is registered for cleaning it up when the thread
+        exits.
+
+        This method is private and should not be used by users.
+        """
+        token: Optional[_ThreadToken] = getattr(self.__thread_local, "token", None)
+        if token is None:
+            token = _ThreadToken(next(self.__thread_keys))
+            self.__thread_local.token = token
+            finalizer = weakref.finalize(
+                token, _LineBuffer.__release_thread, weakref.ref(self), token.key
+            )
+            finalizer.atexit = False
+        state = self.__thread_states.get(token.key)
+        if state is None:
+            with self.__last_line_lock:
+                state = self.__thread_states.setdefault(
+                    token.key, (io.StringIO(), LineSplitter(self.__splitter.separator))
+                )
+        return state
+
+    @staticmethod
+    def __release_thread(ref: "weakref.ReferenceType[_LineBuffer]", key: int) -> None:
+        """The finalizer triggered when a writing thread exits.
+
+        The incomplete line of the exited thread is stored as a record, and the
+        per-thread states are removed.
+
+        This method is private and should not be used by users.
+        """
+        buffer = ref()
+        if buffer is None:
+            return
+        with buffer.__last_line_lock:
+            state = buffer.__thread_states.pop(key, None)
+            if state is None or is_blank_stream(state[0]):
+                return
+            pieces = [state[0].getvalue()]
+            max_length = buffer.max_line_length
+            if max_length is not None:
+                pieces = buffer.__break_lines(pieces, max_length)
+            buffer.parse_lines(pieces)
+
+    def __write_pieces(
+        self,
+        last_line: io.StringIO,
+        pieces: List[str],
+        lock: bool = False,
+        splitter: Optional[LineSplitter] = None,
+    ) -> int:
+        """Write the pieces split by `LineSplitter` to the incomplete line
+        `last_line`.
+
+        If `lock` is `True`, `__last_line_lock` is acquired when the incomplete line
+        is replaced (a line is completed or broken), so `read()` would not see a
+        half-updated line. Appending text to the incomplete line does not need the
+        lock. If `splitter` is specified, it is the splitter producing `pieces`, and
+        used for completing the incomplete line. Otherwise, the pieces are split by
+        the mirror, and the first piece is directly appended to the incomplete line.
+
+        This method is private and should not be used by users.
+        """
+        max_length = self.max_line_length
+        if lock and (
+            len(pieces) > 1
+            or (
+                max_length is not None
+                and last_line.tell() + len(pieces[0]) > max_length
+            )
+        ):
+            with self.__last_line_lock:
+                return self.__write_pieces(last_line, pieces, splitter=splitter)
+        if len(pieces) > 1:
+            if splitter is not None:
+                pieces[0] = splitter.complete_line(last_line.getvalue(), pieces[0])
+            else:
+                pieces[0] = last_line.getvalue() + pieces[0]
+            rest = pieces.pop()
+            last_line.seek(0, os.SEEK_SET)
+            last_line.truncate(0)
+            if max_length is not None:
+                pieces = self.__break_lines(pieces, max_length)
+            self.parse_lines(pieces)
+            if max_length is not None and len(rest) > max_length:
+                return self.__write_overflow(last_line, rest, max_length)
+            return last_line.write(rest)
+        if max_length is not None and last_line.tell() + len(pieces[0]) > max_length:
+            return self.__write_overflow(last_line, pieces[0], max_length)
+        return last_line.write(pieces[0])
+
+    def __write_terminal(
+        self, last_line: io.StringIO, data: str, lock: bool = False
+    ) -> int:
+        """The `write()` method of the terminal semantics.
+
+        If `lock` is `True`, `__last_line_lock` is acquired when the incomplete line
+        may be rewritten in place or replaced.
+
+        This method is private and should not be used by users.
+        """
+        if lock and ("\r" in data or "\n" in data or self.max_line_length is not None):
+            with self.__last_line_lock:
+                return self.__write_terminal(last_line, data)
+        lines = write_terminal_lines(last_line, data)
+        max_length = self.max_line_length
+        pieces: List[str] = list()
+        if max_length is not None:
+            value = last_line.getvalue()
+            if len(value) > max_length:
+                pieces = break_long_line(value, max_length)
+                last_line.seek(0, os.SEEK_SET)
+                last_line.truncate(0)
+                last_line.write(pieces.pop())
+        if not lines and not pieces:
+            return len(data)
+        if max_length is not None:
+            lines = self.__break_lines(lines, max_length)
+            self.__n_overflows += len(pieces)
+            lines.extend(pieces)
+        self.parse_lines(lines)
+        return len(data)
+
+    def __break_lines(self, lines: Sequence[str], max_length: int) -> List[str]:
+        """Break the lines longer than `max_length`, and count the forced breaks.
+
+        This method is private and should not be used by users.
+        """
+        res: List[str] = list()
+        for line in lines:
+            if len(line) > max_length:
+                pieces = break_long_line(line, max_length)
+                self.__n_overflows += len(pieces) - 1
+                res.extend(pieces)
+            else:
+                res.append(line)
+        return res
+
+    def __write_overflow(
+        self, last_line: io.StringIO, data: str, max_length: int
+    ) -> int:
+        """Write `data` to the incomplete line `last_line`, and force line breaks
+        because the line becomes longer than `max_length`.
+
+        This method is private and should not be used by users.
+        """
+        pieces = break_long_line(last_line.getvalue() + data, max_length)
+        rest = pieces.pop()
+        last_line.seek(0, os.SEEK_SET)
+        last_line.truncate(0)
+        self.__n_overflows += len(pieces)
+        self.parse_lines(pieces)
+        return last_line.write(rest)
 
     def write(self, data: str) -> int:
         """Write the records.
@@ -333,12 +1830,66 @@ class _LineBuffer(Generic[T]):
         #1: `int`
             Number of lines that have been written.
         """
+        if self.__per_thread:
+            if self.last_line.closed:
+                raise OSError("syncstream: The stream cannot be write now.")
+            last_line, splitter = self.__thread_line()
+            if self.__terminal:
+                return self.__write_terminal(last_line, data, lock=True)
+            return self.__write_pieces(
+                last_line, splitter.split(data), lock=True, splitter=splitter
+            )
+
         if not self.writable():
             raise OSError("syncstream: The stream cannot be write now.")
 
         with self.__last_line_lock:
+            if self.__terminal:
+                return self.__write_terminal(self.last_line, data)
             return self.__write(data)
 
+    def write_lines(self, lines: Sequence[str], rest: str = "") -> int:
+        R"""Write the lines which have been split.
+
+        This method is equivalent to
+        ```python
+        self.write("\n".join(lines) + "\n" + rest)
+        ```
+        but the data is not split again. It is used for receiving the lines split by
+        the mirrors. The first line continues the current incomplete line, and `rest`
+        is appended to the incomplete line. The terminal mode is not applied, but
+        `max_line_length` is still checked.
+
+        Arguments
+        ---------
+        lines: `[str]`
+            The completed lines. Each line should not contain line breaks.
+
+        rest: `str`
+            The incomplete line after the completed lines.
+
+        Returns
+        -------
+        #1: `int`
+            Number of lines that have been stored.
+        """
+        pieces = list(lines)
+        n_lines = len(pieces)
+        pieces.append(str(rest))
+        if self.__per_thread:
+            if self.last_line.closed:
+                raise OSError("syncstream: The stream cannot be write now.")
+            last_line, _ = self.__thread_line()
+            self.__write_pieces(last_line, pieces, lock=True)
+            return n_lines
+
+        if not self.writable():
+            raise OSError("syncstream: The stream cannot be write now.")
+
+        with self.__last_line_lock:
+            self.__write_pieces(self.last_line, pieces)
+        return n_lines
+
 
 class LineBuffer(_LineBuffer[str], contextlib.AbstractContextManager):
     """The threading-based line-based buffer handle.
@@ -348,15 +1899,53 @@ class LineBuffer(_LineBuffer[str], contextlib.AbstractContextManager):
     is limited.
     """
 
-    def __init__(self, maxlen: int = 20) -> None:
+    def __init__(
+        self,
+        maxlen: int = 20,
+        per_thread: bool = False,
+        maxbytes: Optional[int] = None,
+        max_line_length: Optional[int] = None,
+        terminal: bool = False,
+        separator: Literal["universal", "newline"] = "universal",
+    ) -> None:
         """Initialization.
 
         Arguments
         ---------
         maxlen: `int`
             The maximal number of stored lines.
+
+        per_thread: `bool`
+            If `True`, each writing thread has its own incomplete line, and the lock
+            is only acquired when a line is completed. It is recommended when many
+            threads print to this buffer at the same time.
+
+        maxbytes: `int | None`
+            The maximal total size (bytes) of the stored lines. The oldest lines are
+            evicted when the budget is exceeded. If `None`, only `maxlen` is used.
+
+        max_line_length: `int | None`
+            The maximal length (characters) of a line. A longer line is broken into
+            several lines. If `None`, the length is not limited.
+
+        terminal: `bool`
+            If `True`, use the terminal semantics: only `\n` completes a line, while
+            `\r` moves the cursor to the line start, so the following text overwrites
+            the incomplete line in place. Suitable for the progress bars.
+
+        separator: `"universal" | "newline"`
+            The separator policy of splitting lines (see `LineSplitter`). Use
+            `"newline"` to only split the lines by `\n`, which is faster.
         """
-        super().__init__(maxlen=maxlen, _data_type=str)
+        super().__init__(
+            maxlen=maxlen,
+            per_thread=per_thread,
+            maxbytes=maxbytes,
+            max_line_length=max_line_length,
+            terminal=terminal,
+            separator=separator,
+            _data_type=str,
+        )
         self.__stdout: Optional[TextIO] = None
         self.__stderr: Optional[TextIO] = None
 
@@ -396,9 +1985,18 @@ class LineProcMirror(contextlib.AbstractContextManager):
         q_maxsize: int = 0,
         aggressive: bool = False,
         timeout: Optional[float] = None,
+        check_every: int = 1,
+        check_period: Optional[float] = None,
+        max_line_length: Optional[int] = None,
+        terminal: bool = False,
+        separator: Literal["universal", "newline"] = "universal",
+        stream_bytes: Optional[int] = None,
+        stream_delay: Optional[float] = None,
+        overflow: Literal["block", "drop-newest", "drop-oldest", "sample"] = "block",
+        overflow_maxlen: int = 64,
+        sample_every: int = 10,
         _queue: Optional[_Queue] = None,
-        _state: Optional[MutableMapping[str, Any]] = None,
-        _state_lock: Optional[_Lock] = None,
+        _stop_flag: Optional[_StopFlag] = None,
     ) -> None:
         """Initialization.
 
@@ -411,12 +2009,76 @@ class LineProcMirror(contextlib.AbstractContextManager):
         aggressive: `bool`
             The aggressive mode. If enabled, each call for the `write()` method would
             trigger the process synchronization. Otherwise, the synchronization would
-            be triggered when a new line is written.
+            be triggered when a new line is written. In the aggressive mode, a write
+            not ending with a line break is held until the next write or `flush()`.
+            If the next write only contains line breaks (e.g. the `"\n"` written by
+            `print()`), both writes are sent by one message, and the event is counted
+            by `n_coalesced`.
 
         timeout: `float | None`
             The timeout of the process syncholizing events. If not set, the
             synchronization would block the current process.
 
+        check_every: `int`
+            Check the stop signal every `check_every` calls of `write()`. Setting `0`
+            disables this rule.
+
+        check_period: `float | None`
+            If set, check the stop signal when `check_period` seconds have passed
+            since the last check, no matter how many times `write()` is called.
+
+        max_line_length: `int | None`
+            The maximal length (characters) of the incomplete line kept by this
+            mirror. If the incomplete line becomes longer than this value, a line
+            break would be forced, and the event is counted by `n_overflows`. If
+            `None`, the length is not limited.
+
+        terminal: `bool`
+            If `True`, use the terminal semantics for the incomplete line kept by this
+            mirror: only `\n` completes a line, while `\r` moves the cursor to the
+            line start. Therefore, refreshing a progress bar does not send any
+            message until the line is completed. Not used in the aggressive mode.
+
+        separator: `"universal" | "newline"`
+            The separator policy of splitting lines (see `LineSplitter`). The
+            completed lines are always sent with `\n` as the separator. Not used in
+            the aggressive mode.
+
+        stream_bytes: `int | None`
+            If set, use the streaming mode. The written data is not split into lines
+            by the mirror. Instead, it is accumulated and sent as one message when
+            its size (bytes) exceeds this value, when `stream_delay` is reached, or
+            when `flush()` is called. The streaming mode overrides the aggressive
+            mode, and the main buffer splits the lines.
+
+        stream_delay: `float | None`
+            If set, use the streaming mode (see `stream_bytes`). The accumulated data
+            is sent after waiting for `stream_delay` seconds.
+
+        overflow: `"block" | "drop-newest" | "drop-oldest" | "sample"`
+            The policy used when the queue is full.
+            - `"block"`: Wait until the queue is available, or raise `queue.Full`
+              after `timeout`.
+            - `"drop-newest"`: Drop the new message.
+            - `"drop-oldest"`: Keep the new message in a local ring of
+              `overflow_maxlen` messages, and drop the oldest message of the ring
+              when it is full. The ring is sent before the next messages once the
+              queue is available.
+            - `"sample"`: Like `"drop-oldest"`, but only keep one of every
+              `sample_every` messages written when the queue is full.
+            Except `"block"`, writing the lines never waits for the queue. The
+            dropped lines and bytes are counted by `n_dropped` and `n_dropped_bytes`,
+            and reported to the main buffer when the mirror is closed. The EOF,
+            error, and warning signals are always sent in the `"block"` policy.
+
+        overflow_maxlen: `int`
+            The maximal number of messages kept by the local ring of the
+            `"drop-oldest"` and `"sample"` policies.
+
+        sample_every: `int`
+            Only used by the `"sample"` policy. One of every `sample_every` messages
+            written when the queue is full is kept.
+
         Private arguments
         -----------------
         _queue: `Queue`
@@ -424,10 +2086,9 @@ class LineProcMirror(contextlib.AbstractContextManager):
             by multiprocessing.Queue(). A recommended way is to set this value by
             `multiprocessing.Manager()`. In this case, `q_maxsize` would not be used.
 
-        _state: `{str: Any} | None`
-        _state_lock: `Lock`
-            Required for getting the buffer states. If not set, would not turn on the
-            stop signal.
+        _stop_flag: `_StopFlag | None`
+            Required for getting the stop signal of the buffer. If not set, would not
+            turn on the stop signal.
         """
         self.__buffer: io.StringIO = io.StringIO()
         self.__buffer_lock_: Optional[threading.RLock] = None
@@ -439,11 +2100,46 @@ class LineProcMirror(contextlib.AbstractContextManager):
         self.__queue: _Queue = (
             multiprocessing.Queue(maxsize=q_maxsize) if _queue is None else _queue
         )
-        self.__state_lock: Optional[_Lock] = None
-        self.__state: Optional[MutableMapping[str, Any]] = dict()
-        if _state is not None and _state_lock is not None:
-            self.__state_lock = _state_lock
-            self.__state = _state
+        self.__stop_flag: Optional[_StopFlag] = _stop_flag
+        self.check_every: int = max(0, int(check_every))
+        self.check_period: Optional[float] = (
+            float(check_period) if check_period is not None else None
+        )
+        self.__n_unchecked: int = 0
+        self.__last_check: float = 0.0
+        self.max_line_length: Optional[int] = (
+            int(max_line_length) if max_line_length is not None else None
+        )
+        self.n_overflows: int = 0
+        self.n_coalesced: int = 0
+        self.__held: Optional[str] = None
+        self.stream_bytes: Optional[int] = (
+            int(stream_bytes) if stream_bytes is not None else None
+        )
+        self.stream_delay: Optional[float] = (
+            float(stream_delay) if stream_delay is not None else None
+        )
+        self.__chunker_: Optional[StreamChunker] = None
+        self.terminal: bool = bool(terminal)
+        self.__splitter: LineSplitter = LineSplitter(separator)
+
+        # Overflow configs
+        if overflow not in ("block", "drop-newest", "drop-oldest", "sample"):
+            raise TypeError(
+                'syncstream: The argument "overflow" should be "block", '
+                '"drop-newest", "drop-oldest", or "sample".'
+            )
+        self.overflow: Literal["block", "drop-newest", "drop-oldest", "sample"] = (
+            overflow
+        )
+        self.overflow_maxlen: int = max(1, int(overflow_maxlen))
+        self.sample_every: int = max(1, int(sample_every))
+        self.n_dropped: int = 0
+        self.n_dropped_bytes: int = 0
+        self.__n_reported: Tuple[int, int] = (0, 0)
+        self.__n_congested: int = 0
+        self.__ring: Deque[Tuple[bytes, int]] = collections.deque()
+        self.__overflow_lock_: Optional[threading.Lock] = None
 
         # stdout/stderr configs
         self.__stdout: Optional[TextIO] = None
@@ -482,6 +2178,38 @@ class LineProcMirror(contextlib.AbstractContextManager):
             self.__buffer_lock_ = threading.RLock()
         return self.__buffer_lock_
 
+    @property
+    def __overflow_lock(self) -> threading.Lock:
+        """The threading lock for the local ring of the overflow policies.
+
+        This lock should not be exposed to users. It is not the buffer lock, because
+        the messages could be also sent by the background thread of the streaming
+        mode.
+        """
+        if self.__overflow_lock_ is None:
+            self.__overflow_lock_ = threading.Lock()
+        return self.__overflow_lock_
+
+    @property
+    def streaming(self) -> bool:
+        """Whether the mirror works in the streaming mode."""
+        return self.stream_bytes is not None or self.stream_delay is not None
+
+    @property
+    def __chunker(self) -> StreamChunker:
+        """The accumulator of the streaming mode.
+
+        It is created when the first data is written, so the mirror could be still
+        passed to the sub-processes before writing.
+        """
+        if self.__chunker_ is None:
+            self.__chunker_ = StreamChunker(
+                self.__send_str,
+                max_bytes=self.stream_bytes,
+                max_delay=self.stream_delay,
+            )
+        return self.__chunker_
+
     @property
     def closed(self) -> bool:
         """Check whether the buffer has been closed."""
@@ -501,10 +2229,7 @@ class LineProcMirror(contextlib.AbstractContextManager):
         with self.__buffer_lock:
             if self.__buffer.closed:
                 return
-        if exc is None:
-            self.send_eof()
-        else:
-            self.send_error(exc)
+        self.__send_close(exc, is_last=True)
         self.clear()
         with self.__buffer_lock:
             self.__buffer.close()
@@ -556,22 +2281,29 @@ class LineProcMirror(contextlib.AbstractContextManager):
 
         This method would clear the temporary buffer of the mirror. If the mirror works
         in the `aggresive` mode, the temporary buffer would not be used. In this case,
-        this method would not exert any influences to the mirror.
+        this method would only discard the write held by the mirror. In the streaming
+        mode, the accumulated data is discarded.
 
         This method is thread-safe. Mirrors in different processes would not share the
         temporary buffer. Note that the shared queue would not be cleared by this
         method.
         """
         with self.__buffer_lock:
+            self.__held = None
+            if self.__chunker_ is not None:
+                self.__chunker_.clear()
             self.__buffer.seek(0, os.SEEK_SET)
             self.__buffer.truncate(0)
 
     def new_line(self) -> None:
         R"""Manually trigger a new line to the buffer. If the current stream is already
         a new line, do nothing.
+
+        In the aggressive mode, the held write is sent without adding a line break.
         """
         with self.__buffer_lock:
-            if self.__buffer.tell() > 0:
+            self.__release()
+            if not is_blank_stream(self.__buffer):
                 self.__write("\n")
 
     @property
@@ -585,38 +2317,146 @@ class LineProcMirror(contextlib.AbstractContextManager):
         self.__timeout = float(timeout) if timeout is not None else None
         self.__block = timeout is None
 
+    def __put(self, dtype: str, data: Any = None, is_last: bool = False) -> None:
+        """Encode the message, and put it in the queue.
+
+        The messages kept by the local ring of the overflow policy are sent first.
+        If `is_last` is set, the message is the last one of the mirror, and it is
+        sent by `put_last()` if the queue provides it.
+
+        This method is private and should not be used by users.
+        """
+        frame = _encode_message(dtype, data)
+        if self.__ring:
+            with self.__overflow_lock:
+                self.__flush_ring(block=True)
+        put = getattr(self.__queue, "put_last", None) if is_last else None
+        if put is None:
+            put = self.__queue.put
+        put(frame, block=self.__block, timeout=self.__timeout)
+
+    def __put_data(self, dtype: str, data: Any) -> None:
+        """Encode the `"str"` or `"lines"` message, and put it in the queue by the
+        overflow policy.
+
+        This method is private and should not be used by users.
+        """
+        if self.overflow == "block":
+            self.__put(dtype, data)
+            return
+        frame = _encode_message(dtype, data)
+        with self.__overflow_lock:
+            if self.__flush_ring(block=False):
+                try:
+                    self.__queue.put(frame, block=False)
+                    self.__n_congested = 0
+                    return
+                except queue.Full:
+                    pass
+            if dtype == "str":
+                n_lines = len(data.splitlines()) or 1
+            else:
+                n_lines = len(data[0]) + (1 if data[1] else 0)
+            self.__n_congested += 1
+            if self.overflow == "drop-newest" or (
+                self.overflow == "sample"
+                and (self.__n_congested - 1) % self.sample_every != 0
+            ):
+                self.__drop(frame, n_lines)
+                return
+            ring = self.__ring
+            if len(ring) >= self.overflow_maxlen:
+                self.__drop(*ring.popleft())
+            ring.append((frame, n_lines))
+
+    def __flush_ring(self, block: bool) -> bool:
+        """Send the messages kept by the local ring of the overflow policy without
+        lock.
+
+        Arguments
+        ---------
+        block: `bool`
+            If `True`, use the blocking policy of the mirror. Otherwise, stop
+            sending once the queue is full.
+
+        Returns
+        -------
+        #1: `bool`
+            `True` if the ring is empty.
+
+        This method is private and should not be used by users.
+        """
+        ring = self.__ring
+        while ring:
+            if block:
+                self.__queue.put(ring[0][0], block=self.__block, timeout=self.__timeout)
+            else:
+                try:
+                    self.__queue.put(ring[0][0], block=False)
+                except queue.Full:
+                    return False
+            ring.popleft()
+        return True
+
+    def __drop(self, frame: bytes, n_lines: int) -> None:
+        """Count a dropped message.
+
+        This method is private and should not be used by users.
+        """
+        self.n_dropped += n_lines
+        self.n_dropped_bytes += len(frame) - _FRAME_HEADER.size
+
+    def __send_dropped(self) -> None:
+        """Report the lines and bytes dropped since the last report to the main
+        buffer.
+
+        This method is private and should not be used by users.
+        """
+        n_lines, n_bytes = self.__n_reported
+        n_lines = self.n_dropped - n_lines
+        n_bytes = self.n_dropped_bytes - n_bytes
+        if n_lines > 0 or n_bytes > 0:
+            self.__put("dropped", (n_lines, n_bytes))
+            self.__n_reported = (self.n_dropped, self.n_dropped_bytes)
+
     def send_eof(self) -> None:
         """Send an EOF signal to the main buffer.
 
-        The EOF signal is used for telling the main buffer stop to wait. Note that this
+        The EOF signal is used for telling the main buffer stop to wait. It carries
+        the PID of the current process, so the main buffer knows that the process
+        watched by `LineProcBuffer.watch()` has closed its mirror. Note that this
         method would not close the queue. The mirror could be reused for another
         program.
         """
-        with self.__buffer_lock:
-            if self.__buffer.closed:
-                return
-
-        self.new_line()
-        self.__queue.put(
-            {"type": "close", "data": None}, block=self.__block, timeout=self.__timeout
-        )
+        self.__send_close()
 
     def send_error(self, obj_err: BaseException) -> None:
         """Send the error object to the main buffer.
 
         The error object would be captured as an item of the storage in the main
-        buffer.
+        buffer. Like `send_eof()`, the error ends this mirror, so it is followed by an
+        EOF signal.
+        """
+        self.__send_close(obj_err)
+
+    def __send_close(
+        self, obj_err: Optional[BaseException] = None, is_last: bool = False
+    ) -> None:
+        """Send the EOF signal, after the error object if `obj_err` is not None.
+
+        If `is_last` is set, the EOF signal is the last message of the mirror.
+
+        This method is private and should not be used by users.
         """
         with self.__buffer_lock:
             if self.__buffer.closed:
                 return
 
         self.new_line()
-        self.__queue.put(
-            {"type": "error", "data": GroupedMessage(obj_err)},
-            block=self.__block,
-            timeout=self.__timeout,
-        )
+        self.__send_dropped()
+        if obj_err is not None:
+            self.__put("error", GroupedMessage(obj_err))
+        self.__put("close", os.getpid(), is_last=is_last)
 
     def send_warning(self, obj_warn: Warning) -> None:
         """Send the warning object to the main buffer.
@@ -628,42 +2468,83 @@ class LineProcMirror(contextlib.AbstractContextManager):
             if self.__buffer.closed:
                 return
 
-        self.new_line()
-        self.__queue.put(
-            {"type": "warning", "data": GroupedMessage(obj_warn)},
-            block=self.__block,
-            timeout=self.__timeout,
-        )
+        self.new_line()
+        self.__put("warning", GroupedMessage(obj_warn))
+
+    def send_data(self, data: str) -> None:
+        """Send the data to the main buffer.
+
+        This method is equivalent to call the main buffer (LineProcBuffer) by the
+        following method protected by process-safe synchronization:
+
+        ```python
+        pbuf.write(data)
+        ```
+
+        This method is used by other methods implicitly, and should not be used by users.
+
+        Arguments
+        ---------
+        data: `str`
+            A str to be sent to the main buffer.
+        """
+        with self.__buffer_lock:
+            if self.__buffer.closed:
+                return
+
+        self.__send_str(data)
+
+    def __send_str(self, data: str) -> None:
+        """Send the str data without checking the buffer state.
 
-    def send_data(self, data: str) -> None:
-        """Send the data to the main buffer.
+        This method does not acquire the lock, so it could be used by the background
+        thread of the streaming mode.
+
+        This method is private and should not be used by users.
+        """
+        self.__put_data("str", data)
+
+    def send_lines(self, lines: Sequence[str], rest: str = "") -> None:
+        """Send the split lines to the main buffer.
 
         This method is equivalent to call the main buffer (LineProcBuffer) by the
         following method protected by process-safe synchronization:
 
         ```python
-        pbuf.write(data)
+        pbuf.write_lines(lines, rest)
         ```
 
+        Different from `send_data()`, the lines have been split by the mirror, so
+        the main buffer will store them without splitting them again.
+
         This method is used by other methods implicitly, and should not be used by users.
 
         Arguments
         ---------
-        data: `str`
-            A str to be sent to the main buffer.
+        lines: `[str]`
+            The completed lines (without line breaks) to be sent to the main buffer.
+
+        rest: `str`
+            The incomplete line after the completed lines.
         """
         with self.__buffer_lock:
             if self.__buffer.closed:
                 return
 
-        self.__queue.put(
-            {"type": "str", "data": data}, block=self.__block, timeout=self.__timeout
-        )
+        self.__put_data("lines", (lines, rest))
 
     def flush(self) -> None:
-        """Flush the current written line stream."""
+        """Flush the current written line stream.
+
+        In the aggressive mode, the held write would be sent to the main buffer. The
+        messages kept by the overflow policy are sent if the queue is available.
+        """
         with self.__buffer_lock:
+            self.__release()
             self.__buffer.flush()
+        if self.__ring:
+            with self.__overflow_lock:
+                self.__flush_ring(block=False)
 
     def read(self, size: Optional[int] = None) -> str:
         """Read the current buffer.
@@ -687,42 +2568,130 @@ class LineProcMirror(contextlib.AbstractContextManager):
             else:
                 return self.__buffer.read(size)
 
+    def __check_stop(self) -> None:
+        """Check the stop signal, and raise `StopIteration` if the signal is set.
+
+        The check only happens when the rules of `check_every` or `check_period` are
+        met.
+
+        This method is private and should not be used by users.
+        """
+        if self.__stop_flag is None:
+            return
+        self.__n_unchecked += 1
+        if self.check_every > 0 and self.__n_unchecked >= self.check_every:
+            pass
+        elif self.check_period is not None:
+            if time.monotonic() - self.__last_check < self.check_period:
+                return
+        else:
+            return
+        self.__n_unchecked = 0
+        if self.check_period is not None:
+            self.__last_check = time.monotonic()
+        if self.__stop_flag.is_set():
+            raise StopIteration("syncstream: The sub-process is terminated by users.")
+
     def __write(self, data: str) -> int:
         """The `write()` method without lock.
 
         This method is private and should not be used by users.
         """
-        try:
-            if self.__state_lock is not None:
-                with self.__state_lock:
-                    is_closed = (
-                        self.__state.get("closed", False) if self.__state else False
-                    )
-                    if is_closed:
-                        raise StopIteration(
-                            "syncstream: The sub-process is terminated by users."
-                        )
-        except queue.Empty:
-            pass
-        message_lines = data.splitlines()
+        self.__check_stop()
+        if self.streaming:
+            return self.__chunker.write(data)
         if self.aggressive:
-            self.send_data(data=data)
+            return self.__write_aggressive(data)
+        if self.terminal:
+            return self.__write_terminal(data)
+        pieces = self.__splitter.split(data)
+        if len(pieces) > 1:  # A new line is triggerred.
+            # Send the split lines, so the main buffer does not split them again.
+            pieces[0] = self.__splitter.complete_line(
+                self.__buffer.getvalue(), pieces[0]
+            )
+            self.__buffer.seek(0, os.SEEK_SET)
+            self.__buffer.truncate(0)
+            rest = pieces.pop()
+            if rest.endswith("\r"):
+                # The `\r` may be the first half of `\r\n`, keep it in the mirror.
+                self.__buffer.write(rest)
+                rest = ""
+            self.send_lines(lines=pieces, rest=rest)
             return len(data)
-        n_lines = len(message_lines)
-        if (
-            n_lines > 1
-            or (n_lines == 1 and message_lines[0] == "")
-            or is_end_line_break(data)
-        ):  # A new line is triggerred.
-            res = self.__buffer.write(data)
-            self.send_data(data=self.__buffer.getvalue())
+        data = pieces[0]
+        max_length = self.max_line_length
+        if max_length is not None and self.__buffer.tell() + len(data) > max_length:
+            # Send the completed pieces of the overlong line.
+            pieces = break_long_line(self.__buffer.getvalue() + data, max_length)
+            rest = pieces.pop()
+            self.n_overflows += len(pieces)
+            self.send_lines(lines=pieces)
             self.__buffer.seek(0, os.SEEK_SET)
             self.__buffer.truncate(0)
-            return res
-        elif n_lines == 1:
-            return self.__buffer.write(data)
-        else:
+            self.__buffer.write(rest)
+            return len(data)
+        return self.__buffer.write(data)
+
+    def __write_aggressive(self, data: str) -> int:
+        """The `write()` method of the aggressive mode without lock.
+
+        A write not ending with a line break is held. If the next write only contains
+        line breaks, it is merged with the held write, so `print()` only sends one
+        message.
+
+        This method is private and should not be used by users.
+        """
+        if not data:
             return 0
+        held = self.__held
+        if held is not None:
+            self.__held = None
+            if not data.strip("\r\n"):
+                self.n_coalesced += 1
+                self.send_data(data=held + data)
+                return len(data)
+            self.send_data(data=held)
+        if data[-1] in "\r\n":
+            self.send_data(data=data)
+        else:
+            self.__held = data
+        return len(data)
+
+    def __release(self) -> None:
+        """Send the write held by the aggressive mode, and the data accumulated by
+        the streaming mode without lock.
+
+        This method is private and should not be used by users.
+        """
+        held = self.__held
+        if held is not None:
+            self.__held = None
+            self.send_data(data=held)
+        if self.__chunker_ is not None:
+            self.__chunker_.flush()
+
+    def __write_terminal(self, data: str) -> int:
+        """The `write()` method of the terminal semantics without lock.
+
+        Only the completed lines are sent to the main buffer.
+
+        This method is private and should not be used by users.
+        """
+        lines = write_terminal_lines(self.__buffer, data)
+        max_length = self.max_line_length
+        if max_length is not None:
+            value = self.__buffer.getvalue()
+            if len(value) > max_length:
+                pieces = break_long_line(value, max_length)
+                self.__buffer.seek(0, os.SEEK_SET)
+                self.__buffer.truncate(0)
+                self.__buffer.write(pieces.pop())
+                self.n_overflows += len(pieces)
+                lines.extend(pieces)
+        if lines:
+            self.send_lines(lines=lines)
+        return len(data)
 
     def write(self, data: str) -> int:
         """Write the stream.
@@ -766,41 +2735,261 @@ class LineProcBuffer(_LineBuffer[GroupedMessage]):
     if __name__ == '__main__':
         pbuf = LineProcBuffer(maxlen=10)
         with multiprocessing.Pool(4) as p:
-            p.map_async(f, tuple(pbuf.mirror for _ in range(4)))
+            res = p.map_async(f, tuple(pbuf.mirror for _ in range(4)))
             pbuf.wait()
+            res.wait()
         print(pbuf.read())
     ```
+
+    Note that the result of `map_async()` needs to be waited before leaving the
+    `with` block of the pool. The mirrors close as soon as the workers finish
+    writing, so `pbuf.wait()` may return before the pool has collected the results,
+    and `Pool.terminate()` called by leaving the block could be deadlocked.
+
+    If the mirrors are passed to the sub-processes through inheritance, the `"pipe"`
+    transport could be used for skipping the `multiprocessing.Manager()` server:
+    ```python
+    if __name__ == '__main__':
+        pbuf = LineProcBuffer(maxlen=10, transport="pipe")
+        procs = [
+            multiprocessing.Process(target=f, args=(pbuf.mirror,)) for _ in range(4)
+        ]
+        for proc in procs:
+            proc.start()
+        pbuf.wait()
+    ```
+
+    For the high-volume messages in the same host, the `"shm"` transport could be
+    used in the same way as the `"pipe"` transport. Each mirror writes the messages
+    to its own ring in the shared memory, so the messages of the lines do not need
+    to be pickled.
+
+    If a sub-process may be killed before closing its mirror, watch it by
+    `pbuf.watch(proc)` after starting it. Otherwise, `wait()` would wait for its
+    mirror forever.
     """
 
-    def __init__(self, maxlen: int = 20) -> None:
+    def __init__(
+        self,
+        maxlen: int = 20,
+        transport: Literal["manager", "pipe", "shm"] = "manager",
+        maxbytes: Optional[int] = None,
+        max_line_length: Optional[int] = None,
+        terminal: bool = False,
+        separator: Literal["universal", "newline"] = "universal",
+        stream_bytes: Optional[int] = None,
+        stream_delay: Optional[float] = None,
+        ring_size: int = 1 << 20,
+        overflow: Literal["block", "drop-newest", "drop-oldest", "sample"] = "block",
+        q_maxsize: int = 0,
+        overflow_maxlen: int = 64,
+        sample_every: int = 10,
+    ) -> None:
         """Initialization.
 
         Arguments
         ---------
         maxlen: `int`
             The maximal number of stored lines.
+
+        transport: `"manager" | "pipe" | "shm"`
+            The way of delivering messages from the mirrors to this buffer.
+            - `"manager"`: Use a queue provided by `multiprocessing.Manager()`. The
+              mirror could be passed to the sub-processes by any means, including
+              the arguments of `multiprocessing.Pool.map()`. However, each message
+              needs to be forwarded by the manager server process.
+            - `"pipe"`: Use a `multiprocessing.Pipe` shared by all mirrors. The
+              messages are sent to this buffer directly. The mirror should be only
+              passed to the sub-processes through inheritance, for example, the
+              arguments of `multiprocessing.Process`.
+            - `"shm"`: Each access of `self.mirror` creates a new mirror owning a
+              single-producer/single-consumer ring in the shared memory. The lines
+              are written to the ring as UTF-8 records, and this buffer scans all
+              rings. Like `"pipe"`, the mirror should be only passed to the
+              sub-processes through inheritance. Requires python>=3.8.
+
+        maxbytes: `int | None`
+            The maximal total size (bytes) of the stored records. The oldest records
+            are evicted when the budget is exceeded. If `None`, only `maxlen` is used.
+
+        max_line_length: `int | None`
+            The maximal length (characters) of a line. A longer line is broken into
+            several lines. The limit is also applied to the incomplete lines kept by
+            the mirrors. If `None`, the length is not limited.
+
+        terminal: `bool`
+            If `True`, use the terminal semantics: only `\n` completes a line, while
+            `\r` moves the cursor to the line start. The mirrors also use this mode,
+            so refreshing a progress bar in the sub-processes does not send messages
+            until the line is completed.
+
+        separator: `"universal" | "newline"`
+            The separator policy of splitting lines (see `LineSplitter`). The mirrors
+            also use this policy.
+
+        stream_bytes: `int | None`
+            If set, the mirrors use the streaming mode. The data written to a mirror
+            is sent as one message when its size (bytes) exceeds this value, and
+            this buffer splits the lines.
+
+        stream_delay: `float | None`
+            If set, the mirrors use the streaming mode, and the data written to a
+            mirror waits for at most `stream_delay` seconds before being sent.
+
+        ring_size: `int`
+            Only used by the `"shm"` transport. The size (bytes) of the ring owned
+            by each mirror. If the ring is full, the mirror waits until this buffer
+            receives the messages. Since each access of `mirror` creates a new ring,
+            the shared memory costs `ring_size` bytes per mirror, until the mirror
+            is closed by `LineProcMirror.close()` (e.g. leaving its context).
+
+        overflow: `"block" | "drop-newest" | "drop-oldest" | "sample"`
+            The policy used by the mirrors when the queue is full (see
+            `LineProcMirror`). The lines dropped by the mirrors are counted by
+            `n_dropped` and `n_dropped_bytes` of this buffer when the mirrors are
+            closed.
+
+        q_maxsize: `int`
+            Only used by the `"manager"` and `"pipe"` transports. The maximal number
+            of messages not received by this buffer yet. Use 0 means no limitation.
+            If `overflow` is not `"block"`, 0 is replaced by 64, since the mirrors
+            need a bounded queue for finding that this buffer falls behind. The
+            `"shm"` transport is limited by `ring_size`.
+
+        overflow_maxlen: `int`
+            The maximal number of messages kept by each mirror for the
+            `"drop-oldest"` and `"sample"` policies.
+
+        sample_every: `int`
+            Only used by the `"sample"` policy. One of every `sample_every` messages
+            written when the queue is full is kept.
         """
-        super().__init__(maxlen=maxlen, _data_type=GroupedMessage)
-        self.__manager = multiprocessing.Manager()
-        self.__state = self.__manager.dict(closed=False)
-        self.__state_lock: _Lock = self.__manager.Lock()  # pylint: disable=no-member
-        self.__mirror: LineProcMirror = LineProcMirror(
-            q_maxsize=2 * int(maxlen),
-            aggressive=False,
-            timeout=None,
-            _queue=self.__manager.Queue(),
-            _state=self.__state,
-            _state_lock=self.__state_lock,
+        super().__init__(
+            maxlen=maxlen,
+            maxbytes=maxbytes,
+            max_line_length=max_line_length,
+            terminal=terminal,
+            separator=separator,
+            _data_type=GroupedMessage,
         )
-        self.n_mirrors: int = 0
+        if transport not in ("manager", "pipe", "shm"):
+            raise TypeError(
+                'syncstream: The argument "transport" should be "manager", "pipe", '
+                'or "shm".'
+            )
+        if transport == "shm" and shared_memory is None:
+            raise TypeError(
+                'syncstream: The "shm" transport requires the shared memory '
+                "(python>=3.8)."
+            )
+        if overflow not in ("block", "drop-newest", "drop-oldest", "sample"):
+            raise TypeError(
+                'syncstream: The argument "overflow" should be "block", '
+                '"drop-newest", "drop-oldest", or "sample".'
+            )
+        self.__transport: Literal["manager", "pipe", "shm"] = transport
+        self.overflow: Literal["block", "drop-newest", "drop-oldest", "sample"] = (
+            overflow
+        )
+        self.q_maxsize: int = max(0, int(q_maxsize))
+        if overflow != "block" and self.q_maxsize == 0:
+            self.q_maxsize = _OVERFLOW_Q_MAXSIZE
+        self.overflow_maxlen: int = int(overflow_maxlen)
+        self.sample_every: int = int(sample_every)
+        self.n_dropped: int = 0
+        self.n_dropped_bytes: int = 0
+        self.ring_size: int = int(ring_size)
+
+        # To be created when the first mirror is requested.
+        self.__manager: Optional[multiprocessing.managers.SyncManager] = None
+        self.__channel: Optional[_ShmChannel] = None
+        self.__stop_flag: Optional[_StopFlag] = None
+        self.__mirror_: Optional[LineProcMirror] = None
+        self.__transport_lock: threading.Lock = threading.Lock()
+
         self.__maxlen: int = int(maxlen)
+        self.stream_bytes: Optional[int] = (
+            int(stream_bytes) if stream_bytes is not None else None
+        )
+        self.stream_delay: Optional[float] = (
+            float(stream_delay) if stream_delay is not None else None
+        )
+        self.n_mirrors: int = 0
         self.__config_lock: threading.Lock = threading.Lock()
+        self.__receiver: Optional[threading.Thread] = None
+        self.__receiver_stop: Optional[threading.Event] = None
+        self.__receiver_done: bool = False
+        self.__watched: Dict[int, Tuple[Any, Union[int, Any]]] = dict()
+        self.__closed_pids: Set[int] = set()
 
     @property
     def maxlen(self) -> int:
         """The maximal length (number of lines) of the buffer."""
         return self.__maxlen
 
+    @property
+    def transport(self) -> Literal["manager", "pipe", "shm"]:
+        """The way of delivering messages from the mirrors to this buffer."""
+        return self.__transport
+
+    @property
+    def __mirror(self) -> LineProcMirror:
+        """The mirror whose queue is used for receiving the messages.
+
+        The transport (including the `multiprocessing.Manager()` server) is created
+        when this mirror is accessed for the first time, so a buffer that is never
+        handed to the mirrors does not pay the cost.
+
+        This property is private and should not be used by users.
+        """
+        mirror = self.__mirror_
+        if mirror is None:
+            with self.__transport_lock:
+                mirror = self.__mirror_
+                if mirror is None:
+                    mirror = self.__new_mirror()
+                    self.__mirror_ = mirror
+        return mirror
+
+    def __new_mirror(self) -> LineProcMirror:
+        """Create a new mirror with a new message channel.
+
+        This method is private and should not be used by users.
+        """
+        if self.__transport == "manager" and self.__manager is None:
+            self.__manager = multiprocessing.Manager()
+        if self.__stop_flag is None:
+            self.__stop_flag = _StopFlag(manager=self.__manager)
+        if self.__manager is not None:
+            return self.__create_mirror(self.__manager.Queue(self.q_maxsize))
+        if self.__transport == "shm":
+            # The ring of this mirror is only used for the signals sent by this
+            # buffer, so it could be small.
+            self.__channel = _ShmChannel(self.ring_size)
+            return self.__create_mirror(self.__channel.new_queue(size=4096))
+        return self.__create_mirror(_PipeQueue(self.q_maxsize))
+
+    def __create_mirror(self, mqueue: _Queue) -> LineProcMirror:
+        """Create a new mirror using the message queue `mqueue`.
+
+        This method is private and should not be used by users.
+        """
+        return LineProcMirror(
+            q_maxsize=2 * int(self.maxlen),
+            aggressive=False,
+            timeout=None,
+            max_line_length=self.max_line_length,
+            terminal=self.terminal,
+            separator=self.separator,
+            stream_bytes=self.stream_bytes,
+            stream_delay=self.stream_delay,
+            overflow=self.overflow,
+            overflow_maxlen=self.overflow_maxlen,
+            sample_every=self.sample_every,
+            _queue=mqueue,
+            _stop_flag=self.__stop_flag,
+        )
+
     @property
     def mirror(self) -> LineProcMirror:
         """Get the mirror of this buffer.
@@ -808,24 +2997,74 @@ class LineProcBuffer(_LineBuffer[GroupedMessage]):
         The buffer should not be used in sub-processes directly. Use `self.mirror` to
         provide the process-safe mirror of the buffer.
 
-        This property could not be modified after the initialization.
+        This property could not be modified after the initialization. If the
+        transport is `"shm"`, each access returns a new mirror owning its own ring,
+        which costs `ring_size` bytes of the shared memory until the mirror is closed
+        by `LineProcMirror.close()`. The transport is created when this property is
+        accessed for the first time.
         """
+        mirror = self.__mirror
         self.n_mirrors += 1
-        return self.__mirror
+        self.__receiver_done = False
+        if self.__channel is not None:
+            return self.__create_mirror(self.__channel.new_queue())
+        return mirror
+
+    def watch(
+        self, *processes: Union[multiprocessing.process.BaseProcess, int]
+    ) -> None:
+        """Watch the processes using the mirrors of this buffer.
+
+        If a watched process exits before closing its mirror (for example, killed by
+        the OOM killer), its mirror is counted as closed, and an error is stored in
+        this buffer. Therefore, `wait()` would not wait for the dead process. The
+        receiver waits for the messages and the exits of the processes together.
+
+        Each watched process is assumed to use one mirror.
+
+        Arguments
+        ---------
+        processes: `multiprocessing.Process | int`
+            The started processes, or their PIDs. Watching a PID requires
+            `os.pidfd_open()` (Linux, python>=3.9), and the PID does not need to be
+            a child process.
+        """
+        for proc in processes:
+            if isinstance(proc, int):
+                pidfd_open = getattr(os, "pidfd_open", None)
+                if pidfd_open is None:
+                    raise TypeError(
+                        "syncstream: Watching a PID requires os.pidfd_open(). Use "
+                        "the process object instead."
+                    )
+                self.__watched[proc] = (pidfd_open(proc), proc)
+            else:
+                if proc.pid is None:
+                    raise ValueError(
+                        "syncstream: The process should be started before being "
+                        "watched."
+                    )
+                self.__watched[proc.pid] = (proc.sentinel, proc)
+        if self.receiving:  # Let the receiver wait for the new processes.
+            getattr(self.__mirror, "_LineProcMirror__queue").put(
+                _encode_message("wakeup")
+            )
 
     def stop_all_mirrors(self) -> None:
         """Send stop signals to all mirrors.
 
         This operation is used for terminating the sub-processes safely. It does not
         guarantee that the processes would be closed instantly. Each time when the new
-        message is written by the sub-processes, a check would be triggered.
+        message is written by the sub-processes, a check would be triggered. The check
+        only reads a shared flag, and its frequency could be further reduced by the
+        `check_every` and `check_period` properties of the mirror.
 
         If users want to use this method, please ensure that the StopIteration error
         is catched by the process. The error would not be catched automatically. If
         users do not catch the error, the main process would stuck at `wait()`.
         """
-        with self.__state_lock:
-            self.__state["closed"] = True
+        if self.__stop_flag is not None:
+            self.__stop_flag.set()
 
     def reset_states(self) -> None:
         """Reset the states of the buffer.
@@ -840,18 +3079,14 @@ class LineProcBuffer(_LineBuffer[GroupedMessage]):
                 "force_stop() method."
             )
 
-        with self.__state_lock:
-            self.__state.clear()
-            self.__state["closed"] = False
+        if self.__stop_flag is not None:
+            self.__stop_flag.clear()
+        self.__receiver_done = False
+        self.__closed_pids.clear()
 
-        self.__mirror: LineProcMirror = LineProcMirror(
-            q_maxsize=2 * self.__maxlen,
-            aggressive=False,
-            timeout=None,
-            _queue=self.__manager.Queue(),
-            _state=self.__state,
-            _state_lock=self.__state_lock,
-        )
+        # The new message channel is created when it is requested.
+        with self.__transport_lock:
+            self.__mirror_ = None
 
     def __check_close(self) -> bool:
         """Check whether to finish the `wait()` method.
@@ -884,9 +3119,39 @@ class LineProcBuffer(_LineBuffer[GroupedMessage]):
         Recommend that this method should be used when all subprocesses will be
         stopped by `Process.terminate()` or `Process.kill()`.
         """
-        getattr(self.__mirror, "_LineProcMirror__queue").put(
-            {"type": "stop", "data": None}
-        )
+        getattr(self.__mirror, "_LineProcMirror__queue").put(_encode_message("stop"))
+
+    def __apply(self, dtype: str, data: Any) -> bool:
+        """Apply one received message to the buffer.
+
+        This method is private and should not be used by users.
+
+        Note that this method is always triggered in the config_lock.
+        """
+        if dtype == "str":
+            super().write(data)
+            return True
+        elif dtype == "lines":
+            super().write_lines(*data)
+            return True
+        elif dtype in ("error", "warning"):
+            self.storage.append(data)
+            return True
+        elif dtype == "close":
+            if data is not None:
+                self.__closed_pids.add(data)
+            return self.__check_close()
+        elif dtype == "dropped":  # Sent before closing the mirror.
+            n_lines, n_bytes = data
+            self.n_dropped += n_lines
+            self.n_dropped_bytes += n_bytes
+            return True
+        elif dtype == "stop":
+            self.n_mirrors = 0
+            return False
+        elif dtype == "wakeup":  # Sent by `stop()` for waking up the receiver.
+            return True
+        return False
 
     def receive(self) -> bool:
         """Receive one item from the mirror.
@@ -901,30 +3166,400 @@ class LineProcBuffer(_LineBuffer[GroupedMessage]):
             method does not receive any new data even it returns.
         """
         with self.__config_lock:
-            data = getattr(self.__mirror, "_LineProcMirror__queue").get()
-            dtype = data["type"]
-            if dtype == "str":
-                super().write(data["data"])
-                return True
-            elif dtype == "error":
-                obj = data["data"]
-                self.storage.append(obj)
-                return self.__check_close()
-            elif dtype == "warning":
-                obj = data["data"]
-                self.storage.append(obj)
-                return True
-            elif dtype == "close":
-                return self.__check_close()
-            elif dtype == "stop":
-                self.n_mirrors = 0
-                return False
-            return False
+            return self.__receive_one(getattr(self.__mirror, "_LineProcMirror__queue"))
+
+    def __receive_one(self, mqueue: _Queue) -> bool:
+        """Receive one item from the queue, or handle the watched processes that have
+        exited.
+
+        This method is private and should not be used by users.
 
-    def wait(self) -> None:
-        """Wait the mirror until the close signal is received."""
-        while self.receive():
+        Note that this method is always triggered in the config_lock.
+        """
+        if not self.__watched:
+            return self.__apply(*_decode_message(mqueue.get()))
+        waitable = getattr(mqueue, "waitable", None)
+        while True:
+            try:
+                if waitable is None:
+                    # The manager queue could not be waited with the sentinels.
+                    frame = mqueue.get(timeout=0.1)
+                else:
+                    frame = mqueue.get(block=False)
+                return self.__apply(*_decode_message(frame))
+            except queue.Empty:
+                pass
+            watched = tuple(self.__watched.items())
+            if not watched:
+                return self.__apply(*_decode_message(mqueue.get()))
+            handles = [sentinel for _, (sentinel, _) in watched]
+            if waitable is not None:
+                handles.append(waitable)
+            ready = multiprocessing.connection.wait(
+                handles, timeout=None if waitable is not None else 0
+            )
+            exited = [pid for pid, (sentinel, _) in watched if sentinel in ready]
+            if exited:
+                return self.__receive_exited(mqueue, exited)
+
+    def __receive_exited(self, mqueue: _Queue, exited: Sequence[int]) -> bool:
+        """Handle the watched processes that have exited.
+
+        The items in the queue are received first, because the EOF signals sent by
+        the exited processes may be still in the queue.
+
+        This method is private and should not be used by users.
+
+        Note that this method is always triggered in the config_lock.
+        """
+        is_valid = True
+        while True:
+            try:
+                frame = mqueue.get(block=False)
+            except queue.Empty:
+                break
+            if not self.__apply(*_decode_message(frame)):
+                is_valid = False
+        for pid in exited:
+            sentinel, proc = self.__watched.pop(pid)
+            if isinstance(proc, int):
+                os.close(sentinel)  # The PID file descriptor.
+                exitcode = None
+            else:
+                # The sentinel may be ready slightly before the process is reaped.
+                proc.join(1.0)
+                exitcode = proc.exitcode
+            if pid in self.__closed_pids:
+                self.__closed_pids.discard(pid)
+                continue
+            if self.n_mirrors <= 0:
+                continue
+            self.storage.append(
+                GroupedMessage(
+                    ChildProcessError(
+                        "syncstream: The process {0} exited (code: {1}) before "
+                        "closing its mirror.".format(pid, exitcode)
+                    )
+                )
+            )
+            if not self.__check_close():
+                is_valid = False
+        return is_valid
+
+    def receive_batch(self, max_items: int = 64) -> bool:
+        """Receive a batch of items from the mirror.
+
+        This method would wait for one item from the process-safe queue, and then
+        fetch the available items without blocking until `max_items` items are
+        fetched. All items are written in the thread-safe buffer under one lock
+        acquisition.
+
+        Arguments
+        ---------
+        max_items: `int`
+            The maximal number of items fetched by one call.
+
+        Returns
+        -------
+        #1: `bool`
+            `False` if any of the received items is "invalid" (see `receive()`), for
+            example, the close signal of the last mirror.
+        """
+        max_items = max(1, int(max_items))
+        with self.__config_lock:
+            mqueue = getattr(self.__mirror, "_LineProcMirror__queue")
+            is_valid = self.__receive_one(mqueue)
+            messages: List[bytes] = list()
+            while len(messages) < max_items - 1:
+                try:
+                    messages.append(mqueue.get(block=False))
+                except queue.Empty:
+                    break
+            for frame in messages:
+                if not self.__apply(*_decode_message(frame)):
+                    is_valid = False
+            return is_valid
+
+    @property
+    def receiving(self) -> bool:
+        """Whether the background receiver started by `start()` is running."""
+        receiver = self.__receiver
+        return receiver is not None and receiver.is_alive()
+
+    def start(self, max_items: int = 64) -> None:
+        """Start the background receiver.
+
+        The receiver is a daemon thread calling `receive_batch()` until all mirrors
+        are closed, or `stop()` is called. Therefore, the main thread does not need
+        to call `wait()` for receiving the messages, and could do other works. Use
+        `wait()` to join the receiver. If the receiver is running, do nothing.
+
+        Arguments
+        ---------
+        max_items: `int`
+            The maximal number of items fetched by one batch.
+        """
+        if self.receiving:
+            return
+        receiver_stop = threading.Event()
+        self.__receiver_stop = receiver_stop
+        self.__receiver_done = False
+        self.__receiver = threading.Thread(
+            target=self.__run_receiver, args=(receiver_stop, max_items), daemon=True
+        )
+        self.__receiver.start()
+
+    def stop(self, timeout: Optional[float] = None) -> bool:
+        """Stop the background receiver started by `start()`.
+
+        The messages not received yet are kept in the queue, so they could be
+        received by `start()`, `wait()`, or `receive()` later.
+
+        Arguments
+        ---------
+        timeout: `float | None`
+            The maximal waiting time (seconds) for the receiver. If `None`, wait
+            until the receiver quits.
+
+        Returns
+        -------
+        #1: `bool`
+            `True` if the receiver is not running anymore.
+        """
+        receiver = self.__receiver
+        if receiver is None:
+            return True
+        if receiver.is_alive() and self.__receiver_stop is not None:
+            self.__receiver_stop.set()
+            getattr(self.__mirror, "_LineProcMirror__queue").put(
+                _encode_message("wakeup")
+            )
+        receiver.join(timeout)
+        return not receiver.is_alive()
+
+    def __run_receiver(self, receiver_stop: threading.Event, max_items: int) -> None:
+        """The background receiver.
+
+        This method is private and should not be used by users.
+        """
+        while not receiver_stop.is_set():
+            if not self.receive_batch(max_items):
+                self.__receiver_done = True
+                return
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Wait the mirror until the close signal is received.
+
+        If the background receiver is running, or `timeout` is specified, this method
+        would join the background receiver (started when necessary). Otherwise, the
+        messages are received by the current thread. If the background receiver has
+        received the close signals of all mirrors, return instantly.
+
+        Arguments
+        ---------
+        timeout: `float | None`
+            The maximal waiting time (seconds). If `None`, wait until all mirrors
+            are closed.
+
+        Returns
+        -------
+        #1: `bool`
+            `True` if the waiting is finished, i.e. the receiver is not running.
+        """
+        if self.__receiver_done and not self.receiving:
+            return True
+        if timeout is None and not self.receiving:
+            while self.receive():
+                pass
+            return True
+        self.start()
+        receiver = self.__receiver
+        if receiver is not None:
+            receiver.join(timeout)
+        return not self.receiving
+
+    async def receive_async(self, max_items: int = 64) -> bool:
+        """Receive a batch of items from the mirror without blocking the event loop.
+
+        The async version of `receive_batch()`. The reading end of the `"pipe"`
+        transport, or the wake-up pipe of the `"shm"` transport, is registered with
+        `loop.add_reader()` together with the sentinels of the watched processes
+        (see `watch()`), so no thread is used for waiting. The `"manager"` transport
+        does not provide a file descriptor, so it is not supported by this method.
+        For the `"manager"` transport, please use the background receiver (see
+        `start()`) instead.
+
+        The event loop is never blocked by the lock of this buffer. If the lock is
+        held by another thread, e.g. a thread calling `receive()`, this method yields
+        to the loop and tries again later.
+
+        This method should not be used when the background receiver is running, and
+        should not be called concurrently for the same buffer.
+
+        Arguments
+        ---------
+        max_items: `int`
+            The maximal number of items fetched by one call.
+
+        Returns
+        -------
+        #1: `bool`
+            `False` if any of the received items is "invalid" (see `receive()`), for
+            example, the close signal of the last mirror.
+        """
+        if self.receiving:
+            raise TypeError(
+                "syncstream: Should not receive the items asynchronously when the "
+                "background receiver is running."
+            )
+        if self.__transport == "manager":
+            raise TypeError(
+                'syncstream: The "manager" transport could not be waited in the event '
+                'loop. Please use the "pipe" or "shm" transport, or use the '
+                "background receiver."
+            )
+        loop = asyncio.get_running_loop()
+        mqueue = getattr(self.__mirror, "_LineProcMirror__queue")
+        waitable = getattr(mqueue, "waitable")
+        max_items = max(1, int(max_items))
+        wait = 0.0001
+        while True:
+            if not self.__config_lock.acquire(False):
+                # The lock is held by another thread. Do not block the loop.
+                await asyncio.sleep(wait)
+                wait = min(0.05, wait * 2)
+                continue
+            wait = 0.0001
+            try:
+                is_valid = self.__receive_available(mqueue, max_items)
+            finally:
+                self.__config_lock.release()
+            if is_valid is not None:
+                return is_valid
+            handles = [sentinel for sentinel, _ in self.__watched.values()]
+            handles.append(waitable.fileno())
+            await self.__wait_readable(loop, handles)
+
+    def __receive_available(self, mqueue: _Queue, max_items: int) -> Optional[bool]:
+        """Receive the available items, and handle the watched processes that have
+        exited without waiting.
+
+        This method is private and should not be used by users.
+
+        Note that this method is always triggered in the config_lock.
+
+        Arguments
+        ---------
+        mqueue: `_Queue`
+            The queue of the mirrors.
+
+        max_items: `int`
+            The maximal number of items fetched by one call.
+
+        Returns
+        -------
+        #1: `bool | None`
+            `None` if nothing is received. Otherwise, the same as `receive_batch()`.
+        """
+        messages: List[bytes] = list()
+        while len(messages) < max_items:
+            try:
+                messages.append(mqueue.get(block=False))
+            except queue.Empty:
+                break
+        exited: List[int] = list()
+        watched = tuple(self.__watched.items())
+        if watched:
+            ready = multiprocessing.connection.wait(
+                [sentinel for _, (sentinel, _) in watched], timeout=0
+            )
+            exited.extend(pid for pid, (sentinel, _) in watched if sentinel in ready)
+        if not messages and not exited:
+            return None
+        is_valid = True
+        for frame in messages:
+            if not self.__apply(*_decode_message(frame)):
+                is_valid = False
+        if exited and not self.__receive_exited(mqueue, exited):
+            is_valid = False
+        return is_valid
+
+    @staticmethod
+    async def __wait_readable(
+        loop: asyncio.AbstractEventLoop, handles: Sequence[int]
+    ) -> None:
+        """Wait until any of the file descriptors `handles` is readable.
+
+        This method is private and should not be used by users.
+        """
+        future = loop.create_future()
+
+        def on_ready() -> None:
+            if not future.done():
+                future.set_result(None)
+
+        for handle in handles:
+            loop.add_reader(handle, on_ready)
+        try:
+            await future
+        finally:
+            for handle in handles:
+                loop.remove_reader(handle)
+
+    async def wait_async(self) -> bool:
+        """Wait the mirror until the close signal is received without blocking the
+        event loop.
+
+        The async version of `wait()`. The messages are received by
+        `receive_async()`, so the `"manager"` transport is not supported. Use
+        `asyncio.wait_for()` for limiting the waiting time. The messages received
+        before the cancellation are kept.
+
+        Returns
+        -------
+        #1: `bool`
+            `True` if the waiting is finished.
+        """
+        if self.__receiver_done and not self.receiving:
+            return True
+        while await self.receive_async():
             pass
+        return True
+
+    async def follow_async(
+        self, since: int = 0, max_items: int = 64
+    ) -> AsyncIterator[Union[str, GroupedMessage]]:
+        """Follow the buffer in the event loop, like `tail -f`.
+
+        This async generator receives the messages by `receive_async()`, and yields
+        the records stored since the cursor `since` one by one. It stops when all
+        mirrors are closed. Like `receive_async()`, the `"manager"` transport is not
+        supported.
+
+        ```python
+        async for record in pbuf.follow_async():
+            print(record)
+        ```
+
+        Note that the records evicted before being yielded are skipped silently.
+
+        Arguments
+        ---------
+        since: `int`
+            The initial cursor. Use `0` to start from the oldest stored record.
+
+        max_items: `int`
+            The maximal number of items fetched by one call of `receive_async()`.
+        """
+        seq = int(since)
+        is_valid = not (self.__receiver_done and not self.receiving)
+        while True:
+            records, seq, _ = self.read_since(seq)
+            for record in records:
+                yield record
+            if not is_valid:
+                return
+            is_valid = await self.receive_async(max_items)
 
     def write(self, data: str) -> Never:
         """Write the records.
@@ -939,3 +3574,21 @@ class LineProcBuffer(_LineBuffer[GroupedMessage]):
             "syncstream: Should not use this method, use "
             "`self.mirror.write()` for instead."
         )
+
+    def write_lines(self, lines: Sequence[str], rest: str = "") -> Never:
+        """Write the lines which have been split.
+
+        This method should not be used. For instead, please use `self.mirror.write()`.
+
+        Arguments
+        ---------
+        lines: `[str]`
+            The completed lines without line breaks.
+
+        rest: `str`
+            The incomplete line after the completed lines.
+        """
+        raise NotImplementedError(
+            "syncstream: Should not use this method, use "
+            "`self.mirror.write()` for instead."
+        )
@@ -144,6 +144,100 @@ class TestFile:
         for i, item in enumerate(lines):
             log.info("%s", "{0:02d}: {1}".format(i, item))
 
+    def test_file_segment(self) -> None:
+        """Test the segment-file storage of file.LineFileBuffer."""
+        log = logging.getLogger("test_file")
+        fbuf = LineFileBuffer(self.log_path, maxlen=5)
+
+        # Write many lines, including long lines triggering the compaction.
+        for i in range(200):
+            fbuf.write("line{0}: {1}\n".format(i, "x" * (i % 7) * 1000))
+
+        # All records are stored in one file.
+        log_files = [
+            fname for fname in os.listdir(self.log_folder) if fname.endswith(".log")
+        ]
+        assert log_files == ["test-file.log"]
+
+        assert len(fbuf) == 5
+        lines = fbuf.read()
+        assert tuple(line.split(":")[0] for line in lines) == tuple(
+            "line{0}".format(i) for i in range(195, 200)
+        )
+        lines = fbuf.read(2)
+        assert tuple(line.split(":")[0] for line in lines) == ("line198", "line199")
+
+        # Another buffer with a different maxlen would keep the newest records.
+        fbuf_2 = LineFileBuffer(self.log_path, maxlen=3, tmp_id="tmp-2")
+        fbuf_2.write("line200\n")
+        lines = fbuf_2.read()
+        assert tuple(line.split(":")[0] for line in lines) == (
+            "line198",
+            "line199",
+            "line200",
+        )
+
+        for i, item in enumerate(lines):
+            log.info("%s", "{0:02d}: {1}".format(i, item[:20]))
+
+    def test_file_maxbytes(self) -> None:
+        """Test the byte budget of file.LineFileBuffer."""
+        log = logging.getLogger("test_file")
+        fbuf = LineFileBuffer(self.log_path, maxlen=100, maxbytes=16)
+        assert fbuf.maxbytes == 16 and fbuf.nbytes == 0
+
+        fbuf.write("line1\nline2\nline3\n")
+        assert fbuf.nbytes == 15
+        fbuf.write("line4\n")
+        lines = fbuf.read()
+        assert tuple(lines) == ("line2", "line3", "line4") and fbuf.nbytes == 15
+
+        # An oversized line is kept alone.
+        fbuf.write("{0}\n".format("x" * 30))
+        assert fbuf.read() == ("x" * 30,) and fbuf.nbytes == 30
+        file_size = os.path.getsize(self.log_path)
+        fbuf.write("line5\nline6\n")
+        lines = fbuf.read()
+        assert tuple(lines) == ("line5", "line6") and fbuf.nbytes == 10
+        # The data of the evicted records is truncated.
+        assert os.path.getsize(self.log_path) == file_size - 20
+
+        for i, item in enumerate(lines):
+            log.info("%s", "{0:02d}: {1}".format(i, item))
+
+    def test_file_max_line_length(self) -> None:
+        """Test the maximal line length of file.LineFileBuffer."""
+        log = logging.getLogger("test_file")
+        fbuf = LineFileBuffer(self.log_path, maxlen=10, max_line_length=4)
+        fbuf.write("ab")
+        fbuf.write("cdefghij")
+        assert fbuf.read() == ("abcd", "efgh", "ij") and fbuf.n_overflows == 2
+        fbuf.write("k\nlmnopq\nrs")
+        lines = fbuf.read()
+        assert lines == ("abcd", "efgh", "ijk", "lmno", "pq", "rs")
+        assert fbuf.n_overflows == 3
+
+        for i, item in enumerate(lines):
+            log.info("%s", "{0:02d}: {1}".format(i, item))
+
+    def test_file_terminal(self) -> None:
+        """Test the terminal semantics of file.LineFileBuffer."""
+        log = logging.getLogger("test_file")
+        fbuf = LineFileBuffer(self.log_path, maxlen=10, terminal=True)
+        fbuf.write("head\r\n")
+        for i in range(20):
+            fbuf.write("\rprogress: {0:3d}%".format(i))
+        assert fbuf.read() == ("head", "progress:  19%")
+        fbuf.write("\rdone\nabcdef")
+        fbuf.write("\r")
+        assert fbuf.read() == ("head", "doneress:  19%", "abcdef")
+        fbuf.write("XY\n")
+        lines = fbuf.read()
+        assert lines == ("head", "doneress:  19%", "XYcdef")
+
+        for i, item in enumerate(lines):
+            log.info("%s", "{0:02d}: {1}".format(i, item))
+
     def test_file_buffer(self) -> None:
         """Test the file.LineFileBuffer in the single thread mode."""
         log = logging.getLogger("test_file")
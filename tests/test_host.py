@@ -18,6 +18,7 @@ Test scripts of the module `host`.
 import sys
 import time
 import json
+import itertools
 import warnings
 import threading
 import multiprocessing
@@ -484,6 +485,215 @@ class TestHost:
             messages = hreader.read()
             assert len(messages) == 4
 
+    def test_host_batch(self, temp_server: None) -> None:
+        """Test the batching mode of host.LineHostMirror."""
+        log = logging.getLogger("test_host")
+        address = "http://localhost:5000/sync-stream"
+        verify_online(address)
+        log.info("Successfully connect to the remote server.")
+
+        with LineHostReader(address) as hreader:
+            assert hreader.clear()
+
+            # The full batch is sent instantly, the remaining lines are queued.
+            hbuf = LineHostMirror(
+                address=address, batch=True, max_lines=4, max_delay=10.0
+            )
+            for i in range(6):
+                print("Line:", "batch", i, file=hbuf)
+            assert len(hreader.read()) == 4
+            hbuf.flush()
+            assert len(hreader.read()) == 6
+            hbuf.send_eof()
+
+            # The queue is sent by the background flusher after the delay. The
+            # urgent warning jumps the queue.
+            assert hreader.clear()
+            hbuf = LineHostMirror(address=address, batch=True, max_delay=0.2)
+            print("Line:", "batch", "delayed", file=hbuf)
+            hbuf.send_warning(UserWarning("An urgent warning."), urgent=True)
+            assert len(hreader.read()) == 1
+            time.sleep(1.0)
+            messages = hreader.read()
+            self.show_messages(log, messages)
+            assert len(messages) == 2
+            assert isinstance(messages[0], GroupedMessage)
+            assert messages[1] == "Line: batch delayed"
+            hbuf.close()
+
+    def test_host_overflow(self, temp_server: None) -> None:
+        """Test the overflow policies of host.LineHostMirror."""
+        log = logging.getLogger("test_host")
+        address = "http://localhost:5000/sync-stream"
+        verify_online(address)
+        log.info("Successfully connect to the remote server.")
+
+        with LineHostReader(address) as hreader:
+            for overflow, expected in (
+                ("drop-newest", ("line0", "line1", "line2")),
+                ("drop-oldest", ("line7", "line8", "line9")),
+                ("sample", ("line5", "line7", "line9")),
+            ):
+                assert hreader.clear()
+                hbuf = LineHostMirror(
+                    address=address,
+                    max_lines=100,
+                    max_delay=10.0,
+                    overflow=overflow,
+                    overflow_maxlen=3,
+                    sample_every=2,
+                )
+                assert hbuf.batch
+                for i in range(10):
+                    print("line{0:d}".format(i), file=hbuf)
+                assert hbuf.n_dropped == 7 and hbuf.n_dropped_bytes == 6 * 7
+
+                # The queue is sent by the background flusher.
+                hbuf.flush()
+                for _ in range(50):
+                    if len(hreader.read()) >= 3:
+                        break
+                    time.sleep(0.1)
+                assert hreader.read() == expected
+                hbuf.close()
+
+    def test_host_batch_post(self, temp_server: None) -> None:
+        """Test posting a batch of messages to host.LineHostBuffer."""
+        log = logging.getLogger("test_host")
+        address = "http://localhost:5000/sync-stream"
+        verify_online(address)
+        log.info("Successfully connect to the remote server.")
+
+        batch = [
+            {"type": "str", "data": {"value": "line1\nline2\n"}},
+            {
+                "type": "warning",
+                "data": GroupedMessage(UserWarning("A batch warning.")).serialize(),
+            },
+            {"type": "str", "data": {"value": "line3"}},
+            {"type": "close"},
+        ]
+        with LineHostReader(address) as hreader:
+            assert hreader.clear()
+            with webtools.SafePoolManager(
+                timeout=urllib3.util.Timeout(total=2.0)
+            ) as _http:
+                with _http.request(
+                    method="post",
+                    url=address,
+                    headers=hreader.headers_post,
+                    body=json.dumps(batch).encode(),
+                    preload_content=False,
+                ) as req:
+                    assert req.status == 201
+                    assert json.load(req)["count"] == 4
+
+                # An invalid batch is rejected as a whole.
+                with _http.request(
+                    method="post",
+                    url=address,
+                    headers=hreader.headers_post,
+                    body=json.dumps([{"type": "str"}, {"type": "none"}]).encode(),
+                    preload_content=False,
+                ) as req:
+                    assert req.status >= 400
+
+                # Malformed data after a valid item does not write the valid item.
+                for invalid in (
+                    {"type": "error", "data": {"type": "error"}},
+                    {"type": "dropped", "data": {"lines": "many"}},
+                ):
+                    with _http.request(
+                        method="post",
+                        url=address,
+                        headers=hreader.headers_post,
+                        body=json.dumps(
+                            [{"type": "str", "data": {"value": "line4\n"}}, invalid]
+                        ).encode(),
+                        preload_content=False,
+                    ) as req:
+                        assert req.status >= 400
+
+            messages = hreader.read()
+            self.show_messages(log, messages)
+            assert len(messages) == 4
+            assert messages[0] == "line1" and messages[1] == "line2"
+            assert isinstance(messages[2], GroupedMessage)
+            assert messages[3] == "line3"
+
+    def test_host_state_cache(self, temp_server: None) -> None:
+        """Test the states cached by host.LineHostMirror from the POST responses."""
+        log = logging.getLogger("test_host")
+        address = "http://localhost:5000/sync-stream"
+        verify_online(address)
+        log.info("Successfully connect to the remote server.")
+
+        with LineHostReader(address) as hreader:
+            assert hreader.clear()
+            hbuf = LineHostMirror(address=address, state_ttl=60.0)
+            hbuf.write("line1\n")
+            assert hreader.stop_all_mirrors()
+
+            # The cached state is still valid, so the stop signal is received by the
+            # response of this write.
+            hbuf.write("line2\n")
+            with pytest.raises(StopIteration):
+                hbuf.write("line3\n")
+            with pytest.raises(StopIteration):
+                hbuf.check_states(force=True)
+
+            assert hreader.reset_states()
+            hbuf.check_states(force=True)
+            hbuf.write("line3\n")
+            messages = hreader.read()
+            self.show_messages(log, messages)
+            assert tuple(messages) == ("line1", "line2", "line3")
+            assert hreader.nbytes == 15 and hreader.maxbytes is None
+
+    def test_host_read_since(self, temp_server: None) -> None:
+        """Test the incremental reading of host.LineHostReader."""
+        log = logging.getLogger("test_host")
+        address = "http://localhost:5000/sync-stream"
+        verify_online(address)
+        log.info("Successfully connect to the remote server.")
+
+        with LineHostReader(address) as hreader:
+            assert hreader.clear()
+            _, start, _ = hreader.read_since(0)
+            hbuf = LineHostMirror(address=address)
+            hbuf.write("line1\nline2\nline3\n")
+
+            lines, seq, dropped = hreader.read_since(start)
+            assert lines == ("line1", "line2", "line3") and dropped == 0
+            assert seq == start + 3
+
+            # Long-polling without new records.
+            t_start = time.perf_counter()
+            assert hreader.read_since(seq, wait=0.3) == (tuple(), seq, 0)
+            assert time.perf_counter() - t_start >= 0.25
+
+            hbuf.write("line4\n")
+            lines, seq, dropped = hreader.read_since(seq, wait=0.3)
+            assert lines == ("line4",) and dropped == 0
+
+            # Follow the buffer from the beginning.
+            lines = tuple(itertools.islice(hreader.follow(since=start, wait=0.3), 4))
+            self.show_messages(log, lines)
+            assert lines == ("line1", "line2", "line3", "line4")
+
+            # A non-finite waiting time is rejected.
+            with webtools.SafePoolManager(
+                timeout=urllib3.util.Timeout(total=2.0)
+            ) as _http:
+                for wait in ("inf", "nan"):
+                    with _http.request(
+                        method="get",
+                        url="{0}?since={1}&wait={2}".format(address, seq, wait),
+                        headers=hreader.headers,
+                        preload_content=False,
+                    ) as req:
+                        assert req.status >= 400
+
     def test_host_process_stop(self, temp_server: None) -> None:
         """Test the host.LineHostBuffer.stop_all_mirrors() in the multi-process mode."""
         log = logging.getLogger("test_host")
@@ -15,7 +15,11 @@ Description
 Test scripts of the module `mproc`.
 """
 
+import os
 import sys
+import queue
+import contextlib
+import asyncio
 import time
 import warnings
 import threading
@@ -29,8 +33,11 @@ try:
 except ImportError:
     from collections.abc import Sequence
 
+import pytest
+
 from syncstream import LineBuffer, LineProcBuffer, LineProcMirror
-from syncstream.base import GroupedMessage
+from syncstream.base import GroupedMessage, LineSplitter
+from syncstream.mproc import _encode_message, _decode_message, _ShmChannel
 
 
 def worker_writter() -> None:
@@ -106,6 +113,27 @@ def worker_process_lite(buffer: LineProcMirror) -> None:
             print("Line:", "buffer", "new", i, end="\n")
 
 
+def worker_process_tiny(buffer: LineProcMirror) -> None:
+    """The worker for the process-mode testing (tiny writes).
+
+    The process writes many tiny lines, each line is sent as one message.
+    """
+    with buffer:
+        for i in range(2000):
+            buffer.write("{0}\n".format(i))
+            if i % 100 == 0:
+                time.sleep(0.001)
+
+
+def worker_process_crash(buffer: LineProcMirror) -> None:
+    """The worker for the process-mode testing (crash).
+
+    The process writes one line, and exits without closing the mirror.
+    """
+    buffer.write("Line: buffer crash\n")
+    os._exit(1)
+
+
 def worker_process_stop(buffer: LineProcMirror) -> None:
     """The worker for the process-mode testing (stop).
 
@@ -175,6 +203,492 @@ class TestMProc:
 
         self.show_messages(log, lines)
 
+    def test_mproc_read_since(self) -> None:
+        """Test the `read_since()` functionalities of mproc.LineBuffer."""
+        log = logging.getLogger("test_mproc")
+        tbuf = LineBuffer(3)
+        assert tbuf.next_seq == 0
+
+        tbuf.write("line1\nline2\n")
+        lines, seq, dropped = tbuf.read_since(0)
+        assert lines == ("line1", "line2") and seq == 2 and dropped == 0
+
+        # The incomplete line is not fetched.
+        tbuf.write("line3\nline4\nline5\nline6")
+        lines, seq, dropped = tbuf.read_since(seq)
+        assert lines == ("line3", "line4", "line5") and seq == 5 and dropped == 0
+
+        # Evicted records are reported.
+        tbuf.write("\nline7\n")
+        lines, seq, dropped = tbuf.read_since(2)
+        assert lines == ("line5", "line6", "line7") and seq == 7 and dropped == 2
+        assert tbuf.read(2) == ("line6", "line7")
+
+        # Cleared records are reported.
+        tbuf.clear()
+        assert tbuf.read_since(seq) == (tuple(), 7, 0)
+        assert tbuf.read_since(6) == (tuple(), 7, 1)
+
+        self.show_messages(log, lines)
+
+    def test_mproc_ring_storage(self) -> None:
+        """Test reading mproc.LineBuffer after the ring storage wraps around."""
+        log = logging.getLogger("test_mproc")
+        tbuf = LineBuffer(4)
+        for i in range(3):
+            tbuf.write("".join("line{0}\n".format(3 * i + j) for j in range(3)))
+        tbuf.write("line9")
+
+        assert tuple(tbuf.storage) == ("line5", "line6", "line7", "line8")
+        assert tbuf.storage[0] == "line5" and tbuf.storage[-1] == "line8"
+        assert tbuf.read() == ("line6", "line7", "line8", "line9")
+        assert tbuf.read(2) == ("line8", "line9")
+        assert tbuf.read(10) == ("line6", "line7", "line8", "line9")
+        assert tbuf.read_since(4) == (("line5", "line6", "line7", "line8"), 9, 1)
+
+        # Extending with more lines than maxlen.
+        tbuf.write("\n" + "".join("line{0}\n".format(10 + i) for i in range(6)))
+        lines = tbuf.read()
+        self.show_messages(log, lines)
+        assert lines == ("line12", "line13", "line14", "line15")
+        assert tbuf.next_seq == 16
+
+    def test_mproc_ring_storage_threads(self) -> None:
+        """Test reading mproc.LineBuffer while another thread writes and clears it."""
+        tbuf = LineBuffer(50, maxbytes=400)
+        is_done = threading.Event()
+        errors = list()
+
+        # Like the receiver of LineProcBuffer, the storage is modified directly.
+        def writer() -> None:
+            idx = 0
+            while not is_done.is_set():
+                tbuf.storage.append("line{0}{1}".format(idx, "x" * (idx % 13)))
+                idx += 1
+                if idx % 97 == 0:
+                    tbuf.storage.clear()
+
+        def reader() -> None:
+            try:
+                while not is_done.is_set():
+                    lines = tbuf.storage.tail(40)
+                    assert all(line.startswith("line") for line in lines)
+                    tbuf.read_since(0)
+            except Exception as err:
+                errors.append(err)
+
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            thds = [threading.Thread(target=writer), threading.Thread(target=reader)]
+            for thd in thds:
+                thd.start()
+            time.sleep(1.0)
+            is_done.set()
+            for thd in thds:
+                thd.join()
+        finally:
+            sys.setswitchinterval(switch_interval)
+        assert not errors
+
+    def test_mproc_maxbytes(self) -> None:
+        """Test the byte budget of mproc.LineBuffer."""
+        log = logging.getLogger("test_mproc")
+        tbuf = LineBuffer(100, maxbytes=16)
+        assert tbuf.maxbytes == 16 and tbuf.nbytes == 0
+
+        tbuf.write("line1\nline2\nline3\nline4\n")
+        assert tbuf.read() == ("line2", "line3", "line4") and tbuf.nbytes == 15
+        assert tbuf.read_since(0) == (("line2", "line3", "line4"), 4, 1)
+
+        # Non-ASCII lines are measured by UTF-8.
+        tbuf.write("\u00e9\u00e9\u00e9\n")
+        assert tbuf.read() == ("line3", "line4", "\u00e9\u00e9\u00e9")
+        assert tbuf.nbytes == 16
+
+        # An oversized line is kept alone, and then evicted by later lines.
+        tbuf.write("{0}\n".format("x" * 30))
+        assert tbuf.read() == ("x" * 30,) and tbuf.nbytes == 30
+        tbuf.write("line5\n")
+        tbuf.write("line6\n")
+        lines = tbuf.read()
+        self.show_messages(log, lines)
+        assert lines == ("line5", "line6") and tbuf.nbytes == 10
+
+        # The ring storage keeps working after the byte eviction.
+        tbuf.write("".join("l{0:02d}\n".format(i) for i in range(10)))
+        assert tbuf.read() == tuple("l{0:02d}".format(i) for i in range(5, 10))
+        assert tbuf.read(2) == ("l08", "l09") and tbuf.nbytes == 15
+        tbuf.clear()
+        assert tbuf.nbytes == 0
+
+    def test_mproc_max_line_length(self) -> None:
+        """Test the maximal line length of mproc.LineBuffer and its mirror."""
+        log = logging.getLogger("test_mproc")
+        for per_thread in (False, True):
+            tbuf = LineBuffer(10, per_thread=per_thread, max_line_length=4)
+            tbuf.write("ab")
+            tbuf.write("cdefghij")
+            assert tbuf.read() == ("abcd", "efgh", "ij") and tbuf.n_overflows == 2
+            tbuf.write("k\nlmnopq\nrs")
+            lines = tbuf.read()
+            self.show_messages(log, lines)
+            assert lines == ("abcd", "efgh", "ijk", "lmno", "pq", "rs")
+            assert tbuf.n_overflows == 3
+
+        # The mirror sends the completed pieces of an overlong incomplete line.
+        pbuf = LineProcBuffer(10, transport="pipe", max_line_length=4)
+        mirror = pbuf.mirror
+        mirror.write("abcdefghij")
+        assert mirror.n_overflows == 2 and mirror.read() == "ij"
+        assert pbuf.receive()
+        assert pbuf.read() == ("abcd", "efgh")
+        mirror.write("\n")
+        assert pbuf.receive()
+        assert pbuf.read() == ("abcd", "efgh", "ij") and pbuf.n_overflows == 0
+        mirror.send_eof()
+        pbuf.wait()
+
+    def test_mproc_line_splitter(self) -> None:
+        """Test the separator policies used by mproc.LineBuffer."""
+        log = logging.getLogger("test_mproc")
+        splitter = LineSplitter("newline")
+        assert splitter.split("abc") == ["abc"]
+        assert splitter.split("a\r\nb\rc\x0bd\n") == ["a", "b\rc\x0bd", ""]
+        # The "\r" at the end is kept in the incomplete line.
+        assert splitter.split("abc\r") == ["abc\r"]
+        assert splitter.split("\ndef") == ["", "def"]
+        assert splitter.complete_line("abc\r", "") == "abc"
+
+        # The "\r" at the end completes the line at once.
+        splitter = LineSplitter("universal")
+        assert splitter.split("abc\r") == ["abc", ""]
+        assert splitter.split("\ndef") == ["def"]
+        assert splitter.split("\n") == ["", ""]
+        with pytest.raises(TypeError):
+            LineSplitter("unknown")  # type: ignore
+
+        for separator in ("universal", "newline"):
+            tbuf = LineBuffer(10, separator=separator)
+            assert tbuf.separator == separator
+            # The "\r\n" written by two calls is one line break.
+            tbuf.write("line1\r")
+            tbuf.write("\nline2\r\nline3")
+            tbuf.write("\x0bline4\n")
+            lines = tbuf.read()
+            self.show_messages(log, lines)
+            if separator == "universal":
+                assert lines == ("line1", "line2", "line3", "line4")
+            else:
+                assert lines == ("line1", "line2", "line3\x0bline4")
+
+            tbuf.write("line5\r")
+            if separator == "universal":
+                assert tbuf.read()[-1] == "line5"
+            else:
+                assert tbuf.read()[-1] == "line5\r"
+            tbuf.write("\n")
+            assert tbuf.read()[-1] == "line5"
+
+            # The "\r\n" written by two calls of a mirror.
+            pbuf = LineProcBuffer(10, transport="pipe", separator=separator)
+            mirror = pbuf.mirror
+            mirror.write("line1\r")
+            mirror.write("\nline2\r")
+            mirror.write("\n")
+            mirror.send_eof()
+            pbuf.wait()
+            assert pbuf.read() == ("line1", "line2")
+
+    def test_mproc_write_lines(self) -> None:
+        """Test the split lines sent from the mirror to mproc.LineProcBuffer."""
+        log = logging.getLogger("test_mproc")
+        tbuf = LineBuffer(10)
+        tbuf.write("line1")
+        assert tbuf.write_lines(["-continued", "line2"], "line3") == 2
+        assert tbuf.read() == ("line1-continued", "line2", "line3")
+        tbuf.write_lines([], "-more")
+        assert tbuf.read(1) == ("line3-more",)
+
+        pbuf = LineProcBuffer(10, transport="pipe")
+        mirror = pbuf.mirror
+        queue = getattr(mirror, "_LineProcMirror__queue")
+        mirror.write("line1\nline2\nline3")
+        # The mirror sends the lines which have been split.
+        message = queue.get()
+        assert _decode_message(message) == ("lines", (["line1", "line2"], "line3"))
+        queue.put(message)
+        assert pbuf.receive()
+        mirror.write("\nline4")
+        mirror.write("-end\n")
+        assert pbuf.receive() and pbuf.receive()
+        lines = pbuf.read()
+        self.show_messages(log, lines)
+        assert lines == ("line1", "line2", "line3", "line4-end")
+        mirror.send_eof()
+        pbuf.wait()
+
+    def test_mproc_wire_format(self) -> None:
+        """Test the compact frames sent from mproc.LineProcMirror."""
+        frame = _encode_message("str", "line1\nline2 \u00e9")
+        assert frame[:1] == b"s" and len(frame) == 5 + 14
+        assert _decode_message(frame) == ("str", "line1\nline2 \u00e9")
+        for lines, rest in (([], ""), ([], "rest"), (["a", ""], ""), (["a"], "b")):
+            frame = _encode_message("lines", (lines, rest))
+            assert _decode_message(frame) == ("lines", (lines, rest))
+        for dtype in ("close", "stop", "wakeup"):
+            assert _decode_message(_encode_message(dtype)) == (dtype, None)
+        assert _decode_message(_encode_message("close", 123)) == ("close", 123)
+        frame = _encode_message("dropped", (2, 10))
+        assert _decode_message(frame) == ("dropped", (2, 10))
+
+        # The error is reduced to its type and data.
+        dtype, message = _decode_message(
+            _encode_message("error", GroupedMessage(TypeError("A test error.")))
+        )
+        assert dtype == "error" and isinstance(message, GroupedMessage)
+        assert (
+            message.type == "error" and message.data[-1] == "TypeError: A test error."
+        )
+
+        frame = _encode_message("warning", GroupedMessage(["line1\nline2"]))
+        dtype, message = _decode_message(frame)
+        assert frame[:1] == b"p" and message.data == ("line1\nline2",)
+
+        # Unknown messages are pickled.
+        frame = _encode_message("close", {"pid": 1})
+        assert frame[:1] == b"p" and _decode_message(frame) == ("close", {"pid": 1})
+
+    def test_mproc_aggressive_coalesce(self) -> None:
+        """Test the coalesced line breaks of the aggressive mproc.LineProcMirror."""
+        log = logging.getLogger("test_mproc")
+        pbuf = LineProcBuffer(10, transport="pipe")
+        mirror = LineProcMirror(
+            aggressive=True, _queue=getattr(pbuf.mirror, "_LineProcMirror__queue")
+        )
+        queue = getattr(mirror, "_LineProcMirror__queue")
+        with contextlib.redirect_stdout(mirror):
+            for i in range(3):
+                print("line {0}".format(i))
+        assert mirror.n_coalesced == 3
+        for i in range(3):
+            assert _decode_message(queue.get()) == ("str", "line {0}\n".format(i))
+
+        # A write which is not a line break is not merged.
+        mirror.write("line3")
+        mirror.write("-continued\n")
+        mirror.write("line4")
+        mirror.flush()
+        assert mirror.n_coalesced == 3
+        messages = [queue.get() for _ in range(3)]
+        assert [_decode_message(message)[1] for message in messages] == [
+            "line3",
+            "-continued\n",
+            "line4",
+        ]
+        for message in messages:
+            queue.put(message)
+            assert pbuf.receive()
+        mirror.send_eof()
+        pbuf.wait()
+        lines = pbuf.read()
+        self.show_messages(log, lines)
+        assert lines == ("line3-continued", "line4")
+
+    def test_mproc_streaming(self) -> None:
+        """Test the streaming mode of mproc.LineProcMirror."""
+        log = logging.getLogger("test_mproc")
+        pbuf = LineProcBuffer(10, transport="pipe", stream_bytes=32, stream_delay=0.05)
+        mirror = pbuf.mirror
+        assert mirror.streaming
+        reader = getattr(
+            getattr(mirror, "_LineProcMirror__queue"), "_PipeQueue__reader"
+        )
+        for i in range(3):
+            mirror.write("line{0}\n".format(i))
+        assert not reader.poll()
+        # Sent by the byte threshold.
+        mirror.write("line3 is long enough to be sent\nline4")
+        assert reader.poll() and pbuf.receive() and not reader.poll()
+        assert pbuf.read() == (
+            "line0",
+            "line1",
+            "line2",
+            "line3 is long enough to be sent",
+            "line4",
+        )
+
+        # Sent by the delay.
+        mirror.write("-continued\n")
+        assert reader.poll(5.0) and pbuf.receive()
+        mirror.write("line5")
+        mirror.send_eof()
+        pbuf.wait()
+        lines = pbuf.read()
+        self.show_messages(log, lines)
+        assert lines[-3:] == (
+            "line3 is long enough to be sent",
+            "line4-continued",
+            "line5",
+        )
+
+    def test_mproc_terminal(self) -> None:
+        """Test the terminal semantics of mproc.LineBuffer and its mirror."""
+        log = logging.getLogger("test_mproc")
+        for per_thread in (False, True):
+            tbuf = LineBuffer(10, per_thread=per_thread, terminal=True)
+            tbuf.write("head\r\n")
+            for i in range(100):
+                tbuf.write("\rprogress: {0:3d}%".format(i))
+            assert tbuf.read() == ("head", "progress:  99%")
+            tbuf.write("\rdone")
+            tbuf.write("\n")
+            tbuf.write("abcdef")
+            tbuf.write("\r")
+            assert tbuf.read() == ("head", "doneress:  99%", "abcdef")
+            tbuf.write("XY\nline\x0bwith\x0cbreaks\n")
+            lines = tbuf.read()
+            self.show_messages(log, lines)
+            assert lines == (
+                "head",
+                "doneress:  99%",
+                "XYcdef",
+                "line\x0bwith\x0cbreaks",
+            )
+
+        # The mirror only sends the completed lines.
+        pbuf = LineProcBuffer(10, transport="pipe", terminal=True)
+        mirror = pbuf.mirror
+        reader = getattr(
+            getattr(mirror, "_LineProcMirror__queue"), "_PipeQueue__reader"
+        )
+        for i in range(100):
+            mirror.write("\r{0:3d}%".format(i))
+        assert not reader.poll()
+        mirror.new_line()
+        assert pbuf.receive() and not reader.poll()
+        assert pbuf.read() == (" 99%",)
+        mirror.send_eof()
+        pbuf.wait()
+
+    def test_mproc_per_thread(self) -> None:
+        """Test the per-thread incomplete lines of mproc.LineBuffer."""
+        log = logging.getLogger("test_mproc")
+        tbuf = LineBuffer(200, per_thread=True)
+        assert tbuf.per_thread
+        barrier = threading.Barrier(4)
+
+        def writer(idx: int) -> None:
+            barrier.wait()
+            for i in range(20):
+                tbuf.write("thd{0}".format(idx))
+                time.sleep(0.001)
+                tbuf.write(" line{0}\n".format(i))
+            tbuf.write("thd{0} pending".format(idx))
+            barrier.wait()
+
+        thds = [threading.Thread(target=writer, args=(idx,)) for idx in range(4)]
+        for thd in thds:
+            thd.start()
+        for thd in thds:
+            thd.join()
+
+        # The incomplete lines of the exited threads are stored as records.
+        assert len(tbuf.storage) == 84
+        assert not tbuf._LineBuffer__thread_states
+
+        lines = tbuf.read()
+        self.show_messages(log, lines[-4:])
+        assert len(lines) == 84
+        # Partial writes of different threads are never mixed.
+        for idx in range(4):
+            assert [
+                line for line in lines[:80] if line.startswith("thd{0} ".format(idx))
+            ] == ["thd{0} line{1}".format(idx, i) for i in range(20)]
+        assert sorted(lines[80:]) == ["thd{0} pending".format(i) for i in range(4)]
+        assert tbuf.read(2) == lines[-2:]
+
+        # Each thread completes its own line.
+        tbuf.new_line()
+        assert len(tbuf.read()) == 84
+        thd = threading.Thread(target=tbuf.new_line)
+        thd.start()
+        thd.join()
+        assert len(tbuf.read()) == 84
+
+    def test_mproc_per_thread_clear(self) -> None:
+        """Test clearing and reading mproc.LineBuffer while the threads are writing
+        their own incomplete lines."""
+        tbuf = LineBuffer(20, per_thread=True)
+        is_done = threading.Event()
+        errors = list()
+
+        def writer() -> None:
+            try:
+                while not is_done.is_set():
+                    tbuf.write("ab")
+                    tbuf.write("cd\n")
+            except Exception as err:
+                errors.append(err)
+
+        thds = [threading.Thread(target=writer) for _ in range(4)]
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            for thd in thds:
+                thd.start()
+            t_start = time.perf_counter()
+            while time.perf_counter() - t_start < 1.0:
+                tbuf.clear()
+                # An incomplete line is never seen half-updated.
+                assert set(tbuf.read()).issubset(("ab", "abcd"))
+        finally:
+            is_done.set()
+            for thd in thds:
+                thd.join()
+            sys.setswitchinterval(switch_interval)
+        assert not errors
+
+    def test_mproc_subscribe(self) -> None:
+        """Test the blocking and async subscriptions of mproc.LineBuffer."""
+        log = logging.getLogger("test_mproc")
+        tbuf = LineBuffer(4)
+        assert tbuf.wait_for_new(timeout=0.05) is False
+
+        def writer() -> None:
+            for i in range(5):
+                time.sleep(0.01)
+                tbuf.write("line{0}\n".format(i))
+
+        sub = tbuf.subscribe(timeout=1.0)
+        thd = threading.Thread(target=writer)
+        thd.start()
+        lines = [next(sub) for _ in range(5)]
+        thd.join()
+        self.show_messages(log, lines)
+        assert lines == ["line{0}".format(i) for i in range(5)]
+        assert sub.seq == 5 and sub.dropped == 0
+        assert tbuf.wait_for_new(timeout=0.05, seq=4) is True
+
+        # Slow subscribers skip the evicted lines.
+        sub_slow = tbuf.subscribe(since=0, timeout=0.05)
+        assert list(sub_slow) == ["line1", "line2", "line3", "line4"]
+        assert sub_slow.dropped == 1
+
+        async def consume() -> list:
+            sub_async = tbuf.subscribe(timeout=1.0)
+            loop = asyncio.get_running_loop()
+            loop.call_later(0.02, tbuf.write, "line5\nline6\n")
+            loop.call_later(0.05, sub_async.close)
+            return [line async for line in sub_async]
+
+        assert asyncio.run(consume()) == ["line5", "line6"]
+
+        # Closing the buffer stops the blocked subscribers.
+        sub = tbuf.subscribe()
+        threading.Timer(0.05, tbuf.close).start()
+        assert list(sub) == []
+
     def test_mproc_buffer(self) -> None:
         """Test the mproc.LineBuffer in the single thread mode."""
         log = logging.getLogger("test_mproc")
@@ -282,9 +796,10 @@ class TestMProc:
 
         # Write buffer.
         with multiprocessing.Pool(4) as pool:
-            pool.map_async(worker_process, tuple(pbuf.mirror for _ in range(4)))
+            res = pool.map_async(worker_process, tuple(pbuf.mirror for _ in range(4)))
             log.debug("The main stdout is not influenced.")
             pbuf.wait()
+            res.wait()
         log.debug("Confirm: The main stdout is not influenced.")
 
         # Show the buffer results.
@@ -292,6 +807,316 @@ class TestMProc:
         assert len(messages) == 20
         self.show_messages(log, messages)
 
+    def test_mproc_process_pipe(self) -> None:
+        """Test the mproc.LineProcBuffer with the pipe-based transport."""
+        log = logging.getLogger("test_mproc")
+        pbuf = LineProcBuffer(maxlen=20, transport="pipe")
+
+        # Write buffer.
+        procs = tuple(
+            multiprocessing.Process(target=worker_process, args=(pbuf.mirror,))
+            for _ in range(4)
+        )
+        for proc in procs:
+            proc.start()
+        pbuf.wait()
+        for proc in procs:
+            proc.join()
+
+        # Show the buffer results.
+        messages = pbuf.read()
+        assert len(messages) == 20
+        assert sum(1 for item in messages if isinstance(item, GroupedMessage)) >= 4
+        self.show_messages(log, messages)
+
+    @pytest.mark.skipif(
+        sys.version_info < (3, 8), reason="The shared memory requires python>=3.8."
+    )
+    def test_mproc_process_shm(self) -> None:
+        """Test the mproc.LineProcBuffer with the shared memory transport."""
+        log = logging.getLogger("test_mproc")
+        pbuf = LineProcBuffer(maxlen=20, transport="shm", ring_size=256)
+        assert pbuf.transport == "shm"
+
+        # Each mirror owns a ring. A message longer than the ring is split.
+        mirror, mirror_2 = pbuf.mirror, pbuf.mirror
+        assert mirror is not mirror_2
+        pbuf.start()
+        mirror.write("line1\n" + "x" * 1000 + "\nline3")
+        mirror.send_eof()
+        mirror_2.close()
+        assert pbuf.wait(timeout=10.0)
+        assert pbuf.read() == ("line1", "x" * 1000, "line3")
+
+        # The ring of the closed mirror is released. The mirror only ended by
+        # send_eof() could be reused, so its ring is kept. The ring of the base mirror
+        # owned by the buffer is also kept.
+        pbuf_2 = LineProcBuffer(maxlen=5, transport="shm", ring_size=256)
+        mirror, mirror_2 = pbuf_2.mirror, pbuf_2.mirror
+        queues = pbuf_2._LineProcBuffer__channel._ShmChannel__queues
+        mirror.write("line1\n")
+        mirror.send_eof()
+        mirror_2.close()
+        while pbuf_2.receive():
+            pass
+        assert len(queues) == 2
+        mirror.write("line2\n")
+        mirror.close()
+        while pbuf_2.read()[-1] != "line2" or len(queues) > 1:
+            pbuf_2.receive()
+        assert pbuf_2.read() == ("line1", "line2")
+
+        # A non-blocking writing to a full ring does not leave a partial item.
+        channel = _ShmChannel(256)
+        mqueue = channel.new_queue()
+        mqueue.put(b"a" * 100, block=False)
+        with pytest.raises(queue.Full):
+            mqueue.put(b"b" * 200, block=False)
+        assert mqueue.get(block=False) == b"a" * 100
+        mqueue.put(b"c" * 10, block=False)
+        assert mqueue.get(block=False) == b"c" * 10
+        with pytest.raises(queue.Empty):
+            mqueue.get(block=False)
+
+        # Write buffer.
+        procs = tuple(
+            multiprocessing.Process(target=worker_process, args=(pbuf.mirror,))
+            for _ in range(4)
+        )
+        for proc in procs:
+            proc.start()
+        pbuf.wait()
+        for proc in procs:
+            proc.join()
+
+        # Show the buffer results.
+        messages = pbuf.read()
+        assert len(messages) == 20
+        assert sum(1 for item in messages if isinstance(item, GroupedMessage)) >= 4
+        self.show_messages(log, messages)
+
+    @pytest.mark.skipif(
+        sys.version_info < (3, 8), reason="The shared memory requires python>=3.8."
+    )
+    def test_mproc_process_shm_stress(self) -> None:
+        """Test the wake-up of the shared memory transport with many tiny writes."""
+        pbuf = LineProcBuffer(maxlen=10, transport="shm", ring_size=256)
+        procs = tuple(
+            multiprocessing.Process(target=worker_process_tiny, args=(pbuf.mirror,))
+            for _ in range(4)
+        )
+        for proc in procs:
+            proc.start()
+        # A lost wake-up would block the receiver until the timeout.
+        assert pbuf.wait(timeout=60.0)
+        for proc in procs:
+            proc.join()
+        assert pbuf.next_seq == 8000
+        assert all(int(line) >= 1990 for line in pbuf.read())
+        assert len(pbuf._LineProcBuffer__channel._ShmChannel__queues) == 1
+
+    def test_mproc_process_receiver(self) -> None:
+        """Test the background receiver of mproc.LineProcBuffer."""
+        log = logging.getLogger("test_mproc")
+        pbuf = LineProcBuffer(maxlen=20, transport="pipe")
+        mirror = pbuf.mirror
+
+        # The receiver could be stopped, and the rest messages are kept.
+        pbuf.start()
+        assert pbuf.receiving
+        mirror.write("line1\n")
+        assert pbuf.stop(timeout=5.0) and not pbuf.receiving
+        mirror.write("line2\n")
+        assert pbuf.receive_batch() and pbuf.read() == ("line1", "line2")
+
+        # Write buffer.
+        procs = tuple(
+            multiprocessing.Process(target=worker_process_lite, args=(pbuf.mirror,))
+            for _ in range(4)
+        )
+        pbuf.start(max_items=4)
+        for proc in procs:
+            proc.start()
+        mirror.send_eof()
+        assert pbuf.wait(timeout=30.0) and not pbuf.receiving
+        for proc in procs:
+            proc.join()
+        assert pbuf.wait(timeout=0.0)
+
+        # Show the buffer results.
+        messages = pbuf.read()
+        assert len(messages) == 10
+        self.show_messages(log, messages)
+
+    def test_mproc_overflow(self) -> None:
+        """Test the overflow policies of mproc.LineProcMirror."""
+        log = logging.getLogger("test_mproc")
+        for overflow, expected in (
+            ("drop-newest", ("line0", "line1")),
+            ("drop-oldest", ("line0", "line1", "line7", "line8", "line9")),
+            ("sample", ("line0", "line1", "line4", "line6", "line8")),
+        ):
+            pbuf = LineProcBuffer(
+                maxlen=20,
+                transport="pipe",
+                overflow=overflow,
+                q_maxsize=2,
+                overflow_maxlen=3,
+                sample_every=2,
+            )
+            mirror = pbuf.mirror
+
+            # Writing does not wait for the full queue.
+            for i in range(10):
+                mirror.write("line{0:d}\n".format(i))
+            n_dropped = 10 - len(expected)
+            assert mirror.n_dropped == n_dropped and pbuf.n_dropped == 0
+
+            # The dropped lines are reported when the mirror is closed.
+            pbuf.start()
+            mirror.close()
+            assert pbuf.wait(timeout=5.0)
+            assert pbuf.read() == expected
+            assert pbuf.n_dropped == n_dropped
+            assert pbuf.n_dropped_bytes == mirror.n_dropped_bytes == 6 * n_dropped
+            log.info("%s", "{0}: dropped {1:d} lines.".format(overflow, n_dropped))
+
+        # The queue is bounded by default, so a slow buffer never stalls the writer.
+        pbuf = LineProcBuffer(maxlen=20, transport="pipe", overflow="drop-newest")
+        assert pbuf.q_maxsize > 0
+        mirror = pbuf.mirror
+
+        def writer() -> None:
+            for i in range(2000):
+                mirror.write("line{0:d}: {1}\n".format(i, "x" * 200))
+
+        thd = threading.Thread(target=writer, daemon=True)
+        thd.start()
+        thd.join(timeout=10.0)
+        assert not thd.is_alive()
+        assert mirror.n_dropped > 0
+        pbuf.start()
+        mirror.close()
+        assert pbuf.wait(timeout=5.0)
+        assert pbuf.n_dropped == mirror.n_dropped
+
+        with pytest.raises(TypeError):
+            LineProcMirror(overflow="none")
+
+    def test_mproc_process_watch(self) -> None:
+        """Test watching the sub-processes of mproc.LineProcBuffer."""
+        log = logging.getLogger("test_mproc")
+        for transport in ("manager", "pipe"):
+            pbuf = LineProcBuffer(maxlen=20, transport=transport)
+            procs = (
+                multiprocessing.Process(
+                    target=worker_process_lite, args=(pbuf.mirror,)
+                ),
+                multiprocessing.Process(
+                    target=worker_process_crash, args=(pbuf.mirror,)
+                ),
+            )
+            for proc in procs:
+                proc.start()
+            pbuf.watch(*procs)
+
+            # The crashed process is counted as closed.
+            assert pbuf.wait(timeout=30.0)
+            for proc in procs:
+                proc.join()
+            messages = pbuf.read()
+            self.show_messages(log, messages)
+            assert len(messages) == 4
+            errors = [item for item in messages if isinstance(item, GroupedMessage)]
+            assert len(errors) == 1 and errors[0].type == "error"
+            assert "exited (code: 1)" in errors[0].data[-1]
+
+        with pytest.raises(ValueError):
+            pbuf.watch(multiprocessing.Process(target=worker_process_lite))
+
+    def test_mproc_process_async(self) -> None:
+        """Test receiving the messages of mproc.LineProcBuffer in the event loop."""
+        log = logging.getLogger("test_mproc")
+
+        async def follow(pbuf: LineProcBuffer) -> list:
+            procs = (
+                multiprocessing.Process(
+                    target=worker_process_lite, args=(pbuf.mirror,)
+                ),
+                multiprocessing.Process(
+                    target=worker_process_crash, args=(pbuf.mirror,)
+                ),
+            )
+            for proc in procs:
+                proc.start()
+            pbuf.watch(*procs)
+            records = [record async for record in pbuf.follow_async()]
+            for proc in procs:
+                proc.join()
+            return records
+
+        for transport in ("pipe", "shm"):
+            if transport == "shm" and sys.version_info < (3, 8):
+                continue
+            pbuf = LineProcBuffer(maxlen=20, transport=transport)
+            records = asyncio.run(follow(pbuf))
+            self.show_messages(log, records)
+            assert len(records) == 4
+            assert sum(1 for item in records if isinstance(item, GroupedMessage)) == 1
+
+        # The waiting could be cancelled, and then continued.
+        pbuf = LineProcBuffer(maxlen=20, transport="pipe")
+        mirror = pbuf.mirror
+        mirror.write("line1\n")
+        with pytest.raises(asyncio.TimeoutError):
+            asyncio.run(asyncio.wait_for(pbuf.wait_async(), timeout=0.3))
+        # The cancelled receiving does not keep the lock.
+        config_lock = pbuf._LineProcBuffer__config_lock
+        assert config_lock.acquire(timeout=1.0)
+        config_lock.release()
+        mirror.close()
+        assert asyncio.run(pbuf.wait_async())
+        assert pbuf.read() == ("line1",)
+
+        # The loop is not blocked when the lock is held by another thread.
+        pbuf = LineProcBuffer(maxlen=20, transport="pipe")
+        mirror = pbuf.mirror
+        mirror.write("line1\n")
+        mirror.close()
+        config_lock = pbuf._LineProcBuffer__config_lock
+
+        async def wait_locked() -> bool:
+            task = asyncio.ensure_future(pbuf.wait_async())
+            await asyncio.sleep(0.2)
+            assert not task.done()
+            config_lock.release()
+            return await task
+
+        config_lock.acquire()
+        assert asyncio.run(wait_locked())
+        assert pbuf.read() == ("line1",)
+
+        # The manager transport could not be waited in the event loop.
+        pbuf = LineProcBuffer(maxlen=20, transport="manager")
+        with pytest.raises(TypeError):
+            asyncio.run(pbuf.wait_async())
+
+    def test_mproc_lazy_transport(self) -> None:
+        """Test the lazy creation of the transport of mproc.LineProcBuffer."""
+        pbuf = LineProcBuffer(maxlen=20, transport="manager")
+        pbuf.stop_all_mirrors()
+        pbuf.reset_states()
+        assert pbuf._LineProcBuffer__manager is None
+        assert pbuf._LineProcBuffer__mirror_ is None
+
+        # The manager server is started by the first mirror.
+        mirror = pbuf.mirror
+        assert pbuf._LineProcBuffer__manager is not None
+        with mirror:
+            print("line1")
+        pbuf.wait()
+        assert pbuf.read() == ("line1",)
+
     def test_mproc_thread_clear(self) -> None:
         """Test the mproc.LineBuffer.clear() in the multi-thread mode."""
         log = logging.getLogger("test_mproc")
@@ -339,10 +1164,16 @@ class TestMProc:
 
         # Write buffer.
         with multiprocessing.Pool(4) as pool:
-            pool.map_async(worker_process_lite, tuple(pbuf.mirror for _ in range(4)))
+            res = pool.map_async(
+                worker_process_lite, tuple(pbuf.mirror for _ in range(4))
+            )
             pbuf.wait()
-            pool.map_async(worker_process_lite, tuple(pbuf.mirror for _ in range(4)))
+            res.wait()
+            res = pool.map_async(
+                worker_process_lite, tuple(pbuf.mirror for _ in range(4))
+            )
             pbuf.wait()
+            res.wait()
 
         # Check message items, should be 16 now.
         messages = pbuf.read()
@@ -356,12 +1187,18 @@ class TestMProc:
 
         # Write buffer with a clear.
         with multiprocessing.Pool(4) as pool:
-            pool.map_async(worker_process_lite, tuple(pbuf.mirror for _ in range(4)))
+            res = pool.map_async(
+                worker_process_lite, tuple(pbuf.mirror for _ in range(4))
+            )
             pbuf.wait()
+            res.wait()
             pbuf.clear()
             log.debug("Clear all messages.")
-            pool.map_async(worker_process_lite, tuple(pbuf.mirror for _ in range(4)))
+            res = pool.map_async(
+                worker_process_lite, tuple(pbuf.mirror for _ in range(4))
+            )
             pbuf.wait()
+            res.wait()
 
         # Check message items, should be 8 now.
         messages = pbuf.read()
@@ -375,11 +1212,14 @@ class TestMProc:
         # Write buffer.
         log.debug("Start to write the buffer.")
         with multiprocessing.Pool(4) as pool:
-            pool.map_async(worker_process_stop, tuple(pbuf.mirror for _ in range(4)))
+            res = pool.map_async(
+                worker_process_stop, tuple(pbuf.mirror for _ in range(4))
+            )
             time.sleep(1.0)
             log.debug("Send the close signal to the sub-processes.")
             pbuf.stop_all_mirrors()
             pbuf.wait()
+            res.wait()
             pbuf.reset_states()
 
         # Check message items, should be 16 now.
@@ -388,6 +1228,23 @@ class TestMProc:
         # Show the buffer results.
         self.show_messages(log, messages)
 
+    def test_mproc_stop_check_every(self) -> None:
+        """Test the mproc.LineProcMirror.check_every for the stop signal."""
+        pbuf = LineProcBuffer(maxlen=20, transport="pipe")
+        mirror = pbuf.mirror
+        mirror.check_every = 3
+
+        pbuf.stop_all_mirrors()
+        mirror.write("line1\n")
+        mirror.write("line2\n")
+        with pytest.raises(StopIteration):
+            mirror.write("line3\n")
+
+        pbuf.n_mirrors = 0
+        pbuf.reset_states()
+        mirror = pbuf.mirror
+        mirror.write("line4\n")
+
     def test_mproc_process_force_stop(self) -> None:
         """Test the mproc.LineBuffer.force_stop() in the multi-process mode."""
         log = logging.getLogger("test_mproc")